@@ -0,0 +1,142 @@
+import argparse
+import hashlib
+import json
+import logging
+import os
+import time
+
+from file_lock import file_lock
+from matcher import normalize_text
+
+log = logging.getLogger(__name__)
+
+LEARNED = "learned"
+MANUAL = "manual"
+
+
+def question_key(question, options=()):
+    # Same question with the same set of choices, regardless of case, punctuation or option order
+    normalized_options = sorted(normalize_text(option) for option in options if option)
+    payload = normalize_text(question) + "\x1f" + "\x1e".join(normalized_options)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+class AnswerStore:
+    """Persistent question -> answer map learned from submitted applications.
+
+    The file is plain JSON and can be edited by hand; entries marked as
+    "manual" are never overwritten by learned answers. Several processes
+    may share one file: every change re-reads it under a file lock and
+    merges into what is there, so answers saved by another worker are kept."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.answers = {}
+        self.pending = {}
+        self.reload()
+        log.info(f"Loaded {len(self.answers)} stored answers from {path}")
+
+    def reload(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path) as f:
+                self.answers = json.load(f)
+        except (OSError, ValueError) as e:
+            log.warning(f"Ignoring unreadable answer store {self.path}: {e}")
+
+    def lookup(self, question, options=()):
+        if not question:
+            return None
+        entry = self.answers.get(question_key(question, options))
+        if entry is None:
+            return None
+        answer = entry["answer"]
+        if options and answer not in options:
+            return None
+        log.info(f"Stored answer for '{question}': {answer}")
+        return answer
+
+    def remember(self, question, options, answer):
+        # Held back until the application is submitted successfully
+        if question and answer:
+            self.pending[question_key(question, options)] = (question, list(options), answer)
+
+    def commit(self):
+        if not self.pending:
+            return
+        changed = 0
+        with file_lock(self.path):
+            self.reload()
+            for key, (question, options, answer) in self.pending.items():
+                entry = self.answers.get(key)
+                if entry and entry.get("source") == MANUAL:
+                    continue
+                if entry and entry["answer"] == answer:
+                    entry["uses"] = entry.get("uses", 0) + 1
+                else:
+                    self.answers[key] = {"question": question, "options": options, "answer": answer,
+                                         "source": LEARNED, "uses": 1}
+                self.answers[key]["updated_at"] = time.time()
+                changed += 1
+            if changed:
+                self.save()
+        self.pending = {}
+        if changed:
+            log.info(f"Stored {changed} answers from the submitted application")
+
+    def discard(self):
+        self.pending = {}
+
+    def set(self, question, answer, options=()):
+        with file_lock(self.path):
+            self.reload()
+            self.answers[question_key(question, options)] = {
+                "question": question, "options": list(options), "answer": answer,
+                "source": MANUAL, "uses": 0, "updated_at": time.time(),
+            }
+            self.save()
+
+    def delete(self, question, options=()):
+        with file_lock(self.path):
+            self.reload()
+            removed = self.answers.pop(question_key(question, options), None) is not None
+            if removed:
+                self.save()
+        return removed
+
+    def save(self):
+        # Callers hold the file lock and have merged the file's current contents
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.answers, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.WARNING)
+    parser = argparse.ArgumentParser(description="Inspect and edit stored screening-question answers")
+    parser.add_argument("--path", default="answers.json")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list")
+    set_parser = commands.add_parser("set", help="Pin an answer; manual answers are never overwritten")
+    set_parser.add_argument("question")
+    set_parser.add_argument("answer")
+    set_parser.add_argument("--option", action="append", default=[], help="Repeat for each choice of a select or radio group")
+    delete_parser = commands.add_parser("delete")
+    delete_parser.add_argument("question")
+    delete_parser.add_argument("--option", action="append", default=[])
+    args = parser.parse_args()
+
+    store = AnswerStore(args.path)
+    if args.command == "list":
+        for entry in sorted(store.answers.values(), key=lambda e: -e.get("uses", 0)):
+            options = f" [{' / '.join(entry['options'])}]" if entry["options"] else ""
+            print(f"{entry['uses']:5d}  {entry['source']:7s}  {entry['question']}{options} -> {entry['answer']}")
+    elif args.command == "set":
+        store.set(args.question, args.answer, args.option)
+    elif args.command == "delete":
+        if not store.delete(args.question, args.option):
+            print("No stored answer for that question")
@@ -0,0 +1,174 @@
+import argparse
+import json
+import logging
+import os
+import resource
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import mock_board
+from main import LinkedInLoginBot
+
+RESUME_DATA = {
+    "first name": "Alex",
+    "last name": "Doe",
+    "email": "alex.doe@example.com",
+    "mobile phone number": "5550100200",
+    "city": "New York",
+    "years of experience": "5",
+    "highest degree": "Bachelor's",
+    "willing to relocate": "Yes",
+    "about me": "Data scientist who likes well-measured benchmarks.",
+}
+
+JOB_FILTERS = {"easy_apply": True, "experience_level": "Entry level", "work_type": "Remote"}
+
+
+def process_tree_rss(pid):
+    # Resident memory in bytes of pid and all of its descendants (Linux /proc)
+    children = {}
+    rss = {}
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                fields = f.read().rsplit(")", 1)[1].split()
+        except OSError:
+            continue
+        children.setdefault(int(fields[1]), []).append(int(entry))
+        rss[int(entry)] = int(fields[21]) * page_size
+    total = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        total += rss.get(current, 0)
+        pending.extend(children.get(current, []))
+    return total
+
+
+class MemorySampler:
+    # Tracks the peak RSS of this process and the browser it drives
+    def __init__(self, interval=0.25):
+        self.interval = interval
+        self.peak = 0
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def run(self):
+        while not self.stopped.is_set():
+            if os.path.isdir("/proc"):
+                self.peak = max(self.peak, process_tree_rss(os.getpid()))
+            self.stopped.wait(self.interval)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stopped.set()
+        self.thread.join()
+        if not self.peak:
+            # Without /proc fall back to the largest single process seen
+            self.peak = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                            resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss) * 1024
+
+
+def run_benchmark(searches, max_pages=1, jitter=(0.0, 0.0), headless=True, **bot_kwargs):
+    server, base_url = mock_board.serve_in_thread()
+    workdir = tempfile.mkdtemp(prefix="linkedin-bench-")
+    try:
+        with MemorySampler() as memory:
+            start = time.perf_counter()
+            bot = LinkedInLoginBot(
+                "bench@example.com", "not-a-password", RESUME_DATA, JOB_FILTERS,
+                os.path.join(ROOT, "Resume__Anonymous_best.pdf"),
+                jitter=jitter, base_url=base_url, headless=headless,
+                session_dir=os.path.join(workdir, "sessions"),
+                ledger_path=os.path.join(workdir, "ledger.db"),
+                answers_path=os.path.join(workdir, "answers.json"),
+                trace_dir=os.path.join(workdir, "traces"),
+                results_dir=os.path.join(workdir, "results"),
+                **bot_kwargs,
+            )
+            bot.harvester.max_pages = max_pages
+            try:
+                bot.start_linkedin()
+                for job_title, location in searches:
+                    bot.search_jobs(job_title, location)
+            finally:
+                bot.browser.quit()
+            elapsed = time.perf_counter() - start
+
+        summary = bot.tracer.summary()
+        bot.tracer.close()
+        if bot.recorder:
+            bot.recorder.close()
+        bot.results.close()
+        applications = bot.outcomes["applied"]
+        calls = summary["counters"].get("webdriver_calls", 0)
+        return {
+            "searches": len(searches),
+            "seconds": round(elapsed, 2),
+            "applications": applications,
+            "applications_per_minute": round(applications * 60 / elapsed, 2) if elapsed else 0.0,
+            "seconds_per_application": round(elapsed / applications, 2) if applications else None,
+            "webdriver_calls": calls,
+            "webdriver_calls_per_application": round(calls / applications, 1) if applications else None,
+            "peak_rss_mb": round(memory.peak / 2 ** 20, 1),
+            "outcomes": dict(bot.outcomes),
+            "seconds_sleeping": summary["seconds_sleeping"],
+            "seconds_waiting": summary["seconds_waiting"],
+            "seconds_in_webdriver": summary["seconds_in_webdriver"],
+        }
+    finally:
+        server.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the bot headless against the local mock Easy Apply site")
+    parser.add_argument("--search", action="append", default=[], metavar="TITLE@LOCATION",
+                        help="Search to run, repeatable (default: 'Data Science@United States')")
+    parser.add_argument("--max-pages", type=int, default=1, help="Result pages per search (25 cards each)")
+    parser.add_argument("--jitter", type=float, nargs=2, default=(0.0, 0.0), metavar=("LOW", "HIGH"))
+    parser.add_argument("--headed", action="store_true", help="Show the browser window")
+    parser.add_argument("--lean", action="store_true", help="Run in lean browser mode")
+    parser.add_argument("--compare-lean", action="store_true", help="Run the default and lean modes and compare them")
+    parser.add_argument("--recycle-after", type=int, default=None, help="Restart Chrome after this many applications")
+    parser.add_argument("--min-relevance", type=float, default=None, help="Drop jobs scoring below this (0-1)")
+    parser.add_argument("--prefetch-tabs", type=int, default=0, help="Job tabs to keep loading in the background")
+    parser.add_argument("--driver-backend", choices=["selenium", "cdp"], default="selenium",
+                        help="Drive Chrome through chromedriver or directly over CDP")
+    parser.add_argument("--record", metavar="DIR", default=None, help="Record the WebDriver session for recorder.py")
+    parser.add_argument("--json", action="store_true", help="Print the raw result as JSON")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, force=True)
+    searches = [tuple(search.split("@", 1)) for search in args.search] or [("Data Science", "United States")]
+    modes = {"default": False, "lean": True} if args.compare_lean else {"lean" if args.lean else "default": args.lean}
+    results = {
+        name: run_benchmark(searches, max_pages=args.max_pages, jitter=tuple(args.jitter), headless=not args.headed,
+                            lean=lean, recycle_after=args.recycle_after, prefetch_tabs=args.prefetch_tabs,
+                            min_relevance=args.min_relevance, record_dir=args.record,
+                            driver_backend=args.driver_backend)
+        for name, lean in modes.items()
+    }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'':<34} " + " ".join(f"{name:>16}" for name in results))
+    for key in next(iter(results.values())):
+        if key == "outcomes":
+            continue
+        print(f"{key:<34} " + " ".join(f"{str(result[key]):>16}" for result in results.values()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+
+from fuzzywuzzy import fuzz
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from matcher import ResumeMatcher
+
+WORDS = [
+    "first", "last", "name", "email", "phone", "mobile", "number", "country", "code", "city",
+    "state", "zip", "years", "experience", "degree", "field", "study", "skills", "current",
+    "job", "title", "company", "work", "authorization", "preferred", "type", "setting",
+    "salary", "expectation", "relocate", "linkedin", "github", "profile", "website",
+    "references", "python", "sql", "visa", "sponsorship", "notice", "period", "start", "date",
+]
+
+
+def legacy_best_match(resume_data, label):
+    # The original LinkedInLoginBot.get_best_match_value loop
+    if not label:
+        return None
+    best_match = None
+    best_ratio = 0
+    for key, value in resume_data.items():
+        ratio = fuzz.token_set_ratio(key.lower(), label.lower())
+        if ratio > best_ratio:
+            best_ratio = ratio
+            best_match = value
+    return best_match if best_ratio > 70 else None
+
+
+def build_profile(rng, size):
+    resume_data = {}
+    while len(resume_data) < size:
+        key = " ".join(rng.sample(WORDS, rng.randint(1, 4)))
+        resume_data[key] = f"value {len(resume_data)}"
+    return resume_data
+
+
+def build_labels(rng, resume_data, count):
+    keys = list(resume_data)
+    labels = []
+    for _ in range(count):
+        if rng.random() < 0.6:
+            label = rng.choice(keys).title() + rng.choice(["", "?", " *", " (required)"])
+        else:
+            label = " ".join(rng.sample(WORDS, rng.randint(2, 6))).capitalize() + "?"
+        labels.append(label)
+    return labels
+
+
+def timed(func, labels):
+    start = time.perf_counter()
+    results = [func(label) for label in labels]
+    return time.perf_counter() - start, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare ResumeMatcher with the linear fuzz scan")
+    parser.add_argument("--keys", type=int, default=200)
+    parser.add_argument("--labels", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=3, help="Passes over the same labels (exercises the LRU cache)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    rng = random.Random(args.seed)
+    resume_data = build_profile(rng, args.keys)
+    labels = build_labels(rng, resume_data, args.labels) * args.repeat
+
+    legacy_time, legacy_results = timed(lambda label: legacy_best_match(resume_data, label), labels)
+
+    start = time.perf_counter()
+    matcher = ResumeMatcher(resume_data)
+    build_time = time.perf_counter() - start
+    uncached = ResumeMatcher(resume_data, cache_size=0)
+    cold_time, cold_results = timed(uncached.best_match, labels[:args.labels])
+    indexed_time, indexed_results = timed(matcher.best_match, labels)
+
+    mismatches = sum(1 for a, b in zip(legacy_results, indexed_results) if a != b)
+    mismatches += sum(1 for a, b in zip(legacy_results, cold_results) if a != b)
+
+    print(f"keys={args.keys} labels={len(labels)} mismatches={mismatches}")
+    print(f"linear scan:         {legacy_time * 1000:9.1f} ms ({legacy_time / len(labels) * 1e6:8.1f} us/label)")
+    print(f"matcher build:       {build_time * 1000:9.1f} ms")
+    print(f"matcher (no cache):  {cold_time * 1000:9.1f} ms ({cold_time / args.labels * 1e6:8.1f} us/label)")
+    print(f"matcher (LRU):       {indexed_time * 1000:9.1f} ms ({indexed_time / len(labels) * 1e6:8.1f} us/label)")
+    print(f"cache: {matcher.cache_info()}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
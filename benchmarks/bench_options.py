@@ -0,0 +1,74 @@
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+
+from fuzzywuzzy import fuzz
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from option_ranker import OptionRanker
+
+SYLLABLES = ["al", "an", "ar", "ba", "bo", "ca", "da", "el", "fi", "ga", "gu", "in", "ja", "ka", "la",
+             "ma", "na", "ni", "or", "pa", "ra", "ri", "sa", "ta", "to", "ur", "va", "ya", "ze"]
+
+
+def legacy_best_index(options, value):
+    # The original max(options, key=fuzz.ratio(...)) scan
+    return max(range(len(options)), key=lambda i: fuzz.ratio(options[i].lower(), value.lower()))
+
+
+def build_options(rng, size):
+    # Dropdown entries shaped like LinkedIn's phone country code list
+    options = set()
+    while len(options) < size:
+        name = "".join(rng.sample(SYLLABLES, rng.randint(2, 4))).capitalize()
+        if rng.random() < 0.3:
+            name += " " + "".join(rng.sample(SYLLABLES, 2)).capitalize()
+        options.add(f"{name} (+{rng.randint(1, 999)})")
+    return ["Select an option"] + sorted(options)
+
+
+def timed(func, values):
+    start = time.perf_counter()
+    results = [func(value) for value in values]
+    return time.perf_counter() - start, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare OptionRanker with the per-option fuzz.ratio scan")
+    parser.add_argument("--options", type=int, default=250)
+    parser.add_argument("--values", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=5, help="Passes over the same values (exercises the cache)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    rng = random.Random(args.seed)
+    options = build_options(rng, args.options)
+    values = [rng.choice(options[1:]).split(" (")[0] for _ in range(args.values)] * args.repeat
+
+    legacy_time, legacy_results = timed(lambda value: legacy_best_index(options, value), values)
+    cold = OptionRanker(cache_size=0)
+    cold_time, cold_results = timed(lambda value: cold.best_index(value, options), values[:args.values])
+    ranker = OptionRanker()
+    cached_time, cached_results = timed(lambda value: ranker.best_index(value, options), values)
+
+    # Backends may round differently, so only count picks that score worse under fuzzywuzzy
+    worse = sum(
+        1 for value, a, b in zip(values, legacy_results, cached_results)
+        if fuzz.ratio(options[b].lower(), value.lower()) < fuzz.ratio(options[a].lower(), value.lower())
+    )
+
+    print(f"options={len(options)} values={len(values)} backend={ranker.backend} worse_picks={worse}")
+    print(f"per-option scan:     {legacy_time * 1000:9.1f} ms ({legacy_time / len(values) * 1e3:8.2f} ms/list)")
+    print(f"ranker (no cache):   {cold_time * 1000:9.1f} ms ({cold_time / args.values * 1e3:8.2f} ms/list)")
+    print(f"ranker (cached):     {cached_time * 1000:9.1f} ms ({cached_time / len(values) * 1e3:8.2f} ms/list)")
+    print(f"cache: {ranker.cache_info()}")
+    return 1 if worse else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,841 @@
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+
+from selenium.common.exceptions import (
+    ElementClickInterceptedException, ElementNotInteractableException, JavascriptException,
+    NoSuchElementException, NoSuchWindowException, StaleElementReferenceException, TimeoutException,
+    WebDriverException,
+)
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
+
+from driver_cache import CHROME_BINARIES, MAC_CHROME
+
+try:
+    import websockets
+except ImportError:
+    websockets = None
+
+log = logging.getLogger(__name__)
+
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+# Per-document element registry. Elements returned to Python are replaced by
+# WebDriver element references; references from another document, or to
+# nodes that were removed, fail as stale.
+REGISTRY_SCRIPT = """
+window.__cdpElements || (window.__cdpElements = (() => {
+    const KEY = '%s';
+    const token = Math.random().toString(36).slice(2);
+    const byId = new Map();
+    const ids = new WeakMap();
+    let next = 0;
+    const encode = (value, stack = new Set()) => {
+        if (value instanceof Element) {
+            let id = ids.get(value);
+            if (!id) {
+                id = token + '.' + (++next);
+                ids.set(value, id);
+                byId.set(id, value);
+            }
+            return { [KEY]: id };
+        }
+        if (value === undefined || value === null || typeof value === 'function') return null;
+        if (value instanceof NodeList || value instanceof HTMLCollection) value = Array.from(value);
+        if (typeof value !== 'object') return value;
+        if (stack.has(value)) return null;
+        stack.add(value);
+        const out = Array.isArray(value) ? value.map(item => encode(item, stack)) : {};
+        if (!Array.isArray(value)) for (const key of Object.keys(value)) out[key] = encode(value[key], stack);
+        stack.delete(value);
+        return out;
+    };
+    const decode = value => {
+        if (Array.isArray(value)) return value.map(decode);
+        if (value && typeof value === 'object') {
+            if (KEY in value) {
+                const el = byId.get(value[KEY]);
+                if (!el || !el.isConnected) throw new Error('stale element reference: ' + value[KEY]);
+                return el;
+            }
+            const out = {};
+            for (const key of Object.keys(value)) out[key] = decode(value[key]);
+            return out;
+        }
+        return value;
+    };
+    return { encode, decode };
+})())
+""" % ELEMENT_KEY
+
+CALL_TEMPLATE = """(() => {
+const registry = %s;
+const args = registry.decode(%s);
+const result = (function () {
+%s
+}).apply(null, args);
+// Like chromedriver, a returned promise is awaited
+return Promise.resolve(result).then(value => registry.encode(value));
+})()"""
+
+ELEMENT_TEMPLATE = "(() => { const registry = %s; return registry.decode(%s); })()"
+
+ASYNC_CALL_TEMPLATE = """(() => {
+const registry = %s;
+const args = registry.decode(%s);
+return new Promise((resolve, reject) => {
+    args.push(resolve);
+    try {
+        (function () {
+%s
+        }).apply(null, args);
+    } catch (e) {
+        reject(e);
+    }
+}).then(result => registry.encode(result));
+})()"""
+
+FIND_SCRIPT = """
+const [using, value, root] = arguments;
+const scope = root || document;
+if (using === 'css selector') return Array.from(scope.querySelectorAll(value));
+if (using === 'xpath') {
+    const snapshot = document.evaluate(value, scope, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    const found = [];
+    for (let i = 0; i < snapshot.snapshotLength; i++) found.push(snapshot.snapshotItem(i));
+    return found.filter(node => node instanceof Element);
+}
+if (using === 'link text' || using === 'partial link text') {
+    return Array.from(scope.querySelectorAll('a')).filter(a => {
+        const text = (a.innerText || '').trim();
+        return using === 'link text' ? text === value : text.includes(value);
+    });
+}
+throw new Error('invalid selector: unsupported strategy ' + using);
+"""
+
+# Scrolls the element into view and returns the point a click would land
+# on, or what covers the element there.
+CLICK_POINT_SCRIPT = """
+const el = arguments[0];
+el.scrollIntoView({ block: 'center', inline: 'center' });
+const rect = el.getBoundingClientRect();
+if (!rect.width || !rect.height) return { error: 'not interactable' };
+const x = rect.left + rect.width / 2;
+const y = rect.top + rect.height / 2;
+const hit = document.elementFromPoint(x, y);
+if (hit && hit !== el && !el.contains(hit) && !hit.contains(el)) {
+    return { error: 'intercepted', by: hit.outerHTML.slice(0, 200) };
+}
+return { x, y };
+"""
+
+CLEAR_SCRIPT = """
+const el = arguments[0];
+el.focus();
+el.value = '';
+el.dispatchEvent(new Event('input', { bubbles: true }));
+el.dispatchEvent(new Event('change', { bubbles: true }));
+"""
+
+FOCUS_SCRIPT = """
+const el = arguments[0];
+el.focus();
+if (typeof el.selectionStart === 'number' && typeof el.value === 'string') {
+    el.selectionStart = el.selectionEnd = el.value.length;
+}
+return el.tagName.toLowerCase() === 'input' && (el.type || '').toLowerCase() === 'file';
+"""
+
+# Resolves once the DOM changes, or with false after timeout milliseconds
+MUTATION_SCRIPT = """
+new Promise(resolve => {
+    const observer = new MutationObserver(() => { observer.disconnect(); resolve(true); });
+    observer.observe(document, { childList: true, subtree: true, attributes: true, characterData: true });
+    setTimeout(() => { observer.disconnect(); resolve(false); }, %d);
+})
+"""
+
+# Resolves once the DOM has been quiet for quiet milliseconds
+DOM_SETTLED_SCRIPT = """
+new Promise(resolve => {
+    let timer = null;
+    const settle = () => {
+        clearTimeout(timer);
+        timer = setTimeout(() => { observer.disconnect(); resolve(true); }, %d);
+    };
+    const observer = new MutationObserver(settle);
+    observer.observe(document, { childList: true, subtree: true, attributes: true, characterData: true });
+    const start = () => document.readyState === 'loading'
+        ? document.addEventListener('DOMContentLoaded', settle, { once: true })
+        : settle();
+    start();
+    setTimeout(() => { observer.disconnect(); resolve(false); }, %d);
+})
+"""
+
+ELEMENT_SCRIPTS = {
+    Command.GET_ELEMENT_TEXT: "return arguments[0].innerText;",
+    Command.GET_ELEMENT_TAG_NAME: "return arguments[0].tagName.toLowerCase();",
+    Command.GET_ELEMENT_ATTRIBUTE: "return arguments[0].getAttribute(arguments[1]);",
+    Command.GET_ELEMENT_PROPERTY: "return arguments[0][arguments[1]];",
+    Command.IS_ELEMENT_ENABLED: "return !arguments[0].disabled;",
+    Command.IS_ELEMENT_SELECTED: "return !!(arguments[0].checked || arguments[0].selected);",
+    Command.GET_ELEMENT_RECT: """
+const r = arguments[0].getBoundingClientRect();
+return { x: r.x + window.scrollX, y: r.y + window.scrollY, width: r.width, height: r.height };
+""",
+    Command.CLEAR_ELEMENT: CLEAR_SCRIPT,
+}
+
+# WebDriver key codepoints sent as key events instead of inserted text
+SPECIAL_KEYS = {
+    "\ue003": ("Backspace", 8, ""),
+    "\ue004": ("Tab", 9, ""),
+    "\ue006": ("Enter", 13, "\r"),
+    "\ue007": ("Enter", 13, "\r"),
+    "\ue00c": ("Escape", 27, ""),
+    "\ue013": ("ArrowUp", 38, ""),
+    "\ue015": ("ArrowDown", 40, ""),
+    "\ue017": ("Delete", 46, ""),
+}
+KEY_RUNS = re.compile("([\ue000-\ue05d])")
+
+# Commands that work while no tab is focused, e.g. right after closing one
+WINDOWLESS_COMMANDS = {Command.QUIT, Command.SWITCH_TO_WINDOW, Command.W3C_GET_WINDOW_HANDLES, Command.NEW_WINDOW}
+
+# Requests that stay open by design and must not keep the network busy
+LONG_LIVED_REQUESTS = {"EventSource", "WebSocket"}
+
+
+def chrome_binary():
+    candidates = [MAC_CHROME] if sys.platform == "darwin" else []
+    candidates += [path for path in (shutil.which(name) for name in CHROME_BINARIES) if path]
+    for binary in candidates:
+        if os.path.exists(binary):
+            return binary
+    raise WebDriverException("Chrome was not found; set binary_location on the options")
+
+
+def script_error(details):
+    exception = details.get("exception") or {}
+    message = exception.get("description") or details.get("text") or "script error"
+    if "stale element reference" in message:
+        return StaleElementReferenceException(message)
+    return JavascriptException(message)
+
+
+class CDPConnection:
+    """One DevTools websocket shared by a browser and all of its tabs.
+
+    Commands are tagged with an id and answered through futures, so any
+    number can be in flight at once; tabs are attached as flattened
+    sessions and their events are routed by session id."""
+
+    def __init__(self, websocket) -> None:
+        self.websocket = websocket
+        self.ids = itertools.count(1)
+        self.pending = {}
+        self.listeners = defaultdict(list)
+        # One writer keeps commands in the order they were queued
+        self.outgoing = asyncio.Queue()
+        self.writer = asyncio.create_task(self.write())
+        self.reader = asyncio.create_task(self.read())
+
+    @classmethod
+    async def connect(cls, url):
+        if websockets is None:
+            raise RuntimeError("The CDP backend needs websockets: pip install websockets")
+        return cls(await websockets.connect(url, max_size=None, ping_interval=None))
+
+    async def read(self):
+        try:
+            async for message in self.websocket:
+                data = json.loads(message)
+                if "id" in data:
+                    future = self.pending.pop(data["id"], None)
+                    if future and not future.done():
+                        if "error" in data:
+                            future.set_exception(WebDriverException(f"{data['error'].get('message')} "
+                                                                    f"({data['error'].get('code')})"))
+                        else:
+                            future.set_result(data.get("result", {}))
+                    continue
+                for callback in list(self.listeners[(data.get("sessionId"), data.get("method"))]):
+                    callback(data.get("params", {}))
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            for future in self.pending.values():
+                if not future.done():
+                    future.set_exception(WebDriverException("DevTools connection closed"))
+            self.pending.clear()
+
+    async def write(self):
+        while True:
+            await self.websocket.send(await self.outgoing.get())
+
+    def send_nowait(self, method, params=None, session_id=None):
+        # Queues the command and returns the future of its result
+        message = {"id": next(self.ids), "method": method, "params": params or {}}
+        if session_id:
+            message["sessionId"] = session_id
+        future = asyncio.get_running_loop().create_future()
+        self.pending[message["id"]] = future
+        self.outgoing.put_nowait(json.dumps(message))
+        return future
+
+    async def send(self, method, params=None, session_id=None, timeout=30):
+        try:
+            return await asyncio.wait_for(self.send_nowait(method, params, session_id), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutException(f"{method} got no answer within {timeout}s") from None
+
+    async def batch(self, commands, session_id=None, timeout=30):
+        # Sends every command before awaiting any of them: one round trip instead of len(commands)
+        futures = [self.send_nowait(method, params, session_id) for method, params in commands]
+        try:
+            return await asyncio.wait_for(asyncio.gather(*futures), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutException(f"Batch of {len(commands)} commands got no answer within {timeout}s") from None
+
+    def on(self, method, callback, session_id=None):
+        self.listeners[(session_id, method)].append(callback)
+
+    def off(self, method, callback, session_id=None):
+        callbacks = self.listeners[(session_id, method)]
+        if callback in callbacks:
+            callbacks.remove(callback)
+
+    def expect(self, method, session_id=None, predicate=None):
+        # Future for the next matching event, listening from this moment on
+        future = asyncio.get_running_loop().create_future()
+
+        def callback(params):
+            if not future.done() and (predicate is None or predicate(params)):
+                future.set_result(params)
+
+        self.on(method, callback, session_id)
+        future.add_done_callback(lambda _: self.off(method, callback, session_id))
+        return future
+
+    async def wait_for_event(self, method, session_id=None, timeout=30, predicate=None):
+        try:
+            return await asyncio.wait_for(self.expect(method, session_id, predicate), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutException(f"No {method} event within {timeout}s") from None
+
+    async def close(self):
+        self.writer.cancel()
+        await self.websocket.close()
+        await self.reader
+
+
+class CDPTab:
+    """A page target attached to the browser connection.
+
+    Keeps track of in-flight requests from Network events, so waiting for
+    network idle needs no polling of the page."""
+
+    def __init__(self, connection: CDPConnection, target_id: str, session_id: str) -> None:
+        self.connection = connection
+        self.target_id = target_id
+        self.session_id = session_id
+        self.inflight = set()
+        self.last_network = time.monotonic()
+        self.network_changed = asyncio.Event()
+
+    async def enable(self):
+        for method in ("Network.requestWillBeSent", "Network.loadingFinished", "Network.loadingFailed"):
+            self.connection.on(method, self.track_request, self.session_id)
+        await self.batch([
+            ("Page.enable", {}),
+            ("Network.enable", {}),
+        ])
+
+    def track_request(self, params):
+        if "request" in params:
+            if params.get("type") not in LONG_LIVED_REQUESTS:
+                self.inflight.add(params["requestId"])
+        else:
+            self.inflight.discard(params["requestId"])
+        self.last_network = time.monotonic()
+        self.network_changed.set()
+
+    async def send(self, method, params=None, timeout=30):
+        return await self.connection.send(method, params, self.session_id, timeout)
+
+    async def batch(self, commands, timeout=30):
+        return await self.connection.batch(commands, self.session_id, timeout)
+
+    async def navigate(self, url, wait_for="Page.loadEventFired", timeout=60):
+        # Listening starts before navigating so a fast load is not missed
+        loaded = self.connection.expect(wait_for, self.session_id)
+        try:
+            result = await self.send("Page.navigate", {"url": url}, timeout)
+            if result.get("errorText"):
+                raise WebDriverException(f"Navigation to {url} failed: {result['errorText']}")
+            # Without a loaderId the navigation stayed within the document
+            if result.get("loaderId"):
+                await asyncio.wait_for(loaded, timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutException(f"{url} did not load within {timeout}s") from None
+        finally:
+            loaded.cancel()
+
+    async def evaluate(self, expression, await_promise=False, by_value=True, timeout=30):
+        result = await self.send("Runtime.evaluate", {
+            "expression": expression,
+            "returnByValue": by_value,
+            "awaitPromise": await_promise,
+            "userGesture": True,
+        }, timeout)
+        if "exceptionDetails" in result:
+            raise script_error(result["exceptionDetails"])
+        return result["result"].get("value") if by_value else result["result"]
+
+    async def call(self, script, args=(), is_async=False, timeout=30):
+        # Runs a WebDriver-style script body with arguments[] in one round trip
+        template = ASYNC_CALL_TEMPLATE if is_async else CALL_TEMPLATE
+        expression = template % (REGISTRY_SCRIPT, json.dumps(list(args)), script)
+        return await self.evaluate(expression, await_promise=True, timeout=timeout)
+
+    async def element_object(self, element_id):
+        # Remote object id of a registered element, for DOM.* commands
+        expression = ELEMENT_TEMPLATE % (REGISTRY_SCRIPT, json.dumps({ELEMENT_KEY: element_id}))
+        return (await self.evaluate(expression, by_value=False))["objectId"]
+
+    async def wait_for_change(self, timeout):
+        # True once the DOM mutates or the document is replaced
+        try:
+            return await self.evaluate(MUTATION_SCRIPT % int(timeout * 1000), await_promise=True,
+                                       timeout=timeout + 5)
+        except (JavascriptException, WebDriverException):
+            return True
+
+    async def dom_settled(self, quiet, timeout):
+        try:
+            return await self.evaluate(DOM_SETTLED_SCRIPT % (int(quiet * 1000), int(timeout * 1000)),
+                                       await_promise=True, timeout=timeout + 5)
+        except (JavascriptException, WebDriverException):
+            # Navigation replaced the document; let the caller check again
+            return False
+
+    async def network_idle(self, idle, timeout):
+        deadline = time.monotonic() + timeout
+        while True:
+            now = time.monotonic()
+            quiet_for = now - self.last_network
+            if not self.inflight and quiet_for >= idle:
+                return True
+            remaining = deadline - now
+            if remaining <= 0:
+                return False
+            self.network_changed.clear()
+            wait = remaining if self.inflight else min(remaining, idle - quiet_for)
+            try:
+                await asyncio.wait_for(self.network_changed.wait(), wait)
+            except asyncio.TimeoutError:
+                pass
+
+    def detach(self):
+        for method in ("Network.requestWillBeSent", "Network.loadingFinished", "Network.loadingFailed"):
+            self.connection.off(method, self.track_request, self.session_id)
+
+
+class CDPBrowser:
+    """Chrome started with a DevTools port and driven over one websocket.
+
+    Several sessions can share a browser: new_context() creates an isolated
+    browser context (own cookies and storage), much like a separate profile."""
+
+    def __init__(self, connection: CDPConnection, process=None, user_data_dir=None, temporary_dir=False) -> None:
+        self.connection = connection
+        self.process = process
+        self.user_data_dir = user_data_dir
+        self.temporary_dir = temporary_dir
+
+    @classmethod
+    async def launch(cls, arguments=(), binary=None, timeout=30):
+        arguments = list(arguments)
+        user_data_dir = next((arg.split("=", 1)[1] for arg in arguments if arg.startswith("--user-data-dir=")), None)
+        temporary_dir = user_data_dir is None
+        if temporary_dir:
+            user_data_dir = tempfile.mkdtemp(prefix="cdp-chrome-")
+            arguments.append(f"--user-data-dir={user_data_dir}")
+        port_file = os.path.join(user_data_dir, "DevToolsActivePort")
+        if os.path.exists(port_file):
+            os.remove(port_file)
+
+        command = [binary or chrome_binary(), "--remote-debugging-port=0", "--no-first-run",
+                   "--no-default-browser-check", *arguments, "about:blank"]
+        process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        deadline = time.monotonic() + timeout
+        # Chrome writes the port it picked and the browser endpoint once it listens
+        while not os.path.exists(port_file) or len(open(port_file).read().split()) < 2:
+            if process.poll() is not None:
+                raise WebDriverException(f"Chrome exited with code {process.returncode} during startup")
+            if time.monotonic() > deadline:
+                process.kill()
+                raise WebDriverException(f"Chrome did not open a DevTools port within {timeout}s")
+            await asyncio.sleep(0.05)
+        with open(port_file) as f:
+            port, path = f.read().split()[:2]
+        connection = await CDPConnection.connect(f"ws://127.0.0.1:{port}{path}")
+        log.info(f"Launched Chrome (pid {process.pid}) with DevTools on port {port}")
+        return cls(connection, process, user_data_dir, temporary_dir)
+
+    @classmethod
+    async def connect(cls, url):
+        # Attaches to an already running Chrome's browser endpoint
+        return cls(await CDPConnection.connect(url))
+
+    async def attach(self, target_id):
+        result = await self.connection.send("Target.attachToTarget", {"targetId": target_id, "flatten": True})
+        tab = CDPTab(self.connection, target_id, result["sessionId"])
+        await tab.enable()
+        return tab
+
+    async def first_tab(self):
+        targets = (await self.connection.send("Target.getTargets"))["targetInfos"]
+        page = next((target for target in targets if target["type"] == "page"), None)
+        return await self.attach(page["targetId"]) if page else await self.new_tab()
+
+    async def new_tab(self, url="about:blank", context_id=None):
+        params = {"url": url}
+        if context_id:
+            params["browserContextId"] = context_id
+        target_id = (await self.connection.send("Target.createTarget", params))["targetId"]
+        return await self.attach(target_id)
+
+    async def close_tab(self, tab):
+        tab.detach()
+        await self.connection.send("Target.closeTarget", {"targetId": tab.target_id})
+
+    async def new_context(self):
+        return (await self.connection.send("Target.createBrowserContext", {"disposeOnDetach": True}))["browserContextId"]
+
+    async def close_context(self, context_id):
+        await self.connection.send("Target.disposeBrowserContext", {"browserContextId": context_id})
+
+    async def close(self):
+        try:
+            if self.process:
+                await self.connection.send("Browser.close", timeout=10)
+        except WebDriverException:
+            pass
+        await self.connection.close()
+        if self.process:
+            try:
+                await asyncio.get_running_loop().run_in_executor(None, self.process.wait, 10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+        if self.temporary_dir:
+            shutil.rmtree(self.user_data_dir, ignore_errors=True)
+
+
+class EventLoopThread:
+    """The asyncio loop shared by every CDPWebDriver in the process.
+
+    Blocking driver calls from any number of bot threads are scheduled on
+    this one loop, so many sessions run concurrently in one process."""
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, name="cdp-loop", daemon=True)
+        self.thread.start()
+
+    def run(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+
+
+_loop_thread = None
+_loop_lock = threading.Lock()
+
+
+def shared_loop():
+    global _loop_thread
+    with _loop_lock:
+        if _loop_thread is None:
+            _loop_thread = EventLoopThread()
+        return _loop_thread
+
+
+class CDPWebDriver(RemoteWebDriver):
+    """Selenium WebDriver API answered over the Chrome DevTools protocol.
+
+    Every WebDriver command the bot uses is translated in execute() into
+    CDP calls: scripts and element lookups are one Runtime.evaluate each,
+    clicks and keystrokes are sent as batches of Input events, and there is
+    no chromedriver in between. WebElement, WebDriverWait, the tracer and
+    the recorder work unchanged because they all go through execute().
+
+    Pass browser to open the session in a new context of a shared
+    CDPBrowser instead of launching a Chrome of its own."""
+
+    def __init__(self, options, browser: CDPBrowser = None) -> None:
+        self.loop = shared_loop()
+        self.owns_browser = browser is None
+        self.cdp_browser = browser
+        self.chrome_arguments = list(options.arguments)
+        self.chrome_binary = getattr(options, "binary_location", None) or None
+        self.page_load_strategy = options.page_load_strategy
+        self.context_id = None
+        self.tabs = {}
+        self.tab = None
+        self.load_event = "Page.domContentEventFired" if options.page_load_strategy == "eager" else "Page.loadEventFired"
+        self.handlers = {
+            Command.GET: self.get_url,
+            Command.GET_CURRENT_URL: lambda params: self.tab.evaluate("location.href"),
+            Command.GET_TITLE: lambda params: self.tab.evaluate("document.title"),
+            Command.GET_PAGE_SOURCE: lambda params: self.tab.evaluate("document.documentElement.outerHTML"),
+            Command.W3C_EXECUTE_SCRIPT: lambda params: self.tab.call(params["script"], params["args"]),
+            Command.W3C_EXECUTE_SCRIPT_ASYNC: lambda params: self.tab.call(params["script"], params["args"], True),
+            Command.FIND_ELEMENT: self.find_one,
+            Command.FIND_ELEMENTS: self.find_all,
+            Command.FIND_CHILD_ELEMENT: self.find_one,
+            Command.FIND_CHILD_ELEMENTS: self.find_all,
+            Command.CLICK_ELEMENT: self.click,
+            Command.SEND_KEYS_TO_ELEMENT: self.send_keys,
+            Command.W3C_GET_CURRENT_WINDOW_HANDLE: self.current_handle,
+            Command.W3C_GET_WINDOW_HANDLES: self.handles,
+            Command.SWITCH_TO_WINDOW: self.switch_window,
+            Command.NEW_WINDOW: self.new_window,
+            Command.CLOSE: self.close_window,
+            Command.QUIT: self.shutdown,
+            Command.GET_ALL_COOKIES: self.get_all_cookies,
+            Command.ADD_COOKIE: self.add_one_cookie,
+            Command.DELETE_ALL_COOKIES: self.delete_cookies,
+            "executeCdpCommand": lambda params: self.tab.send(params["cmd"], params["params"]),
+        }
+        for command, script in ELEMENT_SCRIPTS.items():
+            self.handlers[command] = self.element_script(script)
+        super().__init__(command_executor="http://cdp.invalid", options=options)
+        # File inputs get local paths, as with a local chromedriver
+        self._is_remote = False
+
+    def start_session(self, capabilities: dict) -> None:
+        self.loop.run(self.open_session())
+        self.session_id = self.tab.target_id
+        self.caps = {"browserName": "chrome", "pageLoadStrategy": self.page_load_strategy}
+
+    async def open_session(self):
+        if self.owns_browser:
+            self.cdp_browser = await CDPBrowser.launch(self.chrome_arguments, self.chrome_binary)
+            tab = await self.cdp_browser.first_tab()
+        else:
+            self.context_id = await self.cdp_browser.new_context()
+            tab = await self.cdp_browser.new_tab(context_id=self.context_id)
+        self.tabs[tab.target_id] = tab
+        self.tab = tab
+
+    def execute(self, driver_command, params=None):
+        handler = self.handlers.get(driver_command)
+        if handler is None:
+            raise WebDriverException(f"{driver_command} is not supported by the CDP backend")
+        if self.tab is None and driver_command not in WINDOWLESS_COMMANDS:
+            raise NoSuchWindowException("No open tab")
+        value = self.loop.run(handler(self._wrap_value(params) or {}))
+        return {"value": self._unwrap_value(value)}
+
+    async def get_url(self, params):
+        await self.tab.navigate(params["url"], self.load_event)
+
+    async def find_all(self, params):
+        root = {ELEMENT_KEY: params["id"]} if "id" in params else None
+        return await self.tab.call(FIND_SCRIPT, [params["using"], params["value"], root])
+
+    async def find_one(self, params):
+        elements = await self.find_all(params)
+        if not elements:
+            raise NoSuchElementException(f"No element matches {params['using']} {params['value']!r}")
+        return elements[0]
+
+    def element_script(self, script):
+        async def run(params):
+            return await self.tab.call(script, [{ELEMENT_KEY: params["id"]}, params.get("name")])
+        return run
+
+    async def click(self, params):
+        point = await self.tab.call(CLICK_POINT_SCRIPT, [{ELEMENT_KEY: params["id"]}])
+        if point.get("error") == "intercepted":
+            raise ElementClickInterceptedException(f"Element click intercepted: another element would receive "
+                                                   f"the click: {point['by']}")
+        if point.get("error"):
+            raise ElementNotInteractableException("Element has no size and cannot be clicked")
+        mouse = {"x": point["x"], "y": point["y"], "button": "left", "clickCount": 1}
+        await self.tab.batch([
+            ("Input.dispatchMouseEvent", dict(mouse, type="mouseMoved", button="none")),
+            ("Input.dispatchMouseEvent", dict(mouse, type="mousePressed")),
+            ("Input.dispatchMouseEvent", dict(mouse, type="mouseReleased")),
+        ])
+
+    async def send_keys(self, params):
+        element = {ELEMENT_KEY: params["id"]}
+        text = params.get("text") or "".join(params.get("value") or [])
+        if await self.tab.call(FOCUS_SCRIPT, [element]):
+            object_id = await self.tab.element_object(params["id"])
+            await self.tab.send("DOM.setFileInputFiles", {"objectId": object_id, "files": text.split("\n")})
+            return
+        commands = []
+        for run in KEY_RUNS.split(text):
+            if not run:
+                continue
+            if run in SPECIAL_KEYS:
+                key, code, key_text = SPECIAL_KEYS[run]
+                event = {"key": key, "code": key, "windowsVirtualKeyCode": code, "nativeVirtualKeyCode": code}
+                commands.append(("Input.dispatchKeyEvent", dict(event, type="keyDown", text=key_text)
+                                 if key_text else dict(event, type="rawKeyDown")))
+                commands.append(("Input.dispatchKeyEvent", dict(event, type="keyUp")))
+            elif KEY_RUNS.fullmatch(run):
+                log.debug(f"Key {run!r} is not supported by the CDP backend, skipped")
+            else:
+                commands.append(("Input.insertText", {"text": run}))
+        if commands:
+            await self.tab.batch(commands)
+
+    async def current_handle(self, params):
+        return self.tab.target_id
+
+    async def handles(self, params):
+        return list(self.tabs)
+
+    async def switch_window(self, params):
+        tab = self.tabs.get(params["handle"])
+        if tab is None:
+            raise NoSuchWindowException(f"No tab {params['handle']}")
+        self.tab = tab
+        await tab.send("Page.bringToFront")
+
+    async def new_window(self, params):
+        tab = await self.cdp_browser.new_tab(context_id=self.context_id)
+        self.tabs[tab.target_id] = tab
+        return {"handle": tab.target_id, "type": "tab"}
+
+    async def close_window(self, params):
+        tab = self.tabs.pop(self.tab.target_id)
+        await self.cdp_browser.close_tab(tab)
+        self.tab = None
+        return list(self.tabs)
+
+    async def shutdown(self, params):
+        if self.owns_browser:
+            await self.cdp_browser.close()
+        else:
+            for tab in list(self.tabs.values()):
+                tab.detach()
+            await self.cdp_browser.close_context(self.context_id)
+        self.tabs.clear()
+        self.tab = None
+
+    async def get_all_cookies(self, params):
+        cookies = (await self.tab.send("Network.getCookies"))["cookies"]
+        return [{
+            "name": cookie["name"],
+            "value": cookie["value"],
+            "domain": cookie["domain"],
+            "path": cookie["path"],
+            "secure": cookie["secure"],
+            "httpOnly": cookie["httpOnly"],
+            **({"expiry": int(cookie["expires"])} if not cookie.get("session") and cookie.get("expires", -1) > 0 else {}),
+            **({"sameSite": cookie["sameSite"]} if cookie.get("sameSite") else {}),
+        } for cookie in cookies]
+
+    async def add_one_cookie(self, params):
+        cookie = dict(params["cookie"])
+        if "expiry" in cookie:
+            cookie["expires"] = cookie.pop("expiry")
+        if "domain" not in cookie:
+            cookie["url"] = await self.tab.evaluate("location.href")
+        result = await self.tab.send("Network.setCookie", cookie)
+        if result.get("success") is False:
+            raise WebDriverException(f"Could not set cookie {cookie.get('name')}")
+
+    async def delete_cookies(self, params):
+        cookies = (await self.tab.send("Network.getCookies"))["cookies"]
+        if cookies:
+            await self.tab.batch([
+                ("Network.deleteCookies", {"name": c["name"], "domain": c["domain"], "path": c["path"]})
+                for c in cookies
+            ])
+
+    def wait_for_change(self, timeout):
+        # Blocks until the DOM of the current tab changes or timeout passes
+        return self.loop.run(self.tab.wait_for_change(timeout))
+
+    def dom_settled(self, quiet, timeout):
+        return self.loop.run(self.tab.dom_settled(quiet, timeout))
+
+    def network_idle(self, idle, timeout):
+        return self.loop.run(self.tab.network_idle(idle, timeout))
+
+
+async def smoke_session(browser, base_url, index):
+    # Loads a results page and a job page in an isolated context and reads them like the bot does
+    from harvester import HARVEST_SCRIPT
+    from locators import PROBE_SCRIPT
+
+    context_id = await browser.new_context()
+    tab = await browser.new_tab(context_id=context_id)
+    timings = {}
+    try:
+        start = time.perf_counter()
+        await tab.navigate(f"{base_url}/jobs/search/?keywords=python")
+        await tab.dom_settled(0.2, 10)
+        cards = await tab.call(HARVEST_SCRIPT)
+        timings["search"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        await tab.navigate(f"{base_url}/jobs/view/{cards[0]['job_id']}/")
+        await tab.network_idle(0.2, 10)
+        controls = await tab.call(PROBE_SCRIPT)
+        timings["job_view"] = time.perf_counter() - start
+    finally:
+        tab.detach()
+        await browser.close_context(context_id)
+    return {"session": index, "cards": len(cards), "controls": sorted(k for k, v in controls.items() if v),
+            **{key: round(value, 3) for key, value in timings.items()}}
+
+
+async def smoke_test(sessions, headless=True):
+    import mock_board
+
+    server, base_url = mock_board.serve_in_thread()
+    browser = await CDPBrowser.launch(["--headless=new", "--no-sandbox"] if headless else ["--no-sandbox"])
+    try:
+        start = time.perf_counter()
+        results = await asyncio.gather(*(smoke_session(browser, base_url, index) for index in range(sessions)))
+        elapsed = time.perf_counter() - start
+    finally:
+        await browser.close()
+        server.shutdown()
+    return results, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run concurrent CDP sessions against the mock job board")
+    parser.add_argument("--sessions", type=int, default=4, help="Isolated sessions in one Chrome")
+    parser.add_argument("--headed", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
+    results, elapsed = asyncio.run(smoke_test(args.sessions, headless=not args.headed))
+    for result in results:
+        print(json.dumps(result))
+    print(f"{len(results)} sessions in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
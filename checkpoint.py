@@ -0,0 +1,63 @@
+import hashlib
+import json
+import logging
+import os
+import time
+
+log = logging.getLogger(__name__)
+
+
+def batch_id(searches):
+    # Identifies a list of searches so a checkpoint is only resumed by the same batch
+    payload = json.dumps([list(search) for search in searches])
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+class Checkpoint:
+    """Durable record of where a run is: search, results page, card and
+    application step. Every update is written to a temp file, fsynced and
+    renamed over the previous one, so a crash leaves either the old or the
+    new state on disk, never a torn file."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.state = {}
+        if os.path.exists(path):
+            try:
+                with open(path) as f:
+                    self.state = json.load(f)
+                log.info(f"Loaded checkpoint {path}: {self.describe()}")
+            except (OSError, ValueError) as e:
+                log.warning(f"Ignoring unreadable checkpoint {path}: {e}")
+
+    def describe(self):
+        state = self.state
+        if not state:
+            return "empty"
+        return (
+            f"search {state.get('search_index', 0) + 1} {state.get('search')}, page {state.get('page', 0) + 1}, "
+            f"card {state.get('card_index', 0) + 1}, job {state.get('job_id')}, step {state.get('step')}"
+        )
+
+    def resume_point(self, batch):
+        # (search_index, page, card_index, job_id in progress) for this batch, or a fresh start
+        if self.state.get("batch") != batch:
+            return 0, 0, 0, None
+        state = self.state
+        return state.get("search_index", 0), state.get("page", 0), state.get("card_index", 0), state.get("job_id")
+
+    def update(self, **fields):
+        self.state.update(fields, updated_at=time.time())
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    def clear(self):
+        self.state = {}
+        if os.path.exists(self.path):
+            os.remove(self.path)
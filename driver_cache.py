@@ -0,0 +1,132 @@
+import json
+import logging
+import os
+import re
+import shutil
+import subprocess
+import sys
+import time
+
+from webdriver_manager.chrome import ChromeDriverManager
+
+from file_lock import file_lock
+
+log = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "linkedin-bot", "chromedriver.json")
+
+CHROME_BINARIES = ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome"]
+MAC_CHROME = "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
+
+VERSION = re.compile(r"(\d+)\.(\d+)\.(\d+)\.(\d+)")
+
+# Resolved path per cache file for the lifetime of this process
+_resolved = {}
+
+
+def _run_version(binary):
+    try:
+        output = subprocess.run([binary, "--version"], capture_output=True, text=True, timeout=10).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = VERSION.search(output)
+    return match.group(0) if match else None
+
+
+def installed_chrome_version():
+    # Reads the local Chrome version without any network access
+    if sys.platform == "win32":
+        try:
+            import winreg
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Google\Chrome\BLBeacon") as key:
+                return winreg.QueryValueEx(key, "version")[0]
+        except OSError:
+            return None
+    candidates = [MAC_CHROME] if sys.platform == "darwin" else []
+    candidates += [path for path in (shutil.which(name) for name in CHROME_BINARIES) if path]
+    for binary in candidates:
+        version = _run_version(binary)
+        if version:
+            return version
+    return None
+
+
+def major(version):
+    return int(version.split(".")[0]) if version else None
+
+
+class DriverCache:
+    """Resolves chromedriver once and pins its path and version in a JSON
+    cache shared by every bot and worker process on the host.
+
+    The cached driver is reused as long as its major version matches the
+    installed Chrome, which is checked locally. In offline mode the network
+    is never used, so a driver must already be cached or on PATH."""
+
+    def __init__(self, cache_path=None, offline=False) -> None:
+        self.cache_path = cache_path or DEFAULT_CACHE_PATH
+        self.offline = offline or os.environ.get("LINKEDIN_BOT_OFFLINE") == "1"
+
+    def load(self):
+        try:
+            with open(self.cache_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def save(self, entry):
+        tmp_path = self.cache_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(entry, f, indent=2)
+        os.replace(tmp_path, self.cache_path)
+
+    def is_usable(self, entry, chrome_version):
+        if not entry or not os.path.exists(entry.get("path", "")):
+            return False
+        # Without a detectable Chrome we trust the pinned driver
+        return chrome_version is None or entry.get("chrome_major") == major(chrome_version)
+
+    def resolve(self):
+        if self.cache_path in _resolved:
+            return _resolved[self.cache_path]
+
+        start = time.perf_counter()
+        with file_lock(self.cache_path):
+            chrome_version = installed_chrome_version()
+            entry = self.load()
+            if self.is_usable(entry, chrome_version):
+                log.info(f"Using cached chromedriver {entry['driver_version']} at {entry['path']}")
+            elif self.offline:
+                entry = self.offline_entry(entry, chrome_version)
+            else:
+                entry = self.install(chrome_version)
+                self.save(entry)
+
+        _resolved[self.cache_path] = entry["path"]
+        log.info(f"Resolved chromedriver in {time.perf_counter() - start:.2f}s")
+        return entry["path"]
+
+    def offline_entry(self, entry, chrome_version):
+        if entry and os.path.exists(entry.get("path", "")):
+            log.warning(
+                f"Offline mode: cached chromedriver {entry['driver_version']} may not match Chrome {chrome_version}"
+            )
+            return entry
+        path = shutil.which("chromedriver")
+        if not path:
+            raise RuntimeError("Offline mode: no cached chromedriver and none on PATH")
+        log.info(f"Offline mode: using chromedriver from PATH at {path}")
+        return {"path": path, "driver_version": _run_version(path), "chrome_major": major(chrome_version)}
+
+    def install(self, chrome_version):
+        log.info(f"Resolving chromedriver for Chrome {chrome_version or '(not detected)'}")
+        path = ChromeDriverManager().install()
+        entry = {
+            "path": path,
+            "driver_version": _run_version(path),
+            "chrome_version": chrome_version,
+            "chrome_major": major(chrome_version),
+            "resolved_at": time.time(),
+        }
+        log.info(f"Pinned chromedriver {entry['driver_version']} at {path}")
+        return entry
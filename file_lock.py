@@ -0,0 +1,15 @@
+import os
+from contextlib import contextmanager
+
+
+@contextmanager
+def file_lock(path):
+    # Serializes access to path across processes on POSIX systems, through a <path>.lock file
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path + ".lock", "a") as lock_file:
+        try:
+            import fcntl
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        except ImportError:
+            pass
+        yield
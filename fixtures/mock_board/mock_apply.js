@@ -0,0 +1,94 @@
+// Shared Easy Apply behaviour for the mock search and job view pages.
+// The modal walks through the same steps and selectors as LinkedIn:
+// contact info -> resume -> screening questions -> review -> confirmation.
+const applied = new Set(JSON.parse(localStorage.getItem('applied') || '[]'));
+// Every fifth posting has no Easy Apply
+const hasEasyApply = (jobId) => Number(jobId) % 5 !== 0;
+
+const STEPS = [
+  {
+    fields:
+      '<h3>Contact info</h3>' +
+      '<div><label for="first-name">First name</label><input id="first-name" type="text"></div>' +
+      '<div><label for="last-name">Last name</label><input id="last-name" type="text"></div>' +
+      '<div><label for="email">Email address</label><input id="email" type="email"></div>' +
+      '<div><label for="phone">Mobile phone number</label><input id="phone" type="tel"></div>',
+    button: '<button type="button" aria-label="Continue to next step">Next</button>',
+  },
+  {
+    fields:
+      '<h3>Resume</h3>' +
+      '<div class="jobs-document-upload">' +
+      '<label class="jobs-document-upload__upload-button" for="resume-input">Upload resume</label>' +
+      '<input id="resume-input" type="file" accept=".pdf,.doc,.docx" style="display:none">' +
+      '<div id="uploaded"></div></div>',
+    button: '<button type="button" aria-label="Continue to next step">Next</button>',
+  },
+  {
+    fields:
+      '<h3>Additional questions</h3>' +
+      '<div><label for="years">Years of experience</label><input id="years" type="number"></div>' +
+      '<div><label for="degree">Highest degree</label><select id="degree">' +
+      '<option>Select an option</option><option>High School</option><option>Bachelor\'s</option><option>Master\'s</option></select></div>' +
+      '<fieldset><legend>Willing to relocate</legend>' +
+      '<input type="radio" id="relocate-yes" name="relocate" value="Yes"><label for="relocate-yes">Yes</label>' +
+      '<input type="radio" id="relocate-no" name="relocate" value="No"><label for="relocate-no">No</label></fieldset>' +
+      '<div><label for="about">About me</label><textarea id="about"></textarea></div>',
+    button: '<button type="button" aria-label="Review your application">Review</button>',
+  },
+  {
+    fields:
+      '<h3>Review your application</h3>' +
+      '<div><input type="checkbox" id="follow-company" checked><label for="follow-company">Follow the company</label></div>',
+    button: '<button type="button" aria-label="Submit application">Submit application</button>',
+  },
+];
+
+function modalRoot() {
+  return document.getElementById('modal-root');
+}
+
+function openModal(jobId, onDone) {
+  showStep(jobId, 0, onDone);
+}
+
+function showStep(jobId, index, onDone) {
+  const step = STEPS[index];
+  modalRoot().innerHTML =
+    '<div class="artdeco-modal-overlay"><div class="artdeco-modal" role="dialog">' +
+    '<form>' + step.fields + '</form>' + step.button + '</div></div>';
+
+  const upload = document.getElementById('resume-input');
+  if (upload) {
+    upload.addEventListener('change', () => {
+      const name = upload.files.length ? upload.files[0].name : '';
+      document.getElementById('uploaded').innerHTML =
+        '<div class="jobs-document-upload__uploaded-item">' + name + '</div>';
+    });
+  }
+
+  modalRoot().querySelector('.artdeco-modal > button').addEventListener('click', () => {
+    if (index + 1 < STEPS.length) {
+      showStep(jobId, index + 1, onDone);
+    } else {
+      submit(jobId, onDone);
+    }
+  });
+}
+
+function submit(jobId, onDone) {
+  applied.add(jobId);
+  localStorage.setItem('applied', JSON.stringify(Array.from(applied)));
+  modalRoot().innerHTML =
+    '<div class="artdeco-modal-overlay"><div class="artdeco-modal" role="dialog">' +
+    '<h3>Your application was sent to the company</h3>' +
+    '<button aria-label="Dismiss">Done</button></div></div>';
+  modalRoot().querySelector('button[aria-label="Dismiss"]').addEventListener('click', () => {
+    modalRoot().innerHTML = '';
+    if (onDone) onDone();
+  });
+}
+
+function appliedFeedback() {
+  return '<span class="artdeco-inline-feedback__message">Applied just now</span>';
+}
@@ -0,0 +1,65 @@
+import logging
+
+log = logging.getLogger(__name__)
+
+# Collects everything parse_and_fill_form needs to decide on values in a
+# single WebDriver round trip. Element references come back as WebElements
+# so the page is only touched again to write values.
+FORM_SNAPSHOT_SCRIPT = """
+const form = arguments[0];
+const text = (el) => el ? (el.innerText || el.textContent || '').trim() : null;
+const labelFor = (el) => {
+    if (el.id) {
+        const label = document.querySelector('label[for="' + CSS.escape(el.id) + '"]');
+        if (label) return text(label);
+    }
+    const parent = el.parentElement;
+    return parent ? text(parent.querySelector('label')) : null;
+};
+const describe = (el) => ({
+    element: el,
+    tag: el.tagName.toLowerCase(),
+    type: (el.type || '').toLowerCase(),
+    id: el.id || '',
+    name: el.getAttribute('name') || '',
+    role: el.getAttribute('role') || '',
+    aria_autocomplete: el.getAttribute('aria-autocomplete') || '',
+    aria_label: el.getAttribute('aria-label') || '',
+    required: el.required || el.getAttribute('aria-required') === 'true',
+    label: labelFor(el),
+    value: el.value || '',
+    checked: !!el.checked,
+    options: el.tagName === 'SELECT' ? Array.from(el.options).map(o => o.text) : [],
+    selected_index: el.tagName === 'SELECT' ? el.selectedIndex : -1,
+});
+return {
+    inputs: Array.from(form.querySelectorAll('input')).map(describe),
+    selects: Array.from(form.querySelectorAll('select')).map(describe),
+    textareas: Array.from(form.querySelectorAll('textarea')).map(describe),
+    fieldsets: Array.from(form.querySelectorAll('fieldset')).map(fs => ({
+        element: fs,
+        legend: text(fs.querySelector('legend')) || '',
+        radios: Array.from(fs.querySelectorAll('input[type="radio"]')).map(describe),
+    })),
+};
+"""
+
+SELECT_OPTION_SCRIPT = """
+const select = arguments[0];
+select.selectedIndex = arguments[1];
+select.dispatchEvent(new Event('input', { bubbles: true }));
+select.dispatchEvent(new Event('change', { bubbles: true }));
+"""
+
+
+def take_form_snapshot(browser, form):
+    snapshot = browser.execute_script(FORM_SNAPSHOT_SCRIPT, form)
+    log.info(
+        f"Form snapshot: {len(snapshot['inputs'])} inputs, {len(snapshot['selects'])} selects, "
+        f"{len(snapshot['textareas'])} textareas, {len(snapshot['fieldsets'])} fieldsets"
+    )
+    return snapshot
+
+
+def select_option_by_index(browser, select_element, index):
+    browser.execute_script(SELECT_OPTION_SCRIPT, select_element, index)
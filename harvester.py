@@ -0,0 +1,81 @@
+import logging
+
+from selenium.webdriver.common.by import By
+
+log = logging.getLogger(__name__)
+
+# Reads the ID and visible metadata of every job card on the current results
+# page in one round trip.
+HARVEST_SCRIPT = """
+const text = (root, selectors) => {
+    for (const selector of selectors) {
+        const el = root.querySelector(selector);
+        if (el && el.innerText.trim()) return el.innerText.trim();
+    }
+    return null;
+};
+return Array.from(document.getElementsByClassName('job-card-container'))
+    .filter(card => card.getAttribute('data-job-id'))
+    .map(card => {
+        const footer = (text(card, ['.job-card-container__footer-wrapper', '.job-card-list__footer-wrapper']) || '').toLowerCase();
+        return {
+            job_id: card.getAttribute('data-job-id'),
+            title: text(card, ['.job-card-list__title', '.job-card-container__link', 'a']),
+            company: text(card, ['.job-card-container__primary-description', '.artdeco-entity-lockup__subtitle']),
+            location: text(card, ['.job-card-container__metadata-item', '.artdeco-entity-lockup__caption']),
+            easy_apply: footer.includes('easy apply'),
+            applied: footer.includes('applied'),
+        };
+    });
+"""
+
+
+class JobHarvester:
+    """Pages through search results with the start= offset and yields job
+    cards lazily, so applying to page k happens before page k+1 is loaded."""
+
+    def __init__(self, browser, pacer, page_size: int = 25, max_pages: int = 40, before_load=None) -> None:
+        self.browser = browser
+        self.pacer = pacer
+        # Called before each results page is requested, e.g. to wait for the rate limiter
+        self.before_load = before_load
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.loaded_url = None
+
+    def page_url(self, search_url, page):
+        if page == 0:
+            return search_url
+        separator = "&" if "?" in search_url else "?"
+        return f"{search_url}{separator}start={page * self.page_size}"
+
+    def load_page(self, url):
+        if self.before_load:
+            self.before_load()
+        self.browser.get(url)
+        self.loaded_url = url
+        return self.pacer.element_present((By.CLASS_NAME, 'job-card-container'), name="search_results")
+
+    def pages(self, search_url, first_page=0):
+        for page in range(first_page, self.max_pages):
+            url = self.page_url(search_url, page)
+            if not self.load_page(url):
+                log.info(f"No job cards on page {page + 1}, stopping")
+                return
+
+            cards = self.browser.execute_script(HARVEST_SCRIPT)
+            log.info(f"Harvested {len(cards)} job cards from page {page + 1}")
+            if not cards:
+                return
+            yield page, url, cards
+            if len(cards) < self.page_size:
+                return
+
+    def batches(self, search_url, first_page=0):
+        # One list of jobs per results page
+        for page, url, cards in self.pages(search_url, first_page):
+            yield [dict(card, page=page, index=index, page_url=url) for index, card in enumerate(cards)]
+
+    def jobs(self, search_url, first_page=0):
+        for batch in self.batches(search_url, first_page):
+            yield from batch
@@ -0,0 +1,206 @@
+import asyncio
+import logging
+import re
+from collections import Counter
+from html.parser import HTMLParser
+from urllib.parse import urlencode, urlparse, parse_qsl
+
+import aiohttp
+
+log = logging.getLogger(__name__)
+
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+
+CARD_FIELDS = {
+    "title": {"base-search-card__title", "job-card-list__title"},
+    "company": {"base-search-card__subtitle", "job-card-container__primary-description"},
+    "location": {"job-search-card__location", "job-card-container__metadata-item"},
+}
+
+DETAIL_FIELDS = {
+    "title": {"top-card-layout__title", "job-details-jobs-unified-top-card__job-title", "jobs-unified-top-card__job-title"},
+    "company": {"topcard__org-name-link", "job-details-jobs-unified-top-card__company-name", "jobs-unified-top-card__company-name"},
+    "location": {"topcard__flavor--bullet", "job-details-jobs-unified-top-card__bullet"},
+    "feedback": {"artdeco-inline-feedback__message"},
+    "description": {"show-more-less-html__markup", "jobs-description__content", "jobs-box__html-content"},
+}
+
+JOB_URN = re.compile(r"jobPosting:(\d+)")
+
+
+class _FieldParser(HTMLParser):
+    # Collects the text of elements whose class matches one of `fields`
+    def __init__(self, fields):
+        super().__init__(convert_charrefs=True)
+        self.fields = fields
+        self.values = {}
+        self.capturing = None
+        self.depth = 0
+        self.buffer = []
+
+    def classes(self, attrs):
+        return set((dict(attrs).get("class") or "").split())
+
+    def handle_starttag(self, tag, attrs):
+        if self.capturing:
+            if tag not in VOID_TAGS:
+                self.depth += 1
+            return
+        classes = self.classes(attrs)
+        for name, wanted in self.fields.items():
+            if name not in self.values and classes & wanted:
+                self.capturing = name
+                self.depth = 0 if tag in VOID_TAGS else 1
+                self.buffer = []
+                if self.depth == 0:
+                    self.finish()
+                return
+
+    def handle_endtag(self, tag):
+        if self.capturing and tag not in VOID_TAGS:
+            self.depth -= 1
+            if self.depth <= 0:
+                self.finish()
+
+    def handle_data(self, data):
+        if self.capturing:
+            self.buffer.append(data)
+
+    def finish(self):
+        self.values[self.capturing] = " ".join("".join(self.buffer).split()) or None
+        self.capturing = None
+
+
+class SearchPageParser(_FieldParser):
+    # Splits a search results page into cards keyed by data-job-id or job URN
+    def __init__(self):
+        super().__init__(CARD_FIELDS)
+        self.cards = []
+
+    def handle_starttag(self, tag, attrs):
+        attributes = dict(attrs)
+        job_id = attributes.get("data-job-id")
+        if not job_id:
+            match = JOB_URN.search(attributes.get("data-entity-urn") or "")
+            job_id = match.group(1) if match else None
+        if job_id and not self.capturing and not any(card["job_id"] == job_id for card in self.cards):
+            self.values = {}
+            self.cards.append({"job_id": job_id, "values": self.values})
+        super().handle_starttag(tag, attrs)
+
+
+class JobDetailParser(_FieldParser):
+    def __init__(self):
+        super().__init__(DETAIL_FIELDS)
+        self.easy_apply = False
+        self.external_apply = False
+
+    def handle_starttag(self, tag, attrs):
+        attributes = dict(attrs)
+        if (attributes.get("aria-label") or "").startswith("Easy Apply"):
+            self.easy_apply = True
+        elif "jobs-apply-button" in self.classes(attrs):
+            self.external_apply = True
+        super().handle_starttag(tag, attrs)
+
+
+def parse_search_page(html):
+    parser = SearchPageParser()
+    parser.feed(html)
+    return [dict(card["values"], job_id=card["job_id"]) for card in parser.cards]
+
+
+def parse_job_detail(html, job_id):
+    parser = JobDetailParser()
+    parser.feed(html)
+    values = parser.values
+    return {
+        "job_id": job_id,
+        "title": values.get("title"),
+        "company": values.get("company"),
+        "location": values.get("location"),
+        "description": values.get("description"),
+        # None when the page has no apply button at all, e.g. markup the parser does not know
+        "easy_apply": True if parser.easy_apply else (False if parser.external_apply else None),
+        "applied": "applied" in (values.get("feedback") or "").lower(),
+    }
+
+
+def browser_session_state(browser):
+    # Cookies and user agent of the logged-in browser, for reuse over HTTP
+    cookies = {cookie["name"]: cookie["value"] for cookie in browser.get_cookies()}
+    user_agent = browser.execute_script("return navigator.userAgent;")
+    return cookies, user_agent
+
+
+class JobFetcher:
+    """Fetches search and job detail pages over pooled HTTP with the browser's
+    cookies, so only jobs worth applying to are opened in Chrome."""
+
+    def __init__(self, base_url: str, cookies: dict, user_agent: str = None, concurrency: int = 8,
+                 timeout: float = 20) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.cookies = cookies
+        self.headers = {"User-Agent": user_agent} if user_agent else {}
+        if "JSESSIONID" in cookies:
+            # LinkedIn expects the JSESSIONID value as CSRF token on API requests
+            self.headers["csrf-token"] = cookies["JSESSIONID"].strip('"')
+        self.concurrency = concurrency
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        # Response status counts, plus "error" for failed requests; 429 and LinkedIn's 999
+        # mean the account is being throttled
+        self.statuses = Counter()
+        # Cards on the fetched search pages, including ones skip() dropped
+        self.cards = 0
+
+    def search_page_url(self, search_url, start):
+        # The guest endpoint returns the card list for one page as plain HTML, starting at card `start`
+        params = dict(parse_qsl(urlparse(search_url).query))
+        params["start"] = str(start)
+        return f"{self.base_url}/jobs-guest/jobs/api/seeMoreJobPostings/search?{urlencode(params)}"
+
+    async def _get(self, session, semaphore, url):
+        # None on any failure, so one bad page does not lose the rest of the harvest
+        async with semaphore:
+            try:
+                async with session.get(url) as response:
+                    self.statuses[response.status] += 1
+                    if response.status != 200:
+                        log.warning(f"GET {url} returned {response.status}")
+                        return None
+                    return await response.text()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self.statuses["error"] += 1
+                log.warning(f"GET {url} failed: {e!r}")
+                return None
+
+    async def _fetch_detail(self, session, semaphore, job):
+        html = await self._get(session, semaphore, f"{self.base_url}/jobs/view/{job['job_id']}/")
+        if html is None:
+            return dict(job, fetched=False)
+        detail = parse_job_detail(html, job["job_id"])
+        # Keep card values the detail page did not provide
+        return dict(job, **{key: value for key, value in detail.items() if value is not None}, fetched=True)
+
+    async def harvest(self, search_url, max_pages=40, skip=None):
+        skip = skip or (lambda job_id: False)
+        semaphore = asyncio.Semaphore(self.concurrency)
+        connector = aiohttp.TCPConnector(limit=self.concurrency)
+        async with aiohttp.ClientSession(cookies=self.cookies, headers=self.headers, connector=connector,
+                                         timeout=self.timeout) as session:
+            jobs = []
+            for page in range(max_pages):
+                html = await self._get(session, semaphore, self.search_page_url(search_url, self.cards))
+                cards = parse_search_page(html) if html else []
+                log.info(f"Fetched {len(cards)} job cards from page {page + 1} over HTTP")
+                # Pages hold 10 cards, but only an empty page means the results ran out
+                if not cards:
+                    break
+                self.cards += len(cards)
+                jobs.extend(dict(card, page=page, index=index) for index, card in enumerate(cards)
+                            if not skip(card["job_id"]))
+
+            return await asyncio.gather(*(self._fetch_detail(session, semaphore, job) for job in jobs))
+
+    def harvest_sync(self, search_url, max_pages=40, skip=None):
+        return asyncio.run(self.harvest(search_url, max_pages, skip))
@@ -0,0 +1,96 @@
+import logging
+import os
+import sqlite3
+import time
+
+log = logging.getLogger(__name__)
+
+APPLIED = "applied"
+SKIPPED = "skipped"
+FAILED = "failed"
+NO_EASY_APPLY = "no_easy_apply"
+# Shown as applied on LinkedIn before the bot got to it
+ALREADY_APPLIED = "already_applied"
+
+OUTCOMES = (APPLIED, SKIPPED, FAILED, NO_EASY_APPLY, ALREADY_APPLIED)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    outcome TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 1,
+    title TEXT,
+    search TEXT,
+    updated_at REAL NOT NULL
+)
+"""
+
+
+class JobLedger:
+    """On-disk record of every job the bot has dealt with.
+
+    All rows are mirrored in memory, so checking a card is a dict lookup.
+    Each outcome is committed as soon as it is recorded (SQLite WAL), so a
+    crash loses at most the job that was in progress."""
+
+    def __init__(self, path: str, max_attempts: int = 3) -> None:
+        self.path = path
+        self.max_attempts = max_attempts
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.connection = sqlite3.connect(path, timeout=30)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(SCHEMA)
+        self.connection.commit()
+        self.jobs = {
+            job_id: (outcome, attempts)
+            for job_id, outcome, attempts in self.connection.execute("SELECT job_id, outcome, attempts FROM jobs")
+        }
+        log.info(f"Loaded {len(self.jobs)} jobs from ledger {path}")
+
+    def __contains__(self, job_id):
+        return job_id in self.jobs
+
+    def outcome(self, job_id):
+        entry = self.jobs.get(job_id)
+        return entry[0] if entry else None
+
+    def should_skip(self, job_id):
+        entry = self.jobs.get(job_id)
+        if entry is None:
+            return False
+        outcome, attempts = entry
+        # Failed applications are retried a few times before giving up
+        return outcome != FAILED or attempts >= self.max_attempts
+
+    def record(self, job_id, outcome, title=None, search=None):
+        if outcome not in OUTCOMES:
+            raise ValueError(f"Unknown ledger outcome: {outcome}")
+        previous = self.jobs.get(job_id)
+        attempts = previous[1] + 1 if previous else 1
+        self.connection.execute(
+            "INSERT INTO jobs (job_id, outcome, attempts, title, search, updated_at) VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(job_id) DO UPDATE SET outcome = excluded.outcome, attempts = excluded.attempts, "
+            "title = COALESCE(excluded.title, jobs.title), search = COALESCE(excluded.search, jobs.search), "
+            "updated_at = excluded.updated_at",
+            (job_id, outcome, attempts, title, search, time.time()),
+        )
+        self.connection.commit()
+        self.jobs[job_id] = (outcome, attempts)
+
+    def applied_since(self, timestamp):
+        # Applications the bot submitted at or after timestamp, e.g. for a daily quota
+        row = self.connection.execute(
+            "SELECT COUNT(*) FROM jobs WHERE outcome = ? AND updated_at >= ?", (APPLIED, timestamp)
+        ).fetchone()
+        return row[0]
+
+    def counts(self):
+        counts = {}
+        for outcome, _ in self.jobs.values():
+            counts[outcome] = counts.get(outcome, 0) + 1
+        return counts
+
+    def close(self):
+        self.connection.close()
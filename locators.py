@@ -0,0 +1,144 @@
+import logging
+from collections import Counter
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+
+log = logging.getLogger(__name__)
+
+# Fallback chains, most specific first. Scoped CSS is tried before any
+# document-wide XPath.
+LOCATORS = {
+    "login_button": [
+        (By.CSS_SELECTOR, "#organic-div form button[type='submit']"),
+        (By.XPATH, '//*[@id="organic-div"]/form/div[3]/button'),
+    ],
+    "global_nav": [
+        (By.ID, "global-nav"),
+    ],
+    "easy_apply": [
+        (By.CSS_SELECTOR, ".jobs-apply-button[aria-label^='Easy Apply']"),
+        (By.CSS_SELECTOR, "button[aria-label*='Easy Apply to']"),
+        (By.XPATH, "//button[contains(@aria-label, 'Easy Apply to')]"),
+    ],
+    "form_control": [
+        (By.CSS_SELECTOR, ".artdeco-modal form input, .artdeco-modal form select, .artdeco-modal form textarea"),
+        (By.CSS_SELECTOR, "form input, form select, form textarea"),
+    ],
+    "form": [
+        (By.CSS_SELECTOR, ".artdeco-modal form"),
+        (By.TAG_NAME, "form"),
+    ],
+    "loading_spinner": [
+        (By.CSS_SELECTOR, "[class*='loading-spinner']"),
+    ],
+    "modal_overlay": [
+        (By.CSS_SELECTOR, ".artdeco-modal-overlay"),
+    ],
+    "resume_upload": [
+        (By.CSS_SELECTOR, ".artdeco-modal label.jobs-document-upload__upload-button"),
+        (By.CSS_SELECTOR, "label.jobs-document-upload__upload-button"),
+        (By.XPATH, "//label[contains(@class, 'jobs-document-upload__upload-button')]"),
+    ],
+    "listbox_option": [
+        (By.CSS_SELECTOR, "ul[role='listbox'] > li"),
+    ],
+    "uploaded_resume": [
+        (By.CSS_SELECTOR, ".jobs-document-upload__uploaded-item"),
+        (By.XPATH, "//div[contains(@class, 'jobs-document-upload__uploaded-item')]"),
+    ],
+}
+
+# Classifies the controls of the open modal (or the page when none is open)
+# in one round trip. Labels are matched on aria-label first and visible text
+# second, and Dismiss buttons are only taken from modals, overlays and toasts
+# so the "dismiss job" buttons on search result cards are never clicked.
+PROBE_SCRIPT = """
+const modals = Array.from(document.querySelectorAll('.artdeco-modal, [role="dialog"]'))
+    .filter(el => el.offsetParent !== null || getComputedStyle(el).position === 'fixed');
+const modal = modals.length ? modals[modals.length - 1] : null;
+const scope = modal || document;
+const label = el => ((el.getAttribute('aria-label') || '') + ' ' + (el.innerText || '')).trim().toLowerCase();
+const usable = el => !el.disabled && (el.offsetParent !== null || el.getClientRects().length > 0);
+const first = (buttons, test) => buttons.find(el => usable(el) && test(label(el))) || null;
+
+const buttons = Array.from(scope.querySelectorAll('button'));
+const result = {
+    modal: modal !== null,
+    overlay: document.querySelector('.artdeco-modal-overlay') !== null,
+    form: !!(modal && modal.querySelector('form input, form select, form textarea')),
+    submit: null, review: null, next: null, dismiss: null, continue_applying: null,
+    confirmation: false, applied: false,
+};
+if (modal) {
+    result.submit = first(buttons, t => t.startsWith('submit application') || t.startsWith('submit'));
+    result.review = first(buttons, t => t.startsWith('review'));
+    result.next = first(buttons, t => t.startsWith('continue to next step') || t.startsWith('next') || t === 'continue');
+    result.continue_applying = first(buttons, t => t.includes('continue applying'));
+    result.confirmation = /application was sent/i.test(modal.innerText || '');
+}
+const dismissScopes = Array.from(document.querySelectorAll('.artdeco-modal, [role="dialog"], .artdeco-modal-overlay, .artdeco-toast-item'));
+for (const root of dismissScopes.reverse()) {
+    const button = root.querySelector('button[aria-label="Dismiss"], button.artdeco-modal__dismiss, button.artdeco-toast-item__dismiss');
+    if (button && usable(button)) { result.dismiss = button; break; }
+}
+result.applied = Array.from(document.querySelectorAll('.artdeco-inline-feedback__message'))
+    .some(el => /applied/i.test(el.innerText || ''));
+return result;
+"""
+
+
+class LocatorRegistry:
+    """Named locators with fallback chains and one combined control probe.
+
+    Each chain is tried in order with find_elements, so a miss costs no
+    implicit wait. The locator that matched is moved to the front of its
+    chain, so after the first hit a lookup is one WebDriver call."""
+
+    def __init__(self, locators=None) -> None:
+        self.chains = {name: list(chain) for name, chain in (locators or LOCATORS).items()}
+        self.hits = Counter()
+
+    def find_all(self, context, name):
+        chain = self.chains[name]
+        for position, locator in enumerate(chain):
+            elements = context.find_elements(*locator)
+            if elements:
+                if position:
+                    chain.insert(0, chain.pop(position))
+                    log.info(f"Locator '{name}' now prefers {locator}")
+                self.hits[name] += 1
+                return elements
+        return []
+
+    def find(self, context, name):
+        elements = self.find_all(context, name)
+        return elements[0] if elements else None
+
+    def present(self, name):
+        # Condition for WebDriverWait / Pacer.until
+        return lambda driver: self.find(driver, name) or False
+
+    def clickable(self, name):
+        def condition(driver):
+            element = self.find(driver, name)
+            return EC.element_to_be_clickable(element)(driver) if element else False
+        return condition
+
+    def absent(self, name):
+        return lambda driver: not self.find_all(driver, name)
+
+    def probe(self, browser):
+        try:
+            return browser.execute_script(PROBE_SCRIPT)
+        except WebDriverException as e:
+            log.warning(f"Control probe failed: {e.msg}")
+            return {}
+
+    def probe_for(self, *keys):
+        # Condition that is met once the probe finds any of keys
+        def condition(driver):
+            result = self.probe(driver)
+            return result if any(result.get(key) for key in keys) else False
+        return condition
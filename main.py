@@ -1,67 +1,259 @@
-import csv
-import time
 import logging
 import random
 import os
+import time
+from collections import Counter
 from urllib.parse import quote, urlencode
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementClickInterceptedException
+from selenium.common.exceptions import TimeoutException, ElementClickInterceptedException, WebDriverException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import Select
-from webdriver_manager.chrome import ChromeDriverManager
-from fuzzywuzzy import fuzz
+from answer_store import AnswerStore
+from cdp_driver import CDPWebDriver
+from checkpoint import Checkpoint, batch_id
+from driver_cache import DriverCache
+from form_snapshot import take_form_snapshot, select_option_by_index
+from harvester import JobHarvester
+from job_fetcher import JobFetcher, browser_session_state
+from ledger import JobLedger, FAILED
+from locators import LocatorRegistry
+from matcher import ResumeMatcher
+from option_ranker import OptionRanker, listbox_options
+from pacing import Pacer
+from recorder import SessionRecorder, REPLAY_SETTINGS
+from rate_limiter import AdaptiveRateLimiter, HEALTHY, EMPTY, TIMEOUT, CHALLENGE, is_challenge_url
+from relevance import RelevanceScorer
+from resume_profile import ResumeProfile
+from results_sink import ResultsSink
+from session_store import SessionStore
+from tab_pool import TabPool
+from tracing import Tracer, traced, SLEEP
 
 log = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
+# Requests dropped in lean mode: fonts, media and analytics/ad hosts
+LEAN_BLOCKED_URLS = [
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.mp4", "*.webm", "*.mp3", "*.gif",
+    "*doubleclick.net*", "*google-analytics.com*", "*googletagmanager.com*", "*googlesyndication.com*",
+    "*px.ads.linkedin.com*", "*ads.linkedin.com*", "*snap.licdn.com*", "*bat.bing.com*", "*connect.facebook.net*",
+]
+
+# "cdp" drives Chrome over the DevTools protocol without chromedriver
+DRIVER_BACKENDS = ("selenium", "cdp")
+
 class LinkedInLoginBot:
-    def __init__(self, username: str, password: str, resume_data: dict, job_filters: dict, resume_path: str) -> None:
+    def __init__(self, username: str, password: str, resume_data: dict, job_filters: dict, resume_path: str,
+                 jitter=(0.2, 0.6), base_url="https://www.linkedin.com", profile_dir=None, claim_job=None,
+                 rate_limiter=None, session_dir=".sessions", ledger_path="applied_jobs.db", http_harvest=False,
+                 http_concurrency=8, answers_path="answers.json", trace_dir="traces", headless=False,
+                 lean=False, recycle_after=None, driver_cache_path=None, offline=False,
+                 checkpoint_path="checkpoint.json", resume_profile_dir=".profiles", daily_quota=None,
+                 prefetch_tabs=0, min_relevance=None, driver_factory=None, record_dir=None,
+                 results_dir="results", results_format="csv", driver_backend="selenium") -> None:
         log.info("Initializing LinkedIn Login Bot")
         self.username = username
         self.password = password
-        self.resume_data = resume_data
+        self.resume_profile = self.load_resume_profile(resume_path, resume_profile_dir)
+        # Hand-entered values override the ones parsed from the resume
+        self.resume_data = self.resume_profile.resume_data(resume_data) if self.resume_profile else resume_data
         self.job_filters = job_filters
         self.resume_path = resume_path
+        self.base_url = base_url.rstrip("/")
+        self.profile_dir = profile_dir
+        self.headless = headless or lean
+        self.lean = lean
+        # Restart Chrome after this many applications to keep memory bounded
+        self.recycle_after = recycle_after
+        self.applications_since_launch = 0
+        # Lets a scheduler deduplicate job IDs across several bots
+        self.claim_job = claim_job or (lambda job_id: True)
+        # Without a configured pace the limiter only slows down when LinkedIn pushes back
+        self.rate_limiter = rate_limiter or AdaptiveRateLimiter(account=username)
+        self.session_store = SessionStore(session_dir, username) if session_dir else None
+        self.ledger = JobLedger(ledger_path) if ledger_path else None
+        self.current_search = None
+        self.current_title = None
+        self.harvested = 0
+        self.http_harvest = http_harvest
+        self.http_concurrency = http_concurrency
+        self.answers = AnswerStore(answers_path) if answers_path else None
+        self.checkpoint = Checkpoint(checkpoint_path) if checkpoint_path else None
+        self.outcomes = Counter()
+        # Stop once this many applications were submitted today
+        self.daily_quota = daily_quota
+        self.last_outcome = None
+        self.matcher = ResumeMatcher(
+            self.resume_data, key_tokens=self.resume_profile.key_tokens if self.resume_profile else None
+        )
+        trace_path = os.path.join(trace_dir, f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}.jsonl") if trace_dir else None
+        self.tracer = Tracer(trace_path)
+        self.option_ranker = OptionRanker()
+        # Jobs scoring below min_relevance are dropped and the rest applied to best first
+        self.relevance = (RelevanceScorer(self.resume_data, job_filters, self.resume_profile, threshold=min_relevance)
+                          if min_relevance is not None else None)
+        self.locators = LocatorRegistry()
+        self.jitter = jitter
+        self.driver_cache = DriverCache(driver_cache_path, offline=offline)
+        # Builds the WebDriver from ChromeOptions instead of launching Chrome, e.g. for replays
+        self.driver_factory = driver_factory
+        if driver_backend not in DRIVER_BACKENDS:
+            raise ValueError(f"driver_backend must be one of {', '.join(DRIVER_BACKENDS)}, not {driver_backend!r}")
+        self.driver_backend = driver_backend
+        if record_dir and prefetch_tabs:
+            # Replays open every job in the foreground tab, so tab switches would never match
+            raise ValueError("record_dir cannot be combined with prefetch_tabs")
+        self.recorder = None
+        if record_dir:
+            record_path = os.path.join(record_dir, f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}.jsonl.gz")
+            self.recorder = SessionRecorder(record_path, {key: getattr(self, key) for key in REPLAY_SETTINGS})
+        # One row per job outcome, written in batches off the apply loop
+        self.results = ResultsSink(results_dir, format=results_format) if results_dir else None
+        # Form steps, answers and start time of the application in progress
+        self.application = {}
+        # Job detail tabs kept loading in the background, 0 to use a single tab
+        self.prefetch_tabs = prefetch_tabs
+        self.pacer = None
+        self.harvester = None
+        self.tab_pool = None
+        self.launch_browser()
+
+    @staticmethod
+    def load_resume_profile(resume_path, profile_dir):
+        if not profile_dir or not resume_path or not resume_path.lower().endswith(".pdf"):
+            return None
+        try:
+            return ResumeProfile.load(resume_path, profile_dir)
+        except Exception as e:
+            log.warning(f"Could not load a resume profile from {resume_path}, using resume_data only: {e}")
+            return None
+
+    def launch_browser(self):
         self.options = self.browser_options()
-        self.browser = webdriver.Chrome(service=ChromeService(ChromeDriverManager().install()), options=self.options)
+        if self.driver_factory:
+            self.browser = self.driver_factory(self.options)
+        elif self.driver_backend == "cdp":
+            self.browser = CDPWebDriver(self.options)
+        else:
+            self.browser = webdriver.Chrome(service=ChromeService(self.driver_cache.resolve()), options=self.options)
+        if self.recorder:
+            self.recorder.attach(self.browser)
+        self.tracer.instrument_driver(self.browser)
+        self.block_lean_urls()
         self.wait = WebDriverWait(self.browser, 30)
+        if self.pacer:
+            # Keep the timings collected before a recycle
+            self.pacer.browser = self.browser
+        else:
+            self.pacer = Pacer(self.browser, jitter=self.jitter, tracer=self.tracer)
+        if self.harvester:
+            self.harvester.browser = self.browser
+            self.harvester.pacer = self.pacer
+            self.harvester.loaded_url = None
+        else:
+            self.harvester = JobHarvester(self.browser, self.pacer, before_load=self.acquire_rate_limit)
+        if self.tab_pool:
+            self.tab_pool.reset(self.browser)
+        elif self.prefetch_tabs:
+            self.tab_pool = TabPool(self.browser, self.prefetch_tabs, on_new_tab=self.block_lean_urls)
+        self.applications_since_launch = 0
+
+    def block_lean_urls(self):
+        # Blocking applies per tab, so every new tab needs it too
+        if self.lean:
+            self.browser.execute_cdp_cmd("Network.enable", {})
+            self.browser.execute_cdp_cmd("Network.setBlockedURLs", {"urls": LEAN_BLOCKED_URLS})
+
+    def recycle_browser(self):
+        log.info(f"Recycling browser after {self.applications_since_launch} applications")
+        self.tracer.count("browser_recycles")
+        try:
+            self.browser.quit()
+        except Exception as e:
+            log.warning(f"Error while closing browser: {e}")
+        self.launch_browser()
+        self.start_linkedin()
 
     def browser_options(self):
         options = webdriver.ChromeOptions()
-        options.add_argument("--start-maximized")
+        if self.lean:
+            # Small fixed viewport, no images, and stop waiting once the DOM is ready
+            options.add_argument("--window-size=1280,900")
+            options.add_argument("--blink-settings=imagesEnabled=false")
+            options.add_argument("--disable-gpu")
+            options.add_argument("--disable-dev-shm-usage")
+            options.add_argument("--mute-audio")
+            options.add_argument("--disable-background-networking")
+            options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+            options.page_load_strategy = "eager"
+        else:
+            options.add_argument("--start-maximized")
+        if self.headless:
+            options.add_argument("--headless=new")
         options.add_argument("--ignore-certificate-errors")
         options.add_argument('--no-sandbox')
         options.add_argument("--disable-extensions")
         options.add_argument("--disable-blink-features")
         options.add_argument("--disable-blink-features=AutomationControlled")
+        if self.profile_dir:
+            options.add_argument(f"--user-data-dir={os.path.abspath(self.profile_dir)}")
         return options
 
+    def restore_session(self) -> bool:
+        if not self.session_store or not self.session_store.exists():
+            return False
+        log.info("Restoring saved LinkedIn session")
+        # Cookies can only be set for the origin currently loaded
+        self.browser.get(f"{self.base_url}/robots.txt")
+        if not self.session_store.load(self.browser, self.base_url):
+            return False
+
+        self.browser.get(f"{self.base_url}/feed/")
+        try:
+            WebDriverWait(self.browser, 5).until(self.locators.present("global_nav"))
+            log.info("Saved session is still valid, skipping login")
+            return True
+        except TimeoutException:
+            self.check_page_health()
+            log.info("Saved session has expired, logging in again")
+            self.session_store.clear()
+            self.browser.delete_all_cookies()
+            return False
+
+    @traced("start_linkedin")
     def start_linkedin(self) -> None:
+        if self.restore_session():
+            return
+
         log.info("Logging in to LinkedIn")
-        self.browser.get("https://www.linkedin.com/login")
+        self.browser.get(f"{self.base_url}/login")
         try:
             user_field = self.browser.find_element(By.ID, "username")
             pw_field = self.browser.find_element(By.ID, "password")
-            login_button = self.browser.find_element(By.XPATH, '//*[@id="organic-div"]/form/div[3]/button')
+            login_button = self.locators.find(self.browser, "login_button")
 
             user_field.send_keys(self.username)
             pw_field.send_keys(self.password)
             login_button.click()
             log.info("Credentials submitted")
 
-            self.wait.until(EC.presence_of_element_located((By.ID, "global-nav")))
+            self.wait.until(self.locators.present("global_nav"))
             log.info("Successfully logged in to LinkedIn")
-            time.sleep(3)
+            # Let the post-login requests set their cookies before the session is saved
+            self.pacer.network_idle(name="login_settled")
+            if self.session_store:
+                self.session_store.save(self.browser, self.base_url)
 
         except TimeoutException:
             log.error("TimeoutException! Login failed")
+            self.check_page_health(TIMEOUT)
 
     def construct_job_search_url(self, job_title: str, location: str) -> str:
-        base_url = "https://www.linkedin.com/jobs/search/?"
+        base_url = f"{self.base_url}/jobs/search/?"
         params = {
             "keywords": job_title,
             "location": location,
@@ -94,105 +286,286 @@ class LinkedInLoginBot:
 
         return base_url + urlencode(params)
 
-    def search_jobs(self, job_title: str, location: str) -> None:
+    @traced("search_jobs")
+    def search_jobs(self, job_title: str, location: str, first_page=0, first_card=0) -> None:
         try:
             search_url = self.construct_job_search_url(job_title, location)
-            
-            self.browser.get(search_url)
-            log.info(f"Navigated to job search results for {job_title} in {location} with applied filters")
-            time.sleep(5)
+            self.current_search = f"{job_title} | {location}"
+            self.current_title = job_title
+            log.info(f"Searching jobs for {job_title} in {location} with applied filters")
 
-            self.extract_job_links()
+            self.extract_job_links(search_url, first_page, first_card)
 
         except TimeoutException:
             log.error("TimeoutException! Could not search jobs")
+            self.check_page_health(TIMEOUT)
 
-    def extract_job_links(self):
+    def extract_job_links(self, search_url, first_page=0, first_card=0):
         try:
-            self.close_pop_ups()  # Close any initial pop-ups
-            job_elements = self.wait.until(EC.presence_of_all_elements_located((By.CLASS_NAME, 'job-card-container')))
-            log.info(f"Found {len(job_elements)} job cards.")
-
-            for index in range(len(job_elements)):
+            count = 0
+            # Cards found on the results pages, before the ledger, relevance or quota drop any
+            self.harvested = 0
+            if self.relevance:
+                self.relevance.start_search()
+            # Cards are harvested a page at a time and applied to as they are yielded
+            if self.http_harvest:
+                batches = [self.fetch_jobs_over_http(search_url)]
+            else:
+                batches = self.count_harvested(self.harvester.batches(search_url, first_page))
+            for position, job, upcoming in self.iterate_jobs(batches, first_card):
+                if self.quota_reached():
+                    break
+                if position == 0 and "page_url" in job:
+                    self.close_pop_ups()  # Close any pop-ups on a freshly loaded page
+                count += 1
+                self.last_outcome = None
                 try:
-                    # Re-locate elements to avoid stale references
-                    job_elements = self.wait.until(EC.presence_of_all_elements_located((By.CLASS_NAME, 'job-card-container')))
-                    job = job_elements[index]
-
-                    job_id = job.get_attribute("data-job-id")
-                    if job_id:
-                        job_link = f"https://www.linkedin.com/jobs/search/?currentJobId={job_id}"
-                        log.info(f"Working on job link: {job_link}")
-                        
-                        # Scroll the job into view
-                        self.browser.execute_script("arguments[0].scrollIntoView(true);", job)
-                        time.sleep(1)  # Short pause after scrolling
-                        
-                        # Click with retry mechanism
-                        max_retries = 3
-                        for attempt in range(max_retries):
-                            try:
-                                self.wait.until(EC.element_to_be_clickable(job)).click()
-                                break
-                            except ElementClickInterceptedException:
-                                if attempt < max_retries - 1:
-                                    log.warning(f"Click intercepted, retrying... (Attempt {attempt + 1})")
-                                    time.sleep(2)
-                                    self.close_pop_ups()
-                                else:
-                                    log.error(f"Failed to click job after {max_retries} attempts")
-                                    raise
-                        
-                        time.sleep(3)  # Wait for job details to load
-                        
-                        if not self.is_already_applied():
-                            if self.click_easy_apply():
-                                self.handle_application_process()
-                        
-                    time.sleep(2)
-
+                    self.apply_to_job(job, upcoming, position)
+                    errored = False
                 except Exception as e:
                     log.error(f"Error interacting with job card: {e}")
-
-            log.info("Finished extracting and interacting with job links.")
+                    errored = True
+                    if isinstance(e, TimeoutException):
+                        self.rate_limiter.report(TIMEOUT)
+                if (errored or self.last_outcome == FAILED) and not self.browser_alive():
+                    # Let run_batch restart Chrome and continue from the checkpoint
+                    raise WebDriverException("Browser stopped responding")
+                if self.recycle_after and self.applications_since_launch >= self.recycle_after:
+                    self.recycle_browser()
+
+            log.info(f"Finished extracting and interacting with {count} job links.")
+            if not self.harvested:
+                # Only a search LinkedIn returned nothing for; jobs the bot filtered out do not count
+                self.check_page_health(EMPTY)
 
         except TimeoutException:
             log.error("TimeoutException! No job cards found.")
+        finally:
+            # Tabs prefetched for jobs after a quota stop or the end of the search
+            if self.tab_pool:
+                self.tab_pool.close_all()
+
+    def count_harvested(self, batches):
+        for batch in batches:
+            self.harvested += len(batch)
+            yield batch
+
+    def acquire_rate_limit(self):
+        # Called before every navigation, so the limiter gates the request itself
+        with self.pacer.measure("rate_limit", kind=SLEEP):
+            self.rate_limiter.acquire()
+
+    def iterate_jobs(self, batches, first_card=0):
+        # Each job with the rest of its batch, which is what tabs can prefetch. A resumed
+        # search starts its first batch at first_card, in the order the jobs are applied to
+        for batch in batches:
+            if self.relevance:
+                ranked = self.relevance.rank(batch, self.current_title)
+                self.outcomes["irrelevant"] += len(batch) - len(ranked)
+                batch = ranked
+            for position, job in enumerate(batch):
+                if position >= first_card:
+                    yield position, job, batch[position + 1:]
+            first_card = 0
+
+    @traced("fetch_jobs_over_http")
+    def fetch_jobs_over_http(self, search_url):
+        cookies, user_agent = browser_session_state(self.browser)
+        fetcher = JobFetcher(self.base_url, cookies, user_agent, concurrency=self.http_concurrency)
+        skip = self.ledger.should_skip if self.ledger else None
+        # One slot for the whole harvest; its requests are bounded by http_concurrency
+        # and a 429 or 999 backs the limiter off afterwards
+        self.acquire_rate_limit()
+        jobs = fetcher.harvest_sync(search_url, max_pages=self.harvester.max_pages, skip=skip)
+        self.harvested += fetcher.cards
+        if fetcher.statuses[429] or fetcher.statuses[999]:
+            log.warning(f"HTTP harvest was throttled: {dict(fetcher.statuses)}")
+            self.rate_limiter.report(CHALLENGE)
+        log.info(f"Fetched metadata for {len(jobs)} new jobs over HTTP")
+        return jobs
+
+    @traced("open_job")
+    def open_job(self, job):
+        if self.tab_pool:
+            # Usually prefetched, so the page is already loaded or loading
+            self.tab_pool.activate(job["job_id"], self.job_view_url(job))
+            self.pacer.dom_settled(name="job_details")
+            return
+
+        if "page_url" not in job:
+            # Harvested over HTTP, so there is no card on the current page
+            self.browser.get(self.job_view_url(job))
+            self.pacer.dom_settled(name="job_details")
+            return
+
+        if self.harvester.loaded_url != job["page_url"]:
+            # The browser was recycled since this page was harvested
+            self.harvester.load_page(job["page_url"])
+
+        card = self.browser.find_element(By.CSS_SELECTOR, f".job-card-container[data-job-id='{job['job_id']}']")
+
+        # Scroll the job into view
+        self.browser.execute_script("arguments[0].scrollIntoView(true);", card)
+        self.pacer.element_stable(card, name="card_scrolled")
+
+        def retry_click():
+            self.tracer.count("retries")
+            self.close_pop_ups()
+
+        self.rate_limiter.retry(
+            lambda: self.wait.until(EC.element_to_be_clickable(card)).click(),
+            ElementClickInterceptedException, on_retry=retry_click, name="Job card click",
+        )
+
+        # The details pane is filled from an XHR, so wait for the network rather than the DOM
+        self.pacer.network_idle(name="job_details")
+
+    def job_view_url(self, job):
+        return f"{self.base_url}/jobs/view/{job['job_id']}/"
+
+    def needs_browser(self, job):
+        # Jobs that can be settled from the ledger or their card alone
+        if self.ledger and self.ledger.should_skip(job["job_id"]):
+            return False
+        return not job.get("applied") and not (job.get("fetched") and job.get("easy_apply") is False)
 
-    def close_pop_ups(self):
+    def prefetch(self, upcoming):
+        if self.tab_pool:
+            self.tab_pool.prefetch((job for job in upcoming if self.needs_browser(job)), self.job_view_url)
+
+    @traced("apply_to_job")
+    def apply_to_job(self, job, upcoming=(), position=None):
+        job_id = job["job_id"]
         try:
-            # Close "Not interested" pop-up if present
-            not_interested_button = self.browser.find_elements(By.XPATH, "//button[contains(@aria-label, 'Dismiss')]")
-            if not_interested_button:
-                not_interested_button[0].click()
-                log.info("Closed 'Not interested' pop-up")
-                time.sleep(1)
-            
-            # Close any other potential pop-ups or overlays
-            overlay = self.browser.find_elements(By.XPATH, "//div[contains(@class, 'artdeco-modal-overlay')]")
-            if overlay:
-                close_button = self.browser.find_elements(By.XPATH, "//button[contains(@aria-label, 'Dismiss')]")
-                if close_button:
-                    close_button[0].click()
-                    log.info("Closed overlay pop-up")
-                    time.sleep(1)
-        
-        except Exception as e:
-            log.warning(f"Error while trying to close pop-ups: {e}")
+            if self.ledger and self.ledger.should_skip(job_id):
+                log.info(f"Job {job_id} already in ledger ({self.ledger.outcome(job_id)}), skipping")
+                self.outcomes["in_ledger"] += 1
+                return
+            if not self.claim_job(job_id):
+                log.info(f"Job {job_id} already claimed, skipping")
+                self.outcomes["duplicate"] += 1
+                return
+            self.application = {"started": time.monotonic(), "form_steps": 0, "answers": {}, "answers_used": 0}
+            if job.get("applied"):
+                log.info(f"Job {job_id} is marked as applied on its card")
+                self.record_outcome(job, "already_applied")
+                return
+            # Only an apply button without Easy Apply is proof; a page the parser could not read
+            # is checked in the browser before anything is written to the ledger
+            if job.get("fetched") and job.get("easy_apply") is False:
+                log.info(f"Job {job_id} only has an external apply button on its detail page")
+                self.record_outcome(job, "no_easy_apply")
+                return
 
-    def is_already_applied(self):
+            job_link = f"{self.base_url}/jobs/search/?currentJobId={job_id}"
+            log.info(f"Working on job link: {job_link}")
+            # Position in the order the batch is applied to, which relevance ranking can change
+            card_index = job["index"] if position is None else position
+            self.save_checkpoint(page=job.get("page", 0), card_index=card_index, job_id=job_id, step="open")
+            # Start loading the next jobs before this one occupies the foreground
+            self.prefetch(upcoming)
+            if self.recorder:
+                self.recorder.mark("application_start", job=job, answers=self.answers.answers if self.answers else {})
+            self.acquire_rate_limit()
+            self.open_job(job)
+
+            if not self.check_page_health():
+                return
+            if self.is_already_applied():
+                self.record_outcome(job, "already_applied")
+            else:
+                if not self.click_easy_apply():
+                    self.record_outcome(job, "no_easy_apply")
+                elif self.handle_application_process():
+                    self.record_outcome(job, "applied")
+                else:
+                    self.record_outcome(job, "failed")
+        finally:
+            # Every way out of here releases the job's tab, prefetched or not
+            if self.tab_pool:
+                self.tab_pool.release(job_id)
+
+        self.pacer.human_pause()
+
+    def record_outcome(self, job, outcome):
+        self.outcomes[outcome] += 1
+        self.last_outcome = outcome
+        if outcome == "applied":
+            self.tracer.count("applications")
+            self.rate_limiter.report(HEALTHY)
+        if outcome in ("applied", "failed"):
+            self.applications_since_launch += 1
+        if self.recorder:
+            if outcome == "failed":
+                self.recorder.snapshot(self.browser, "failed", job_id=job["job_id"])
+            self.recorder.mark("application_end", job_id=job["job_id"], outcome=outcome)
+        if self.ledger:
+            self.ledger.record(job["job_id"], outcome, title=job.get("title"), search=self.current_search)
+        if self.results:
+            started = self.application.get("started")
+            self.results.record(
+                job_id=job["job_id"], title=job.get("title"), company=job.get("company"),
+                location=job.get("location"), search=self.current_search, outcome=outcome,
+                form_steps=self.application.get("form_steps", 0),
+                answers_used=self.application.get("answers_used", 0),
+                answers=self.application.get("answers", {}), relevance=job.get("relevance"),
+                seconds=round(time.monotonic() - started, 3) if started else 0.0,
+            )
+        self.application = {}
+        self.save_checkpoint(step="done")
+
+    def save_checkpoint(self, **fields):
+        if self.checkpoint:
+            self.checkpoint.update(**fields)
+
+    def applied_today(self):
+        if self.ledger:
+            midnight = time.mktime(time.localtime()[:3] + (0, 0, 0, 0, 0, -1))
+            return self.ledger.applied_since(midnight)
+        return self.outcomes["applied"]
+
+    def quota_reached(self):
+        if self.daily_quota is None or self.applied_today() < self.daily_quota:
+            return False
+        log.info(f"Daily quota of {self.daily_quota} applications reached")
+        return True
+
+    def check_page_health(self, failure=None):
+        # Reports a challenge page, or the given failure signal, to the rate
+        # limiter and returns whether the current page can be worked on
+        if is_challenge_url(self.browser.current_url):
+            log.warning(f"LinkedIn challenge page at {self.browser.current_url}")
+            self.rate_limiter.report(CHALLENGE)
+            return False
+        if failure:
+            self.rate_limiter.report(failure)
+            return False
+        return True
+
+    def browser_alive(self):
         try:
-            applied_status = self.browser.find_element(By.XPATH, "//span[contains(@class, 'artdeco-inline-feedback__message') and contains(text(), 'Applied')]")
-            if applied_status:
-                log.info("Already applied to this job")
-                return True
-        except NoSuchElementException:
+            self.browser.execute_script("return 1;")
+            return True
+        except WebDriverException:
             return False
+
+    @traced("close_pop_ups")
+    def close_pop_ups(self):
+        # Only modals, overlays and toasts are dismissed, never the job cards' own dismiss buttons
+        controls = self.locators.probe(self.browser)
+        if controls.get("dismiss") and not controls.get("form"):
+            self.safe_click(controls["dismiss"])
+            log.info("Closed pop-up")
+
+    def is_already_applied(self):
+        if self.locators.probe(self.browser).get("applied"):
+            log.info("Already applied to this job")
+            return True
         return False
 
     def click_easy_apply(self):
         try:
-            easy_apply_button = self.wait.until(EC.element_to_be_clickable((By.XPATH, "//button[contains(@aria-label, 'Easy Apply to')]")))
+            easy_apply_button = self.wait.until(self.locators.clickable("easy_apply"))
             easy_apply_button.click()
             log.info("Clicked Easy Apply button")
             return True
@@ -200,156 +573,170 @@ class LinkedInLoginBot:
             log.warning("Easy Apply button not found")
             return False
 
+    @traced("handle_application_process")
     def handle_application_process(self):
         try:
+            if self.answers:
+                self.answers.discard()
             self.click_continue_applying()
             
+            step = 0
             while True:
+                step += 1
+                self.save_checkpoint(step=f"form {step}")
+                self.application["form_steps"] = step
+                if self.recorder:
+                    self.recorder.snapshot(self.browser, f"form {step}")
                 if not self.wait_for_form_elements(timeout=10):
                     log.warning("No new form elements loaded")
                     break
                 
-                form = self.browser.find_element(By.TAG_NAME, "form")
+                form = self.locators.find(self.browser, "form")
                 self.parse_and_fill_form(form)
                 
                 # Check if there's a resume upload option
-                upload_button = self.browser.find_elements(By.XPATH, "//label[contains(@class, 'jobs-document-upload__upload-button')]")
-                if upload_button:
+                if self.locators.find_all(self.browser, "resume_upload"):
                     self.upload_resume()
                 
                 if not self.click_next_or_submit():
                     break
             
-            self.handle_confirmation()
+            confirmed = self.handle_confirmation()
+            # Only answers from submitted applications are worth reusing
+            if self.answers and confirmed:
+                self.answers.commit()
+            return confirmed
             
         except Exception as e:
             log.error(f"Error in application process: {e}")
+            return False
 
     def click_continue_applying(self):
-        try:
-            continue_applying_button = WebDriverWait(self.browser, 5).until(
-                EC.element_to_be_clickable((By.XPATH, "//button[contains(@aria-label, 'Continue applying') or contains(text(), 'Continue applying')]"))
-            )
-            continue_applying_button.click()
+        # A saved draft opens on a "Continue applying" prompt instead of the form
+        controls = self.pacer.until("continue_applying", self.locators.probe_for("continue_applying", "form"), timeout=5)
+        if controls and controls["continue_applying"]:
+            self.safe_click(controls["continue_applying"])
             log.info("Clicked 'Continue applying' button")
-        except TimeoutException:
+        else:
             log.info("No 'Continue applying' button found, proceeding with application")
 
     def wait_for_form_elements(self, timeout=30):
-        try:
-            WebDriverWait(self.browser, timeout).until(
-                EC.presence_of_element_located((By.XPATH, "//form//input | //form//select | //form//textarea"))
-            )
-            WebDriverWait(self.browser, timeout).until_not(
-                EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'loading-spinner')]"))
-            )
-            return True
-        except TimeoutException:
+        if not self.pacer.until("form_elements", self.locators.present("form_control"), timeout=timeout):
             log.error("Form elements did not load within the expected time")
             return False
+        if not self.pacer.until("form_loading", self.locators.absent("loading_spinner"), timeout=timeout):
+            log.error("Form is still loading")
+            return False
+        return True
 
+    @traced("parse_and_fill_form")
     def parse_and_fill_form(self, form):
         try:
-            input_fields = form.find_elements(By.TAG_NAME, "input")
-            select_fields = form.find_elements(By.TAG_NAME, "select")
-            textarea_fields = form.find_elements(By.TAG_NAME, "textarea")
-            fieldset_elements = form.find_elements(By.TAG_NAME, "fieldset")
+            snapshot = take_form_snapshot(self.browser, form)
 
-            for fieldset in fieldset_elements:
-                time.sleep(2)
-                self.handle_radio_button_group(fieldset)
-                time.sleep(2)
+            for group in snapshot["fieldsets"]:
+                self.handle_radio_button_group(group)
 
-            for field in input_fields:
-                field_type = field.get_attribute("type")
-                field_id = field.get_attribute("id")
-                label = self.find_label_for_field(field)
+            for control in snapshot["inputs"]:
+                field = control["element"]
+                field_type = control["type"]
+                field_id = control["id"]
+                label = control["label"]
 
                 if field_type in ["text", "email", "tel"]:
-                    value = self.get_best_match_value(label)
-                    if value:
-                        self.handle_input_field(field, value)
-                    elif "city" in field_id.lower():
-                        value = self.resume_data.get("city", "New York")
-                        self.handle_input_field(field, value)
-                    else:
-                        self.handle_input_field(field, "Default Value")
+                    value = self.recall_answer(label) or self.get_best_match_value(label)
+                    guess = not value
+                    if guess:
+                        if "city" in field_id.lower():
+                            value = self.resume_data.get("city", "New York")
+                        else:
+                            value = "Default Value"
+                    self.handle_input_field(control, value)
+                    self.remember_answer(label, (), value, guess=guess)
                 elif field_type == "number":
-                    value = self.get_best_match_value(label)
-                    if value and value.isdigit():
-                        self.handle_input_field(field, value)
-                    elif label and "year" in label.lower():
-                        self.handle_input_field(field, str(random.randint(1, 10)))
-                    else:
-                        self.handle_input_field(field, "2")
+                    value = self.recall_answer(label) or self.get_best_match_value(label)
+                    guess = not (value and value.isdigit())
+                    if guess:
+                        if label and "year" in label.lower():
+                            value = str(random.randint(1, 10))
+                        else:
+                            value = "2"
+                    self.handle_input_field(control, value)
+                    self.remember_answer(label, (), value, guess=guess)
                 elif field_type in ["checkbox", "radio"]:
                     if label and ("agree" in label.lower() or "terms" in label.lower() or "conditions" in label.lower()):
                         self.safe_click(field)
                     else:
-                        value = self.get_best_match_value(label)
+                        value = self.recall_answer(label) or self.get_best_match_value(label)
                         if value and value.lower() == "yes":
                             self.safe_click(field)
+                            self.remember_answer(label, (), "Yes")
 
-            for field in select_fields:
-                select = Select(field)
-                options = select.options
+            for control in snapshot["selects"]:
+                options = control["options"]
                 if len(options) > 1:
-                    label = self.find_label_for_field(field)
-                    value = self.get_best_match_value(label)
-                    if value:
-                        best_option = max(options, key=lambda option: fuzz.ratio(option.text.lower(), value.lower()))
-                        select.select_by_visible_text(best_option.text)
+                    label = control["label"]
+                    stored = self.recall_answer(label, options)
+                    value = self.get_best_match_value(label) if stored is None else None
+                    if stored is not None:
+                        best_index = options.index(stored)
+                    elif value:
+                        best_index = self.option_ranker.best_index(value, options)
                     else:
-                        select.select_by_index(random.randint(1, len(options) - 1))
-
-            for field in textarea_fields:
-                label = self.find_label_for_field(field)
-                value = self.get_best_match_value(label)
-                if value:
-                    self.safe_send_keys(field, value)
-                else:
-                    self.safe_send_keys(field, "This is a default text for all textarea fields.")
+                        best_index = random.randint(1, len(options) - 1)
+                    select_option_by_index(self.browser, control["element"], best_index)
+                    self.remember_answer(label, options, options[best_index], guess=stored is None and not value)
+
+            for control in snapshot["textareas"]:
+                label = control["label"]
+                value = self.recall_answer(label) or self.get_best_match_value(label)
+                guess = not value
+                if guess:
+                    value = "This is a default text for all textarea fields."
+                self.safe_send_keys(control["element"], value)
+                self.remember_answer(label, (), value, guess=guess)
 
             log.info("Form filled successfully")
         except Exception as e:
             log.error(f"Error filling form: {e}")
 
-    def handle_radio_button_group(self, fieldset):
+    def handle_radio_button_group(self, group):
         try:
-            legend = fieldset.find_element(By.TAG_NAME, "legend")
-            question = legend.text.strip()
+            question = group["legend"]
             log.info(f"Handling radio button group: {question}")
 
-            options = fieldset.find_elements(By.XPATH, ".//input[@type='radio']")
-            labels = fieldset.find_elements(By.XPATH, ".//label")
+            options = group["radios"]
+            option_labels = [option["label"] or "" for option in options]
 
             # Check if any option is already selected
-            selected_option = fieldset.find_elements(By.XPATH, ".//input[@type='radio' and @checked]")
+            selected_option = [option for option in options if option["checked"]]
             if selected_option:
-                selected_label = self.find_label_for_field(selected_option[0])
-                log.info(f"Option already selected: {selected_label}")
+                log.info(f"Option already selected: {selected_option[0]['label']}")
                 return
 
-            best_match_value = self.get_best_match_value(question)
+            best_match_value = self.recall_answer(question, option_labels) or self.get_best_match_value(question)
             
             if best_match_value:
-                for option, label in zip(options, labels):
-                    if label.text.strip().lower() == best_match_value.lower():
-                        self.safe_click(option, wait_time=10)
-                        log.info(f"Selected option: {label.text}")
+                for option in options:
+                    if (option["label"] or "").lower() == best_match_value.lower():
+                        self.safe_click(option["element"], wait_time=10)
+                        self.remember_answer(question, option_labels, option["label"])
+                        log.info(f"Selected option: {option['label']}")
                         return
             
             # If no match found, select "Yes" if it's an option, otherwise select the first option
-            for option, label in zip(options, labels):
-                if label.text.strip().lower() == "yes":
-                    self.safe_click(option, wait_time=10)
+            for option in options:
+                if (option["label"] or "").lower() == "yes":
+                    self.safe_click(option["element"], wait_time=10)
+                    self.remember_answer(question, option_labels, option["label"], guess=True)
                     log.info("Selected 'Yes' option as default")
                     return
             
             # If "Yes" is not an option, select the first option
             if options:
-                self.safe_click(options[0], wait_time=10)
-                log.info(f"Selected first option: {labels[0].text}")
+                self.safe_click(options[0]["element"], wait_time=10)
+                self.remember_answer(question, option_labels, options[0]["label"], guess=True)
+                log.info(f"Selected first option: {options[0]['label']}")
 
         except Exception as e:
             log.error(f"Error handling radio button group: {e}")
@@ -371,10 +758,12 @@ class LinkedInLoginBot:
             else:
                 WebDriverWait(self.browser, wait_time).until(EC.element_to_be_clickable(element))
                 self.browser.execute_script("arguments[0].click();", element)
-            time.sleep(1)  # Add a small delay after clicking
+            self.pacer.human_pause()  # Add a small delay after clicking
             log.info(f"Successfully clicked element: {label or element}")
         except Exception as e:
             log.warning(f"Failed to click element: {e}")
+            if isinstance(e, TimeoutException):
+                self.rate_limiter.report(TIMEOUT)
             # Try an alternative method
             try:
                 self.browser.execute_script("arguments[0].dispatchEvent(new MouseEvent('click', { bubbles: true, cancelable: true, view: window }))", element)
@@ -382,45 +771,30 @@ class LinkedInLoginBot:
             except Exception as e2:
                 log.error(f"Alternative click method also failed: {e2}")
 
-    def find_label_for_field(self, field):
-        field_id = field.get_attribute("id")
-        if field_id:
-            try:
-                label = self.browser.find_element(By.XPATH, f"//label[@for='{field_id}']")
-                return label.text.strip()
-            except NoSuchElementException:
-                pass
+    def recall_answer(self, question, options=()):
+        answer = self.answers.lookup(question, options) if self.answers else None
+        if answer is not None and self.application:
+            self.application["answers_used"] += 1
+        return answer
 
-        try:
-            parent = field.find_element(By.XPATH, "..")
-            label = parent.find_element(By.TAG_NAME, "label")
-            return label.text.strip()
-        except NoSuchElementException:
-            return None
+    def remember_answer(self, question, options, answer, guess=False):
+        if self.application:
+            self.application["answers"][question] = answer
+        # Fallback guesses go into this application's results but never into the store,
+        # or the next form would recall them as if they were real answers
+        if self.answers and not guess:
+            self.answers.remember(question, options, answer)
 
     def get_best_match_value(self, label):
-        if not label:
-            return None
-
-        best_match = None
-        best_ratio = 0
-
-        for key, value in self.resume_data.items():
-            ratio = fuzz.token_set_ratio(key.lower(), label.lower())
-            if ratio > best_ratio:
-                best_ratio = ratio
-                best_match = value
+        return self.matcher.best_match(label)
 
-        log.info(f"Best match for '{label}': {best_match} (ratio: {best_ratio})")
-        return best_match if best_ratio > 70 else None
-
-    def handle_input_field(self, field, value):
+    def handle_input_field(self, control, value):
+        field = control["element"]
         try:
             self.safe_send_keys(field, value)
-            time.sleep(1)  # Wait for autocomplete to populate
 
             # Check if the field has autocomplete functionality
-            if field.get_attribute("role") == "combobox" and field.get_attribute("aria-autocomplete") == "list":
+            if control["role"] == "combobox" and control["aria_autocomplete"] == "list":
                 self.handle_autocomplete(field, value)
             else:
                 # If no autocomplete, just send an Enter key to confirm the input
@@ -432,19 +806,14 @@ class LinkedInLoginBot:
     def handle_autocomplete(self, field, value):
         try:
             # Wait for the autocomplete list to appear
-            WebDriverWait(self.browser, 5).until(
-                EC.presence_of_element_located((By.XPATH, "//ul[@role='listbox']/li"))
-            )
-
-            # Find all autocomplete options
-            options = self.browser.find_elements(By.XPATH, "//ul[@role='listbox']/li")
+            if not self.pacer.until("autocomplete", self.locators.present("listbox_option"), timeout=5):
+                raise TimeoutException("autocomplete list did not appear")
 
+            # Read every option's text in one call and click the closest match
+            options = listbox_options(self.browser)
             if options:
-                # Find the closest match
-                best_match = max(options, key=lambda option: fuzz.ratio(option.text.lower(), value.lower()))
-                
-                # Click the best match
-                self.safe_click(best_match)
+                best_index = self.option_ranker.best_index(value, [option["text"] for option in options]) or 0
+                self.safe_click(options[best_index]["element"])
             else:
                 # If no options found, just confirm the input
                 field.send_keys(Keys.ENTER)
@@ -455,126 +824,125 @@ class LinkedInLoginBot:
         except Exception as e:
             log.warning(f"Failed to handle autocomplete: {e}")
 
+    @traced("click_next_or_submit")
     def click_next_or_submit(self):
-        try:
-            self.browser.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
-
-            button_xpath = "//button[contains(text(), 'Next') or contains(text(), 'Continue') or contains(text(), 'Review') or contains(text(), 'Submit') or contains(text(), 'Apply') or contains(@aria-label, 'Continue to next step') or contains(@aria-label, 'Review your application') or contains(@aria-label, 'Submit application')]"
-            
-            button = WebDriverWait(self.browser, 10).until(
-                EC.element_to_be_clickable((By.XPATH, button_xpath))
-            )
-            
-            self.browser.execute_script("arguments[0].scrollIntoView(true);", button)
-            time.sleep(1)
-            
-            button_text = button.text.lower()
-            if 'review' in button_text:
-                log.info("Clicked 'Review' button")
-            elif 'submit' in button_text or 'apply' in button_text:
-                log.info("Clicked 'Submit' button")
-                self.safe_click(button)
-                return False
-            else:
-                log.info("Clicked 'Next' button")
-            
-            self.safe_click(button)
-            return True
-
-        except (TimeoutException, ElementClickInterceptedException):
+        controls = self.pacer.until("form_buttons", self.locators.probe_for("submit", "review", "next"), timeout=10)
+        if not controls:
             log.error("Could not find 'Next', 'Review', or 'Submit' button")
             return False
 
+        for kind in ("submit", "review", "next"):
+            button = controls[kind]
+            if button:
+                break
+        self.browser.execute_script("arguments[0].scrollIntoView({block: 'center'});", button)
+        self.pacer.element_stable(button, name="button_scrolled")
+        self.safe_click(button)
+        log.info(f"Clicked '{kind.capitalize()}' button")
+        # Submitting ends the form steps
+        return kind != "submit"
+
+    @traced("handle_confirmation")
     def handle_confirmation(self):
-        try:
-            # Wait for the confirmation message
-            confirmation = WebDriverWait(self.browser, 10).until(
-                EC.presence_of_element_located((By.XPATH, "//h3[contains(text(), 'Your application was sent')]"))
-            )
-            log.info("Application confirmation received")
-            
-            # Try to close the confirmation modal using various methods
-            dismiss_methods = [
-                self.dismiss_by_aria_label,
-                self.dismiss_by_id,
-                self.dismiss_by_javascript
-            ]
-            
-            for method in dismiss_methods:
-                if method():
-                    log.info(f"Closed confirmation modal using {method.__name__}")
-                    break
-            else:
-                log.warning("Could not close the confirmation modal")
-
-            # Wait for the modal to disappear
-            WebDriverWait(self.browser, 10).until(
-                EC.invisibility_of_element_located((By.XPATH, "//div[contains(@class, 'artdeco-modal-overlay')]"))
-            )
-            log.info("Confirmation modal closed")
-
-        except TimeoutException:
-            log.warning("Confirmation message or dismiss button not found")
-
-    def dismiss_by_aria_label(self):
-        try:
-            dismiss_button = WebDriverWait(self.browser, 5).until(
-                EC.element_to_be_clickable((By.XPATH, "//button[@aria-label='Dismiss']"))
-            )
-            self.safe_click(dismiss_button)
-            return True
-        except TimeoutException:
+        controls = self.pacer.until("confirmation", self.locators.probe_for("confirmation"), timeout=10)
+        if not controls:
+            log.warning("Confirmation message not found")
             return False
 
-    def dismiss_by_id(self):
-        try:
-            dismiss_button = WebDriverWait(self.browser, 5).until(
-                EC.element_to_be_clickable((By.ID, "ember1456"))
-            )
-            self.safe_click(dismiss_button)
-            return True
-        except TimeoutException:
-            return False
-
-    def dismiss_by_javascript(self):
-        try:
-            self.browser.execute_script("""
-                const button = document.querySelector('button[aria-label="Dismiss"]');
-                if (button) {
-                    button.click();
-                    return true;
-                }
-                return false;
-            """)
+        log.info("Application confirmation received")
+        if not controls["dismiss"]:
+            log.warning("Could not close the confirmation modal")
             return True
-        except Exception:
-            return False
+        self.safe_click(controls["dismiss"])
+        if self.pacer.until("confirmation_closed", self.locators.absent("modal_overlay"), timeout=10):
+            log.info("Confirmation modal closed")
+        return True
 
+    @traced("upload_resume")
     def upload_resume(self):
         try:
-            upload_button = self.wait.until(EC.presence_of_element_located((By.XPATH, "//label[contains(@class, 'jobs-document-upload__upload-button')]")))
+            upload_button = self.locators.find(self.browser, "resume_upload")
             
             input_id = upload_button.get_attribute("for")
             file_input = self.browser.find_element(By.ID, input_id)
             
             file_input.send_keys(self.resume_path)
             
-            self.wait.until(EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'jobs-document-upload__uploaded-item')]")))
+            if not self.pacer.until("resume_uploaded", self.locators.present("uploaded_resume"), timeout=30):
+                raise TimeoutException("uploaded resume did not appear")
+            # The file is still being sent after its name shows up
+            self.pacer.network_idle(name="resume_upload_sent", timeout=30)
             
             log.info(f"Resume uploaded successfully: {self.resume_path}")
         except Exception as e:
             log.error(f"Error uploading resume: {e}")
 
+    def run_batch(self, searches, max_restarts=3, login=True):
+        # login=False when the caller already started this browser, e.g. a pool worker between searches
+        searches = [tuple(search) for search in searches]
+        batch = batch_id(searches)
+        if login:
+            self.start_linkedin()
+
+        restarts = 0
+        while True:
+            try:
+                self.resume_searches(searches, batch)
+                break
+            except WebDriverException as e:
+                if restarts >= max_restarts:
+                    log.error(f"Giving up after {restarts} browser restarts: {e.msg}")
+                    raise
+                restarts += 1
+                log.error(f"Browser failure ({e.msg}), restarting from checkpoint ({restarts}/{max_restarts})")
+                self.recycle_browser()
+
+        if self.checkpoint:
+            self.checkpoint.clear()
+
+    def resume_searches(self, searches, batch):
+        search_index, first_page, first_card, interrupted_job = (0, 0, 0, None)
+        if self.checkpoint:
+            search_index, first_page, first_card, interrupted_job = self.checkpoint.resume_point(batch)
+            if search_index or first_page or first_card:
+                log.info(f"Resuming from checkpoint: {self.checkpoint.describe()}")
+            if interrupted_job and self.checkpoint.state.get("step") == "done":
+                # The last job was finished, so start after it
+                first_card += 1
+            elif interrupted_job and self.ledger:
+                # Count the crash against the job so one bad posting cannot loop forever
+                self.ledger.record(interrupted_job, FAILED, search=self.checkpoint.state.get("search"))
+
+        for index in range(search_index, len(searches)):
+            if self.quota_reached():
+                break
+            job_title, location = searches[index]
+            page, card = (first_page, first_card) if index == search_index else (0, 0)
+            self.save_checkpoint(batch=batch, search_index=index, search=f"{job_title} | {location}", page=page,
+                                 card_index=card, job_id=None, step="search")
+            self.search_jobs(job_title, location, page, card)
+
     def run_job_application_process(self, job_title: str, location: str):
-        self.start_linkedin()
-        self.search_jobs(job_title, location)
+        try:
+            self.run_batch([(job_title, location)])
+        finally:
+            log.info(f"Rate limiter: {self.rate_limiter.summary()}")
+            if self.tab_pool:
+                log.info(f"Tab pool: {self.tab_pool.summary()}")
+            self.pacer.log_summary()
+            self.tracer.log_summary()
+            self.tracer.close()
+            # Also on a crash: flushes the queued result rows and writes the recording's gzip trailer
+            if self.recorder:
+                self.recorder.close()
+            if self.results:
+                self.results.close()
 
 
 
 if __name__ == '__main__':
-    username = "email"
-    password = "pass"
+    username = os.environ.get("LINKEDIN_USERNAME", "email")
+    password = os.environ.get("LINKEDIN_PASSWORD", "pass")
     
     resume_data = {
         "first name": "Shine",
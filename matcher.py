@@ -0,0 +1,110 @@
+import logging
+from collections import Counter, defaultdict
+from functools import lru_cache
+
+from fuzzywuzzy import fuzz, utils
+
+log = logging.getLogger(__name__)
+
+MATCH_THRESHOLD = 70
+
+
+def normalize_text(text):
+    # Same normalization fuzz.token_set_ratio applies internally
+    return utils.full_process(text.lower(), force_ascii=True)
+
+
+class ResumeMatcher:
+    """Maps form labels to resume values with the same scoring as a full
+    fuzz.token_set_ratio scan over resume_data, but only scores keys that
+    can still beat the threshold.
+
+    key_tokens maps keys to tokens normalized ahead of time, such as those
+    stored in a compiled resume profile; other keys are normalized here."""
+
+    def __init__(self, resume_data: dict, threshold: int = MATCH_THRESHOLD, cache_size: int = 4096,
+                 key_tokens=None) -> None:
+        self.threshold = threshold
+        self.keys = list(resume_data.keys())
+        self.values = list(resume_data.values())
+        self.tokens = []
+        self.joined = []
+        self.char_counts = []
+        self.token_index = defaultdict(list)
+
+        for index, key in enumerate(self.keys):
+            if key_tokens and key in key_tokens:
+                tokens = set(key_tokens[key])
+            else:
+                tokens = set(normalize_text(key).split())
+            joined = " ".join(sorted(tokens))
+            self.tokens.append(tokens)
+            self.joined.append(joined)
+            self.char_counts.append(Counter(joined))
+            for token in tokens:
+                self.token_index[token].append(index)
+
+        self._lookup = lru_cache(maxsize=cache_size)(self._best_match)
+
+    def best_match(self, label):
+        if not label:
+            return None
+        return self._lookup(label)
+
+    def cache_info(self):
+        return self._lookup.cache_info()
+
+    def _best_match(self, label):
+        processed = normalize_text(label)
+        if not processed:
+            return None
+
+        label_tokens = set(processed.split())
+        label_joined = " ".join(sorted(label_tokens))
+        label_counts = Counter(label_joined)
+
+        # Keys sharing at least one token with the label
+        shortlist = set()
+        for token in label_tokens:
+            shortlist.update(self.token_index.get(token, ()))
+
+        best_index = None
+        best_ratio = 0
+        for index in range(len(self.keys)):
+            if index not in shortlist and not self._may_exceed(index, label_joined, label_counts):
+                continue
+            ratio = self._token_set_ratio(index, label_tokens)
+            if ratio > best_ratio:
+                best_ratio = ratio
+                best_index = index
+
+        best_match = self.values[best_index] if best_index is not None else None
+        log.info(f"Best match for '{label}': {best_match} (ratio: {best_ratio})")
+        return best_match if best_ratio > self.threshold else None
+
+    def _may_exceed(self, index, label_joined, label_counts):
+        # Without shared tokens token_set_ratio reduces to fuzz.ratio of the
+        # sorted token strings, which is bounded by the characters they share.
+        total = len(self.joined[index]) + len(label_joined)
+        if total == 0:
+            return False
+        if round(200 * min(len(self.joined[index]), len(label_joined)) / total) <= self.threshold:
+            return False
+        common = sum((self.char_counts[index] & label_counts).values())
+        return round(200 * common / total) > self.threshold
+
+    def _token_set_ratio(self, index, label_tokens):
+        # fuzz.token_set_ratio(key, label) on pre-tokenized input
+        key_tokens = self.tokens[index]
+        if not key_tokens or not label_tokens:
+            return 0
+
+        sorted_sect = " ".join(sorted(key_tokens & label_tokens))
+        combined_1to2 = (sorted_sect + " " + " ".join(sorted(key_tokens - label_tokens))).strip()
+        combined_2to1 = (sorted_sect + " " + " ".join(sorted(label_tokens - key_tokens))).strip()
+
+        return max(
+            fuzz.ratio(sorted_sect, combined_1to2),
+            fuzz.ratio(sorted_sect, combined_2to1),
+            fuzz.ratio(combined_1to2, combined_2to1),
+        )
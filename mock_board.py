@@ -0,0 +1,91 @@
+import argparse
+import logging
+import os
+import re
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+log = logging.getLogger(__name__)
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "mock_board")
+
+# LinkedIn paths the bot navigates to, mapped onto static fixture pages
+ROUTES = {
+    "/login": "login.html",
+    "/feed/": "feed.html",
+    "/jobs/search/": "search.html",
+}
+
+JOB_VIEW_PATH = re.compile(r"^/jobs/view/(\d+)/?$")
+GUEST_SEARCH_PATH = "/jobs-guest/jobs/api/seeMoreJobPostings/search"
+GUEST_SEARCH_STARTS = (0, 10)
+RECORDED_JOB_ID = re.compile(r"\b41000000\d\d\b")
+
+
+class MockBoardHandler(SimpleHTTPRequestHandler):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, directory=FIXTURES_DIR, **kwargs)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        match = JOB_VIEW_PATH.match(url.path)
+        if match:
+            # Recorded job pages; every fifth job ID has no Easy Apply, as on the search page
+            job_id = match.group(1)
+            page = "job_view_external.html" if int(job_id) % 5 == 0 else "job_view.html"
+            return self.send_recorded(page, {"{{job_id}}": job_id})
+        if url.path == GUEST_SEARCH_PATH:
+            # Two pages of 10 cards, the second being the recorded one with its job IDs moved up
+            # by 10; later offsets are empty like the real endpoint
+            start = int(parse_qs(url.query).get("start", ["0"])[0])
+            if start not in GUEST_SEARCH_STARTS:
+                return self.send_recorded(None)
+            return self.send_recorded("guest_search.html", shift_job_ids=start)
+        return super().do_GET()
+
+    def send_recorded(self, name, replacements=None, shift_job_ids=0):
+        body = ""
+        if name:
+            with open(os.path.join(FIXTURES_DIR, "recorded", name)) as f:
+                body = f.read()
+        for old, new in (replacements or {}).items():
+            body = body.replace(old, new)
+        if shift_job_ids:
+            body = RECORDED_JOB_ID.sub(lambda match: str(int(match.group(0)) + shift_job_ids), body)
+        data = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def translate_path(self, path):
+        route = ROUTES.get(urlparse(path).path)
+        if route:
+            return os.path.join(FIXTURES_DIR, route)
+        return super().translate_path(path)
+
+    def log_message(self, format, *args):
+        log.debug(format % args)
+
+
+def serve_in_thread(port=0):
+    # Returns the running server and its base URL; port 0 picks a free port
+    server = ThreadingHTTPServer(("127.0.0.1", port), MockBoardHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    log.info(f"Mock job board serving {FIXTURES_DIR} at {base_url}")
+    return server, base_url
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Serve a static mock of the LinkedIn pages the bot uses")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), MockBoardHandler)
+    log.info(f"Mock job board at http://127.0.0.1:{args.port} (pass it as base_url)")
+    server.serve_forever()
@@ -0,0 +1,64 @@
+import logging
+from functools import lru_cache
+
+try:
+    from rapidfuzz import fuzz as rapid_fuzz, process
+except ImportError:
+    process = None
+from fuzzywuzzy import fuzz
+
+log = logging.getLogger(__name__)
+
+# Text and element of every entry in the open autocomplete list, in one round trip
+LISTBOX_OPTIONS_SCRIPT = """
+return Array.from(document.querySelectorAll("ul[role='listbox'] > li"))
+    .map(li => ({element: li, text: (li.innerText || li.textContent || '').trim()}));
+"""
+
+
+def listbox_options(browser):
+    return browser.execute_script(LISTBOX_OPTIONS_SCRIPT)
+
+
+class OptionRanker:
+    """Ranks the options of a dropdown or autocomplete list against a value
+    by fuzz.ratio of the lowercased texts.
+
+    All options are scored in one batch call, with rapidfuzz when it is
+    installed and fuzzywuzzy otherwise. Rankings are cached per (value,
+    options) so lists that come back on every application, such as country
+    codes, are only scored once."""
+
+    def __init__(self, cache_size: int = 512) -> None:
+        self.backend = "rapidfuzz" if process else "fuzzywuzzy"
+        self._rank = lru_cache(maxsize=cache_size)(self._rank_options)
+
+    def rank(self, value, options):
+        # [(index, score)] best first; ties keep the list order
+        if not value or not options:
+            return []
+        return self._rank(value, tuple(options))
+
+    def best_index(self, value, options):
+        ranking = self.rank(value, options)
+        if not ranking:
+            return None
+        index, score = ranking[0]
+        log.info(f"Best option for '{value}': {options[index]} (ratio: {score:.0f}, {len(options)} options)")
+        return index
+
+    def cache_info(self):
+        return self._rank.cache_info()
+
+    def _rank_options(self, value, options):
+        query = value.lower()
+        if process:
+            scored = [
+                (index, score)
+                for _, score, index in process.extract(
+                    query, [option.lower() for option in options], scorer=rapid_fuzz.ratio, limit=None
+                )
+            ]
+        else:
+            scored = [(index, fuzz.ratio(option.lower(), query)) for index, option in enumerate(options)]
+        return tuple(sorted(scored, key=lambda item: (-item[1], item[0])))
@@ -0,0 +1,167 @@
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import re
+import time
+from collections import Counter
+
+log = logging.getLogger(__name__)
+
+# Bot arguments that are derived per account and cannot be overridden
+ACCOUNT_PATHS = ("profile_dir", "session_dir", "ledger_path", "answers_path", "checkpoint_path", "trace_dir",
+                 "results_dir")
+
+
+def account_slug(name):
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", name).strip("_") or "account"
+
+
+def account_dir(root, account):
+    return os.path.join(root, account_slug(account.get("name") or account["username"]))
+
+
+def account_bot_kwargs(account, defaults, root):
+    # LinkedInLoginBot arguments for one account, with all state kept under its own directory
+    directory = account_dir(root, account)
+    password = account.get("password")
+    if password is None and account.get("password_env"):
+        password = os.environ.get(account["password_env"])
+    if password is None:
+        raise ValueError(f"No password for account {account.get('name') or account['username']}")
+
+    kwargs = dict(defaults, **account.get("bot", {}))
+    for key in ACCOUNT_PATHS:
+        kwargs.pop(key, None)
+    kwargs.update(
+        username=account["username"],
+        password=password,
+        resume_data=account.get("resume_data", {}),
+        job_filters=account.get("job_filters", {}),
+        resume_path=account["resume_path"],
+        daily_quota=account.get("daily_quota"),
+        profile_dir=os.path.join(directory, "chrome"),
+        session_dir=os.path.join(directory, "sessions"),
+        ledger_path=os.path.join(directory, "applied_jobs.db"),
+        answers_path=os.path.join(directory, "answers.json"),
+        checkpoint_path=os.path.join(directory, "checkpoint.json"),
+        trace_dir=os.path.join(directory, "traces"),
+        results_dir=os.path.join(directory, "results"),
+    )
+    return kwargs
+
+
+def _run_account(task):
+    account, defaults, root = task
+    # Imported here so the orchestrator process never needs a browser
+    from main import LinkedInLoginBot
+    from rate_limiter import AdaptiveRateLimiter
+
+    name = account.get("name") or account["username"]
+    logging.basicConfig(level=logging.INFO, format=f"[{name}] %(levelname)s %(name)s: %(message)s", force=True)
+    report = {"account": name, "searches": len(account.get("searches", [])), "quota": account.get("daily_quota")}
+    start = time.monotonic()
+    bot = None
+    try:
+        kwargs = account_bot_kwargs(account, defaults, root)
+        os.makedirs(kwargs["profile_dir"], exist_ok=True)
+        if account.get("max_per_minute"):
+            kwargs["rate_limiter"] = AdaptiveRateLimiter(account["max_per_minute"], account=account["username"])
+        bot = LinkedInLoginBot(**kwargs)
+        if bot.quota_reached():
+            report["status"] = "quota_reached"
+        else:
+            bot.run_batch(account.get("searches", []))
+            report["status"] = "quota_reached" if bot.quota_reached() else "completed"
+    except Exception as e:
+        log.error(f"Account {name} stopped: {e}")
+        report["status"] = "error"
+        report["error"] = str(e)
+    finally:
+        if bot:
+            report["outcomes"] = dict(bot.outcomes)
+            report["applied_today"] = bot.applied_today()
+            report["rate_limiter"] = bot.rate_limiter.summary()
+            try:
+                bot.browser.quit()
+            except Exception as e:
+                log.warning(f"Error while closing browser: {e}")
+            bot.tracer.close()
+            if bot.results:
+                bot.results.close()
+            if bot.ledger:
+                bot.ledger.close()
+    report["seconds"] = round(time.monotonic() - start, 1)
+    return report
+
+
+class AccountOrchestrator:
+    """Runs the searches of many candidate accounts on a bounded pool of
+    browser processes.
+
+    Each account has its own resume, filters, searches and daily quota, and
+    all of its state (Chrome profile, session, ledger, answers, checkpoint,
+    traces and results) lives under root/<account name>. An account is
+    handled by one worker at a time; a worker process is started per
+    account so no browser or cookie state is shared between candidates."""
+
+    def __init__(self, accounts: list, defaults=None, workers: int = 2, root: str = "accounts") -> None:
+        names = [account_slug(account.get("name") or account["username"]) for account in accounts]
+        duplicates = [name for name, count in Counter(names).items() if count > 1]
+        if duplicates:
+            raise ValueError(f"Duplicate account names: {', '.join(duplicates)}")
+        self.accounts = accounts
+        self.defaults = defaults or {}
+        self.workers = max(1, min(workers, len(accounts) or 1))
+        self.root = root
+        # Spawn so each account starts with a clean interpreter and its own driver
+        self.context = multiprocessing.get_context("spawn")
+
+    @classmethod
+    def from_config(cls, path, workers=None):
+        with open(path) as f:
+            config = json.load(f)
+        return cls(config["accounts"], defaults=config.get("defaults"),
+                   workers=workers or config.get("workers", 2), root=config.get("root", "accounts"))
+
+    def run(self):
+        log.info(f"Running {len(self.accounts)} accounts on {self.workers} workers (state in {self.root})")
+        start = time.monotonic()
+        reports = []
+        with self.context.Pool(self.workers, maxtasksperchild=1) as pool:
+            tasks = [(account, self.defaults, self.root) for account in self.accounts]
+            for report in pool.imap_unordered(_run_account, tasks):
+                log.info(f"Account {report['account']}: {report['status']} {report.get('outcomes', {})}")
+                reports.append(report)
+
+        result = {"elapsed": round(time.monotonic() - start, 1), "workers": self.workers, "accounts": reports}
+        os.makedirs(self.root, exist_ok=True)
+        report_path = os.path.join(self.root, f"report-{time.strftime('%Y%m%d-%H%M%S')}.json")
+        with open(report_path, "w") as f:
+            json.dump(result, f, indent=2)
+        log.info(f"Wrote account report to {report_path}")
+        return result
+
+
+def print_report(result):
+    print(f"{'account':<24} {'status':<14} {'applied':>8} {'today':>6} {'quota':>6} {'failed':>7} {'seconds':>8}")
+    for report in result["accounts"]:
+        outcomes = report.get("outcomes", {})
+        print(
+            f"{report['account']:<24} {report['status']:<14} {outcomes.get('applied', 0):>8} "
+            f"{str(report.get('applied_today', '-')):>6} {str(report['quota'] or '-'):>6} "
+            f"{outcomes.get('failed', 0):>7} {report['seconds']:>8}"
+        )
+        if report.get("error"):
+            print(f"    error: {report['error']}")
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Run job searches for many LinkedIn accounts")
+    parser.add_argument("config", help="JSON file with 'accounts' and optional 'defaults', 'workers' and 'root'")
+    parser.add_argument("--workers", type=int, default=None, help="Concurrent browser workers")
+    args = parser.parse_args()
+
+    print_report(AccountOrchestrator.from_config(args.config, workers=args.workers).run())
@@ -0,0 +1,204 @@
+import logging
+import random
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+from selenium.common.exceptions import (
+    NoSuchElementException, StaleElementReferenceException, TimeoutException, WebDriverException,
+)
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from tracing import SLEEP, WAIT
+
+log = logging.getLogger(__name__)
+
+# Installs (once per document) a MutationObserver and fetch/XHR counters and
+# reports how long the DOM and the network have been quiet.
+ACTIVITY_SCRIPT = """
+if (!window.__pacer) {
+    const state = { lastMutation: performance.now(), inflight: 0, lastNetwork: 0 };
+    new MutationObserver(() => { state.lastMutation = performance.now(); })
+        .observe(document, { childList: true, subtree: true, attributes: true, characterData: true });
+    const done = () => { state.inflight = Math.max(0, state.inflight - 1); state.lastNetwork = performance.now(); };
+    if (window.fetch) {
+        const fetch = window.fetch;
+        window.fetch = function () {
+            state.inflight++;
+            return fetch.apply(this, arguments).finally(done);
+        };
+    }
+    const send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        state.inflight++;
+        this.addEventListener('loadend', done);
+        return send.apply(this, arguments);
+    };
+    window.__pacer = state;
+}
+const state = window.__pacer;
+const now = performance.now();
+const resources = performance.getEntriesByType('resource');
+const lastResource = resources.length ? Math.max(...resources.map(r => r.responseEnd)) : 0;
+return {
+    ready: document.readyState,
+    since_mutation: now - state.lastMutation,
+    inflight: state.inflight,
+    since_network: now - Math.max(state.lastNetwork, lastResource),
+};
+"""
+
+RECT_SCRIPT = """
+const r = arguments[0].getBoundingClientRect();
+return [r.x, r.y, r.width, r.height];
+"""
+
+
+class Pacer:
+    """Replaces fixed sleeps with readiness conditions and keeps a small
+    randomized pause between actions so the bot does not act instantly."""
+
+    def __init__(self, browser, jitter=(0.2, 0.6), timeout=10, poll_interval=0.1, tracer=None,
+                 recheck_interval=0.5) -> None:
+        self.browser = browser
+        self.tracer = tracer
+        self.jitter = jitter
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.recheck_interval = recheck_interval
+        self.stats = defaultdict(lambda: {"count": 0, "seconds": 0.0, "max": 0.0, "timeouts": 0})
+
+    @contextmanager
+    def measure(self, name, kind=WAIT):
+        start = time.perf_counter()
+        timeout = None
+        try:
+            yield
+        except TimeoutException as e:
+            timeout = e
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            entry = self.stats[name]
+            entry["count"] += 1
+            entry["seconds"] += elapsed
+            entry["max"] = max(entry["max"], elapsed)
+            entry["timeouts"] += timeout is not None
+            if self.tracer:
+                self.tracer.record(name, elapsed, kind, timed_out=timeout is not None)
+                self.tracer.count("sleeps" if kind == SLEEP else "waits")
+                if timeout:
+                    self.tracer.count_timeout(timeout)
+
+    def human_pause(self, name="jitter"):
+        low, high = self.jitter
+        if high <= 0:
+            return
+        with self.measure(name, kind=SLEEP):
+            time.sleep(random.uniform(low, high))
+
+    def until(self, name, condition, timeout=None):
+        try:
+            with self.measure(name):
+                if hasattr(self.browser, "wait_for_change"):
+                    return self._until_changed(condition, timeout or self.timeout)
+                return WebDriverWait(
+                    self.browser,
+                    timeout or self.timeout,
+                    poll_frequency=self.poll_interval,
+                    ignored_exceptions=(StaleElementReferenceException,),
+                ).until(condition)
+        except TimeoutException:
+            log.warning(f"Pacing condition '{name}' not met within {timeout or self.timeout}s")
+            return False
+
+    def _until_changed(self, condition, timeout):
+        # Event-driven drivers (CDPWebDriver) re-check the condition when the
+        # DOM changes instead of on a timer; recheck_interval bounds the wait
+        # for conditions that change without a mutation, such as elapsed time
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                value = condition(self.browser)
+                if value:
+                    return value
+            except (NoSuchElementException, StaleElementReferenceException):
+                # Ignored like in WebDriverWait, so a missing element ends in a timeout
+                pass
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutException()
+            self.browser.wait_for_change(min(remaining, self.recheck_interval))
+
+    def _activity(self, driver):
+        try:
+            return driver.execute_script(ACTIVITY_SCRIPT)
+        except WebDriverException:
+            # Navigation in progress
+            return None
+
+    def _native(self, name, wait, timeout):
+        # Waits the driver implements itself from browser events
+        timeout = timeout or self.timeout
+        try:
+            with self.measure(name):
+                if not wait(timeout):
+                    raise TimeoutException()
+                return True
+        except TimeoutException:
+            log.warning(f"Pacing condition '{name}' not met within {timeout}s")
+            return False
+
+    def dom_settled(self, quiet=0.5, timeout=None, name="dom_settled"):
+        if hasattr(self.browser, "dom_settled"):
+            return self._native(name, lambda limit: self.browser.dom_settled(quiet, limit), timeout)
+
+        def settled(driver):
+            activity = self._activity(driver)
+            return bool(activity) and activity["ready"] != "loading" and activity["since_mutation"] >= quiet * 1000
+
+        return self.until(name, settled, timeout)
+
+    def network_idle(self, idle=0.5, timeout=None, name="network_idle"):
+        if hasattr(self.browser, "network_idle"):
+            return self._native(name, lambda limit: self.browser.network_idle(idle, limit), timeout)
+
+        def idle_for(driver):
+            activity = self._activity(driver)
+            return (
+                bool(activity)
+                and activity["ready"] == "complete"
+                and activity["inflight"] == 0
+                and activity["since_network"] >= idle * 1000
+            )
+
+        return self.until(name, idle_for, timeout)
+
+    def element_present(self, locator, timeout=None, name="element_present"):
+        return self.until(name, EC.presence_of_element_located(locator), timeout)
+
+    def element_stable(self, element, timeout=None, name="element_stable"):
+        # Stable once its bounding box stops moving between two polls
+        last = {"rect": None}
+
+        def stable(driver):
+            rect = driver.execute_script(RECT_SCRIPT, element)
+            unchanged = rect == last["rect"]
+            last["rect"] = rect
+            return unchanged
+
+        return self.until(name, stable, timeout)
+
+    def summary(self):
+        return {name: dict(entry) for name, entry in sorted(self.stats.items())}
+
+    def log_summary(self):
+        total = 0.0
+        for name, entry in self.summary().items():
+            total += entry["seconds"]
+            log.info(
+                f"Pacing {name}: {entry['count']} waits, {entry['seconds']:.2f}s total, "
+                f"{entry['max']:.2f}s max, {entry['timeouts']} timeouts"
+            )
+        log.info(f"Pacing total: {total:.2f}s")
@@ -0,0 +1,136 @@
+import logging
+import random
+import time
+from collections import Counter
+from contextlib import nullcontext
+
+log = logging.getLogger(__name__)
+
+# Signals reported by the bot after each page or action
+HEALTHY = "healthy"
+EMPTY = "empty"
+TIMEOUT = "timeout"
+CHALLENGE = "challenge"
+
+# Where LinkedIn sends sessions it wants to verify or has locked
+CHALLENGE_URL_MARKERS = ("/checkpoint/challenge", "/checkpoint/lg/", "/authwall", "/uas/login-submit", "captcha")
+
+
+def is_challenge_url(url):
+    return any(marker in (url or "").lower() for marker in CHALLENGE_URL_MARKERS)
+
+
+class AdaptiveRateLimiter:
+    """Spaces the actions of one worker and backs off when LinkedIn pushes back.
+
+    The gap between actions is the larger of the configured pace
+    (60 / max_per_minute) and a backoff interval. Empty result pages and
+    repeated timeouts double the backoff, up to max_backoff seconds, and a
+    challenge page also pauses the account for a cooldown that doubles with
+    every challenge in a row. Each run of recovery_after healthy signals
+    halves the backoff again until the configured pace is reached.
+
+    Workers sharing an account pass the same account_state (a Manager dict)
+    and account_lock, so the account-wide pace and any challenge pause apply
+    to all of them."""
+
+    def __init__(self, max_per_minute=None, account=None, account_per_minute=None, account_state=None,
+                 account_lock=None, min_backoff: float = 5.0, max_backoff: float = 600.0, factor: float = 2.0,
+                 timeout_threshold: int = 3, recovery_after: int = 5, challenge_cooldown: float = 900.0,
+                 max_cooldown: float = 4 * 3600.0) -> None:
+        self.base_interval = 60.0 / max_per_minute if max_per_minute else 0.0
+        self.account = account or "default"
+        self.account_interval = 60.0 / account_per_minute if account_per_minute else 0.0
+        self.account_state = account_state if account_state is not None else {}
+        self.account_lock = account_lock or nullcontext()
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self.factor = factor
+        self.timeout_threshold = timeout_threshold
+        self.recovery_after = recovery_after
+        self.challenge_cooldown = challenge_cooldown
+        self.max_cooldown = max_cooldown
+
+        self.backoff = 0.0
+        self.next_slot = 0.0
+        self.consecutive = Counter()
+        self.signals = Counter()
+        self.seconds_waited = 0.0
+
+    @property
+    def interval(self):
+        return max(self.base_interval, self.backoff)
+
+    def per_minute(self):
+        return 60.0 / self.interval if self.interval else None
+
+    def acquire(self):
+        # Blocks until this worker and its account may take the next action
+        with self.account_lock:
+            now = time.time()
+            slot = max(
+                now,
+                self.next_slot,
+                self.account_state.get(f"{self.account}:next_slot", 0.0),
+                self.account_state.get(f"{self.account}:paused_until", 0.0),
+            )
+            self.account_state[f"{self.account}:next_slot"] = slot + self.account_interval
+        # Jitter the gap a little so workers do not fall into lockstep
+        self.next_slot = slot + self.interval * random.uniform(0.85, 1.15)
+        if slot > now:
+            time.sleep(slot - now)
+            self.seconds_waited += slot - now
+
+    def report(self, signal):
+        self.signals[signal] += 1
+        if signal == HEALTHY:
+            self.consecutive[TIMEOUT] = 0
+            self.consecutive[EMPTY] = 0
+            self.consecutive[CHALLENGE] = 0
+            self.consecutive[HEALTHY] += 1
+            if self.backoff and self.consecutive[HEALTHY] >= self.recovery_after:
+                self.consecutive[HEALTHY] = 0
+                self.backoff = self.backoff / self.factor if self.backoff / self.factor >= self.min_backoff else 0.0
+                log.info(f"Responses healthy, easing backoff to {self.backoff:.0f}s")
+            return
+
+        self.consecutive[HEALTHY] = 0
+        self.consecutive[signal] += 1
+        if signal == TIMEOUT and self.consecutive[TIMEOUT] < self.timeout_threshold:
+            return
+        self.backoff = min(self.max_backoff, max(self.min_backoff, self.backoff * self.factor))
+        log.warning(f"Backing off to one action per {self.backoff:.0f}s after {signal} "
+                    f"(x{self.consecutive[signal]} in a row)")
+        if signal == CHALLENGE:
+            self.pause_account(min(self.max_cooldown, self.challenge_cooldown * 2 ** (self.consecutive[CHALLENGE] - 1)))
+
+    def pause_account(self, seconds):
+        with self.account_lock:
+            key = f"{self.account}:paused_until"
+            self.account_state[key] = max(self.account_state.get(key, 0.0), time.time() + seconds)
+        log.warning(f"Pausing account {self.account} for {seconds / 60:.0f} minutes")
+
+    def retry(self, action, exceptions, attempts: int = 3, on_retry=None, name="action"):
+        # Calls action until it stops raising one of exceptions, sleeping an
+        # exponentially growing, jittered delay between attempts
+        for attempt in range(attempts):
+            try:
+                return action()
+            except exceptions as e:
+                if attempt == attempts - 1:
+                    log.error(f"{name} failed after {attempts} attempts: {e}")
+                    raise
+                delay = min(self.max_backoff, 0.5 * self.factor ** attempt) * random.uniform(0.75, 1.25)
+                log.warning(f"{name} failed, retrying in {delay:.1f}s (attempt {attempt + 1}): {e}")
+                time.sleep(delay)
+                self.seconds_waited += delay
+                if on_retry:
+                    on_retry()
+
+    def summary(self):
+        return {
+            "per_minute": round(self.per_minute(), 2) if self.per_minute() else None,
+            "backoff": self.backoff,
+            "seconds_waited": round(self.seconds_waited, 1),
+            "signals": dict(self.signals),
+        }
@@ -0,0 +1,430 @@
+import argparse
+import copy
+import gzip
+import hashlib
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+from selenium.common import exceptions as selenium_exceptions
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+log = logging.getLogger(__name__)
+
+ELEMENT = "__element__"
+SCRIPT = "__script__"
+
+# Bot settings stored in a recording so a replay makes the same decisions
+REPLAY_SETTINGS = ("resume_data", "job_filters", "resume_path", "base_url", "lean", "headless", "http_harvest")
+
+REDACTED = "[redacted]"
+
+# Session cookies are credentials, so neither what is read nor what is set is written
+COOKIE_COMMANDS = {
+    Command.GET_ALL_COOKIES, Command.GET_COOKIE, Command.ADD_COOKIE, Command.DELETE_COOKIE,
+    Command.DELETE_ALL_COOKIES,
+}
+
+
+def encode(value, scripts=None):
+    # JSON-safe copy of a command's params or result, with elements as ids
+    # and long scripts stored once by hash
+    if isinstance(value, WebElement):
+        return {ELEMENT: value.id}
+    if isinstance(value, dict):
+        return {key: encode(item, scripts) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [encode(item, scripts) for item in value]
+    if isinstance(value, str) and scripts is not None and len(value) > 200:
+        digest = hashlib.sha1(value.encode("utf-8")).hexdigest()[:12]
+        scripts.setdefault(digest, value)
+        return {SCRIPT: digest}
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+
+def decode(value, driver):
+    if isinstance(value, dict):
+        if ELEMENT in value:
+            return driver.create_web_element(value[ELEMENT])
+        return {key: decode(item, driver) for key, item in value.items()}
+    if isinstance(value, list):
+        return [decode(item, driver) for item in value]
+    return value
+
+
+class SessionRecorder:
+    """Writes the WebDriver commands of each application and their results,
+    plus DOM snapshots and application boundaries, to a gzipped JSON-lines
+    trace readable only by its owner.
+
+    Commands are captured by wrapping driver.execute, the single path every
+    Selenium call goes through. Only commands between application_start and
+    application_end are written, which is all a replay uses, so the login and
+    session restore never reach the file. Cookie commands and text typed into
+    password inputs are redacted. Scripts over 200 characters, such as the
+    snapshot scripts and Selenium's isDisplayed atom, are written once and
+    then referenced by hash."""
+
+    def __init__(self, path: str, settings=None) -> None:
+        self.path = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.raw = os.fdopen(os.open(path, os.O_CREAT | os.O_TRUNC | os.O_WRONLY, 0o600), "wb")
+        self.file = gzip.open(self.raw, "wt", encoding="utf-8")
+        self.in_application = False
+        self.scripts = {}
+        self.written_scripts = set()
+        self.sequence = 0
+        self.start = time.perf_counter()
+        self.execute = None
+        self.write({"type": "header", "version": 1, "created_at": time.time(), "settings": settings or {}})
+        log.info(f"Recording WebDriver session to {path}")
+
+    def write(self, entry):
+        for digest, source in self.scripts.items():
+            if digest not in self.written_scripts:
+                self.file.write(json.dumps({"type": "script", "id": digest, "source": source}) + "\n")
+                self.written_scripts.add(digest)
+        self.file.write(json.dumps(entry, default=str) + "\n")
+
+    def attach(self, driver):
+        execute = driver.execute
+        self.execute = execute
+
+        def recorded_execute(driver_command, params=None):
+            if not self.in_application:
+                return execute(driver_command, params)
+            redact = self.is_sensitive(driver_command, params)
+            entry = {
+                "type": "command",
+                "seq": self.sequence,
+                "t": round(time.perf_counter() - self.start, 4),
+                "command": driver_command,
+                "params": REDACTED if redact else encode(params, self.scripts),
+            }
+            self.sequence += 1
+            try:
+                response = execute(driver_command, params)
+            except selenium_exceptions.WebDriverException as e:
+                entry["error"] = {"class": type(e).__name__, "message": e.msg}
+                self.write(entry)
+                raise
+            value = response.get("value") if response else None
+            entry["value"] = REDACTED if redact and driver_command in COOKIE_COMMANDS else encode(value)
+            self.write(entry)
+            return response
+
+        driver.execute = recorded_execute
+        return driver
+
+    def is_sensitive(self, command, params):
+        if command in COOKIE_COMMANDS:
+            return True
+        if command == "executeCdpCommand":
+            return "Cookie" in (params or {}).get("cmd", "")
+        if command != Command.SEND_KEYS_TO_ELEMENT:
+            return False
+        # Asked through the unwrapped execute, so the check is not part of the command stream
+        try:
+            response = self.execute(Command.GET_ELEMENT_PROPERTY, {"id": params["id"], "name": "type"})
+        except (selenium_exceptions.WebDriverException, KeyError):
+            return False
+        return (response or {}).get("value") == "password"
+
+    def snapshot(self, driver, label, **fields):
+        # Read through the unwrapped execute so snapshots are not part of the command stream
+        try:
+            response = self.execute(Command.W3C_EXECUTE_SCRIPT, {
+                "script": "return [document.documentElement.outerHTML, location.href];", "args": [],
+            })
+            html, url = response["value"]
+        except selenium_exceptions.WebDriverException as e:
+            log.warning(f"Could not snapshot the DOM for '{label}': {e.msg}")
+            return
+        self.write({"type": "snapshot", "label": label, "url": url, "html": html, **fields})
+
+    def mark(self, event, **fields):
+        if event == "application_start":
+            self.in_application = True
+        self.write({"type": event, "seq": self.sequence, **fields})
+        self.file.flush()
+        if event == "application_end":
+            self.in_application = False
+
+    def close(self):
+        # The gzip stream does not own the file it writes to
+        self.file.close()
+        self.raw.close()
+
+
+def read_lines(f):
+    # A run that was killed leaves a trace without the gzip trailer; keep what was flushed
+    try:
+        for line in f:
+            if line.endswith("\n"):
+                yield line
+    except EOFError:
+        log.warning("Trace ends early, the recorded run did not finish")
+
+
+def load_trace(path):
+    header = None
+    scripts = {}
+    applications = []
+    current = None
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in read_lines(f):
+            entry = json.loads(line)
+            kind = entry["type"]
+            if kind == "header":
+                header = entry
+            elif kind == "script":
+                scripts[entry["id"]] = entry["source"]
+            elif kind == "application_start":
+                current = {"job": entry["job"], "answers": entry.get("answers", {}), "commands": [], "snapshots": []}
+                applications.append(current)
+            elif kind == "application_end" and current:
+                current["outcome"] = entry["outcome"]
+                current = None
+            elif kind == "command" and current:
+                current["commands"].append(entry)
+            elif kind == "snapshot" and current:
+                current["snapshots"].append(entry)
+    return {"header": header, "scripts": scripts, "applications": applications}
+
+
+class ReplayMismatch(Exception):
+    pass
+
+
+class ReplayWebDriver(RemoteWebDriver):
+    """WebDriver that answers commands from a recorded trace instead of a browser.
+
+    Call begin() with a recorded application before driving the bot; every
+    command is then answered with the next recorded result, including the
+    recorded exceptions. A different command name is a mismatch. When a wait
+    polls more or fewer times than during the recording, repeats of the
+    previous command are absorbed. Differences in params, such as other text
+    typed into a field, are collected as divergences."""
+
+    def __init__(self, trace: dict, options) -> None:
+        self.trace = trace
+        self.commands = []
+        self.position = 0
+        self.last = None
+        self.divergences = []
+        self.unrecorded = 0
+        self.served = Counter()
+        super().__init__(command_executor="http://replay.invalid", options=options)
+        # Like a local Chrome, file paths are sent as text rather than uploaded
+        self._is_remote = False
+
+    def start_session(self, capabilities: dict) -> None:
+        self.session_id = "replay"
+        self.caps = {"browserName": "replay"}
+
+    def begin(self, application):
+        self.commands = application["commands"]
+        self.position = 0
+        self.last = None
+        self.divergences = []
+
+    def remaining(self):
+        return len(self.commands) - self.position
+
+    def execute(self, driver_command, params=None):
+        if not self.commands:
+            # Outside an application, e.g. setup while the bot is built
+            self.unrecorded += 1
+            return {"value": None}
+
+        entry = self.next_entry(driver_command, params)
+        self.served[driver_command] += 1
+        if "error" in entry:
+            error = getattr(selenium_exceptions, entry["error"]["class"], selenium_exceptions.WebDriverException)
+            raise error(entry["error"]["message"])
+        return {"value": decode(entry.get("value"), self)}
+
+    def next_entry(self, command, params):
+        expected = self.commands[self.position] if self.position < len(self.commands) else None
+        if expected and expected["command"] == command:
+            self.position += 1
+            self.compare(expected, params)
+            self.last = expected
+            return expected
+        if self.last and self.last["command"] == command and self.same_params(self.last, params):
+            # The replay polled one more time than the recording
+            return self.last
+        if self.last:
+            # The replay polled fewer times: skip the rest of the recorded polls
+            position = self.position
+            while position < len(self.commands) and self.same_call(self.commands[position], self.last):
+                position += 1
+            if position < len(self.commands) and self.commands[position]["command"] == command:
+                self.position = position + 1
+                self.last = self.commands[position]
+                self.compare(self.last, params)
+                return self.last
+        raise ReplayMismatch(
+            f"Command {self.position}: bot sent {command}, recording has "
+            f"{expected['command'] if expected else 'no more commands'}"
+        )
+
+    def same_call(self, a, b):
+        return a["command"] == b["command"] and a["params"] == b["params"]
+
+    def same_params(self, entry, params):
+        return self.comparable(entry["params"]) == self.comparable(params)
+
+    def comparable(self, params):
+        # Long scripts are compared by hash, as they were recorded
+        return json.dumps(encode(decode_scripts(params, self.trace["scripts"]), {}), sort_keys=True)
+
+    def compare(self, entry, params):
+        if not self.same_params(entry, params):
+            self.divergences.append({"seq": entry["seq"], "command": entry["command"],
+                                     "recorded": entry["params"], "replayed": encode(params, {})})
+
+    def execute_cdp_cmd(self, cmd, cmd_args):
+        return self.execute("executeCdpCommand", {"cmd": cmd, "params": cmd_args})["value"]
+
+    def quit(self):
+        self.commands = []
+
+
+def decode_scripts(value, scripts):
+    if isinstance(value, dict):
+        if SCRIPT in value:
+            return scripts.get(value[SCRIPT], value[SCRIPT])
+        return {key: decode_scripts(item, scripts) for key, item in value.items()}
+    if isinstance(value, list):
+        return [decode_scripts(item, scripts) for item in value]
+    return value
+
+
+class VirtualClock:
+    """Stand-in for the time module whose sleep() only advances a counter,
+    so waits and pauses during a replay cost no wall time."""
+
+    def __init__(self) -> None:
+        self.offset = 0.0
+
+    def sleep(self, seconds):
+        self.offset += max(0.0, seconds)
+
+    def monotonic(self):
+        return time.monotonic() + self.offset
+
+    def time(self):
+        return time.time() + self.offset
+
+    def __getattr__(self, name):
+        return getattr(time, name)
+
+
+@contextmanager
+def virtual_time(*modules):
+    clock = VirtualClock()
+    originals = [(module, module.time) for module in modules]
+    for module in modules:
+        module.time = clock
+    try:
+        yield clock
+    finally:
+        for module, original in originals:
+            module.time = original
+
+
+def replay(path, stop_on_mismatch=False):
+    # Runs apply_to_job for every recorded application against the trace
+    from selenium.webdriver.support import wait as selenium_wait
+
+    import main
+    import pacing
+    import rate_limiter
+
+    trace = load_trace(path)
+    settings = trace["header"]["settings"]
+    workdir = tempfile.mkdtemp(prefix="linkedin-replay-")
+    bot = main.LinkedInLoginBot(
+        "replay@example.com", "not-a-password", settings.get("resume_data", {}), settings.get("job_filters", {}),
+        settings.get("resume_path", ""), jitter=(0.0, 0.0), base_url=settings.get("base_url", "https://www.linkedin.com"),
+        lean=settings.get("lean", False), session_dir=None, ledger_path=None, checkpoint_path=None,
+        answers_path=os.path.join(workdir, "answers.json"), trace_dir=None, resume_profile_dir=None, results_dir=None,
+        driver_factory=lambda options: ReplayWebDriver(trace, options),
+    )
+
+    results = []
+    start = time.perf_counter()
+    with virtual_time(selenium_wait, pacing, rate_limiter) as clock:
+        for application in trace["applications"]:
+            job = application["job"]
+            # The results page the job was opened from was already loaded when it was recorded
+            bot.harvester.loaded_url = job.get("page_url")
+            bot.answers.answers = copy.deepcopy(application["answers"])
+            bot.browser.begin(application)
+            bot.last_outcome = None
+            error = None
+            try:
+                bot.apply_to_job(job)
+            except ReplayMismatch as e:
+                error = str(e)
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+            result = {
+                "job_id": job["job_id"],
+                "recorded": application.get("outcome"),
+                "replayed": bot.last_outcome,
+                "commands": len(application["commands"]),
+                "unused_commands": bot.browser.remaining(),
+                "divergences": bot.browser.divergences,
+                "error": error,
+            }
+            result["ok"] = not error and not result["divergences"] and result["recorded"] == result["replayed"]
+            results.append(result)
+            if stop_on_mismatch and not result["ok"]:
+                break
+    return {
+        "applications": results,
+        "seconds": round(time.perf_counter() - start, 3),
+        "virtual_seconds_skipped": round(clock.offset, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded applications without a browser")
+    parser.add_argument("trace", help="Recording written with record_dir set (.jsonl.gz)")
+    parser.add_argument("--stop", action="store_true", help="Stop at the first application that does not match")
+    parser.add_argument("--verbose", action="store_true", help="Print param divergences")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, force=True)
+    result = replay(args.trace, stop_on_mismatch=args.stop)
+    failures = 0
+    for application in result["applications"]:
+        status = "ok" if application["ok"] else "MISMATCH"
+        failures += not application["ok"]
+        print(f"{application['job_id']:<14} {status:<9} recorded={application['recorded']} "
+              f"replayed={application['replayed']} commands={application['commands']} "
+              f"divergences={len(application['divergences'])}")
+        if application["error"]:
+            print(f"    {application['error']}")
+        if args.verbose:
+            for divergence in application["divergences"]:
+                print(f"    #{divergence['seq']} {divergence['command']}: {divergence['recorded']} -> {divergence['replayed']}")
+    print(f"Replayed {len(result['applications'])} applications in {result['seconds']}s "
+          f"({result['virtual_seconds_skipped']}s of waiting skipped)")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+import heapq
+import itertools
+import logging
+import math
+import re
+from collections import Counter
+
+log = logging.getLogger(__name__)
+
+TOKEN = re.compile(r"[a-z0-9][a-z0-9+#.]*[a-z0-9+#]|[a-z0-9]")
+
+STOP_WORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "is", "it", "of", "on", "or",
+    "our", "the", "to", "we", "with", "you", "your", "will", "this", "that", "job", "role", "team",
+}
+
+WORK_SETTINGS = ("remote", "hybrid", "on-site")
+
+# Share of the score contributed by each component
+WEIGHTS = {"title": 0.5, "skills": 0.35, "setting": 0.15}
+
+
+def tokenize(text):
+    return [token for token in TOKEN.findall((text or "").lower()) if token not in STOP_WORDS]
+
+
+def work_setting(text):
+    text = (text or "").lower().replace("onsite", "on-site")
+    return next((setting for setting in WORK_SETTINGS if setting in text), None)
+
+
+class RelevanceScorer:
+    """Scores harvested jobs against the candidate between 0 and 1.
+
+    The resume side is tokenized once: target titles (the search keywords,
+    the current job title and titles from the resume profile), skills and
+    the preferred work setting. Jobs are scored with IDF weights from the
+    corpus of the current search: the resume plus every job scored since
+    start_search(), so words every posting shares count for little and a
+    page is not judged by its own vocabulary alone. Pages are still
+    ranked one at a time as they are harvested, so the order is best first
+    within a page, not across the search:
+
+    - title: IDF-weighted share of the job title's tokens found in a target title
+    - skills: IDF-weighted share of the job text's tokens that are resume skills
+    - setting: 1 for the preferred work setting, 0.5 when unknown, 0 otherwise"""
+
+    def __init__(self, resume_data: dict, job_filters=None, profile=None, threshold: float = 0.2,
+                 weights=None) -> None:
+        self.threshold = threshold
+        self.weights = weights or WEIGHTS
+        titles = [resume_data.get("current job title")]
+        skills = [resume_data.get("skills")]
+        if profile:
+            titles += [entry["title"] for entry in profile.experience if entry["kind"] == "experience"]
+            skills += profile.skills
+        self.title_tokens = set(tokenize(" ".join(filter(None, titles))))
+        self.skill_tokens = set(tokenize(" ".join(filter(None, skills))))
+        self.setting = work_setting((job_filters or {}).get("work_type") or resume_data.get("preferred work setting"))
+        self.start_search()
+
+    def start_search(self):
+        # The resume is the first document, so its own terms are never weighted as unseen
+        self.frequencies = Counter(self.title_tokens | self.skill_tokens)
+        self.documents = 1
+
+    def job_tokens(self, job):
+        title = tokenize(job.get("title"))
+        return title, title + tokenize(job.get("description"))
+
+    def score_batch(self, jobs, search_title=None):
+        # [(score, job)] in input order; the batch joins the search corpus before IDF is taken
+        targets = self.title_tokens | set(tokenize(search_title))
+        tokenized = [self.job_tokens(job) for job in jobs]
+        self.frequencies.update(token for _, text in tokenized for token in set(text))
+        self.documents += len(jobs)
+        total = self.documents
+        idf = {token: math.log((1 + total) / (1 + self.frequencies[token])) + 1
+               for _, text in tokenized for token in text}
+
+        scored = []
+        for job, (title, text) in zip(jobs, tokenized):
+            title_weight = sum(idf[token] for token in title)
+            title_score = sum(idf[token] for token in title if token in targets) / title_weight if title_weight else 0.0
+            text_weight = sum(idf[token] for token in set(text))
+            matched = sum(idf[token] for token in set(text) if token in self.skill_tokens)
+            # A handful of matching skills already makes a posting relevant
+            skill_score = min(1.0, 3 * matched / text_weight) if text_weight else 0.0
+            setting = work_setting(job.get("location")) or work_setting(job.get("title"))
+            setting_score = 0.5 if not (self.setting and setting) else float(setting == self.setting)
+            score = (self.weights["title"] * title_score + self.weights["skills"] * skill_score
+                     + self.weights["setting"] * setting_score)
+            scored.append((round(score, 4), job))
+        return scored
+
+    def rank(self, jobs, search_title=None):
+        # Jobs at or above the threshold, best first, each tagged with its score
+        queue = JobQueue()
+        dropped = 0
+        for score, job in self.score_batch(jobs, search_title):
+            if score >= self.threshold:
+                queue.push(score, dict(job, relevance=score))
+            else:
+                dropped += 1
+        if dropped:
+            log.info(f"Dropped {dropped} of {len(jobs)} jobs below relevance {self.threshold}")
+        return queue.drain()
+
+
+class JobQueue:
+    """Max-priority queue of jobs; equal scores keep their harvest order."""
+
+    def __init__(self) -> None:
+        self.heap = []
+        self.counter = itertools.count()
+
+    def __len__(self):
+        return len(self.heap)
+
+    def push(self, score, job):
+        heapq.heappush(self.heap, (-score, next(self.counter), job))
+
+    def pop(self):
+        return heapq.heappop(self.heap)[2]
+
+    def drain(self):
+        return [self.pop() for _ in range(len(self.heap))]
@@ -0,0 +1,201 @@
+import argparse
+import csv
+import glob
+import io
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from collections import Counter, defaultdict
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+log = logging.getLogger(__name__)
+
+FIELDS = [
+    "timestamp", "date", "job_id", "title", "company", "location", "search", "outcome",
+    "form_steps", "answers_used", "answers", "relevance", "seconds",
+]
+
+INTEGER_FIELDS = {"form_steps", "answers_used"}
+FLOAT_FIELDS = {"timestamp", "relevance", "seconds"}
+
+
+class ResultsSink:
+    """Append-only log of application results, one file per day.
+
+    record() only puts the row on a queue; a background thread writes rows
+    in batches of batch_size, or every flush_interval seconds, to
+    <directory>/<date>.csv. In parquet format (needs pyarrow) each batch is
+    an immutable part file under <directory>/<date>/, so months of results
+    can be scanned a column at a time."""
+
+    def __init__(self, directory: str = "results", format: str = "csv", batch_size: int = 50,
+                 flush_interval: float = 5.0) -> None:
+        if format == "parquet" and pa is None:
+            raise RuntimeError("Parquet results need pyarrow: pip install pyarrow")
+        self.directory = directory
+        self.format = format
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue = queue.Queue()
+        self.written = 0
+        os.makedirs(directory, exist_ok=True)
+        self.thread = threading.Thread(target=self.run, name="results-sink", daemon=True)
+        self.thread.start()
+
+    def record(self, **fields):
+        now = time.time()
+        row = {field: fields.get(field) for field in FIELDS}
+        row["timestamp"] = now
+        row["date"] = time.strftime("%Y-%m-%d", time.localtime(now))
+        if isinstance(row["answers"], dict):
+            row["answers"] = json.dumps(row["answers"], ensure_ascii=False)
+        self.queue.put(row)
+
+    def run(self):
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            try:
+                row = self.queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                row = None
+            if row is not None and row is not StopIteration:
+                batch.append(row)
+            if batch and (row is StopIteration or len(batch) >= self.batch_size or time.monotonic() >= deadline):
+                self.flush(batch)
+                batch = []
+            if time.monotonic() >= deadline:
+                deadline = time.monotonic() + self.flush_interval
+            if row is StopIteration:
+                return
+
+    def flush(self, batch):
+        # Write errors are logged and the batch dropped here, so the writer thread keeps running
+        by_date = defaultdict(list)
+        for row in batch:
+            by_date[row["date"]].append(row)
+        try:
+            for date, rows in by_date.items():
+                if self.format == "parquet":
+                    self.write_parquet(date, rows)
+                else:
+                    self.write_csv(date, rows)
+            self.written += len(batch)
+        except Exception as e:
+            log.error(f"Could not write {len(batch)} results to {self.directory}: {e!r}")
+
+    def write_csv(self, date, rows):
+        path = os.path.join(self.directory, f"{date}.csv")
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=FIELDS)
+        try:
+            # Only the process that creates the day's file writes its header, in the
+            # same write as its first rows, so no other worker can append in between
+            f = os.fdopen(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY | os.O_APPEND), "a",
+                          newline="", encoding="utf-8")
+            writer.writeheader()
+        except FileExistsError:
+            f = open(path, "a", newline="", encoding="utf-8")
+        writer.writerows(rows)
+        # One append per batch, so workers sharing the directory never interleave rows
+        with f:
+            f.write(buffer.getvalue())
+
+    def write_parquet(self, date, rows):
+        day_dir = os.path.join(self.directory, date)
+        os.makedirs(day_dir, exist_ok=True)
+        columns = {field: [row[field] for row in rows] for field in FIELDS}
+        path = os.path.join(day_dir, f"part-{time.strftime('%H%M%S')}-{os.getpid()}-{self.written}.parquet")
+        pq.write_table(pa.table(columns), path)
+
+    def close(self):
+        self.queue.put(StopIteration)
+        self.thread.join()
+        log.info(f"Wrote {self.written} results to {self.directory}")
+
+
+def result_files(directory, since=None, until=None):
+    # Daily files and part directories, pruned by the date in their name
+    paths = []
+    for path in sorted(glob.glob(os.path.join(directory, "*"))):
+        date = os.path.basename(path).split(".")[0]
+        if len(date) != 10 or (since and date < since) or (until and date > until):
+            continue
+        if path.endswith(".csv"):
+            paths.append(path)
+        elif os.path.isdir(path):
+            paths.extend(sorted(glob.glob(os.path.join(path, "*.parquet"))))
+    return paths
+
+
+def read_results(directory, since=None, until=None, columns=None):
+    for path in result_files(directory, since, until):
+        if path.endswith(".parquet"):
+            if pa is None:
+                log.warning(f"Skipping {path}: reading Parquet needs pyarrow")
+                continue
+            yield from pq.read_table(path, columns=columns).to_pylist()
+            continue
+        with open(path, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                for field in INTEGER_FIELDS:
+                    row[field] = int(row[field]) if row.get(field) else None
+                for field in FLOAT_FIELDS:
+                    row[field] = float(row[field]) if row.get(field) else None
+                yield row
+
+
+def summarize(rows, by="outcome"):
+    groups = defaultdict(lambda: {"count": 0, "applied": 0, "seconds": 0.0, "form_steps": 0})
+    for row in rows:
+        group = groups[row.get(by) or "-"]
+        group["count"] += 1
+        group["applied"] += row["outcome"] == "applied"
+        group["seconds"] += row["seconds"] or 0.0
+        group["form_steps"] += row["form_steps"] or 0
+    return groups
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query the application results")
+    parser.add_argument("command", choices=["summary", "list"])
+    parser.add_argument("--dir", default="results")
+    parser.add_argument("--since", help="First date, YYYY-MM-DD")
+    parser.add_argument("--until", help="Last date, YYYY-MM-DD")
+    parser.add_argument("--by", default="outcome", choices=["outcome", "date", "search", "company"],
+                        help="Grouping for summary")
+    parser.add_argument("--outcome", help="Only list results with this outcome")
+    parser.add_argument("--limit", type=int, default=50)
+    args = parser.parse_args()
+
+    if args.command == "summary":
+        columns = sorted({"outcome", "seconds", "form_steps", args.by})
+        groups = summarize(read_results(args.dir, args.since, args.until, columns), args.by)
+        print(f"{args.by:<40} {'jobs':>6} {'applied':>8} {'avg s':>7} {'avg steps':>10}")
+        for key, group in sorted(groups.items(), key=lambda item: -item[1]["count"]):
+            count = group["count"]
+            print(f"{str(key)[:40]:<40} {count:>6} {group['applied']:>8} "
+                  f"{group['seconds'] / count:>7.1f} {group['form_steps'] / count:>10.1f}")
+        return
+
+    shown = Counter()
+    for row in read_results(args.dir, args.since, args.until):
+        if args.outcome and row["outcome"] != args.outcome:
+            continue
+        print(f"{row['date']} {row['job_id']:<12} {row['outcome']:<16} {row['form_steps'] or 0:>2} steps "
+              f"{row['seconds'] or 0:>6.1f}s  {row['title']} @ {row['company']} ({row['search']})")
+        shown["rows"] += 1
+        if shown["rows"] >= args.limit:
+            break
+
+
+if __name__ == "__main__":
+    main()
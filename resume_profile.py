@@ -0,0 +1,344 @@
+import argparse
+import hashlib
+import json
+import logging
+import os
+import re
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+
+from file_lock import file_lock
+from matcher import normalize_text
+
+log = logging.getLogger(__name__)
+
+# Bump when the parser or artifact layout changes so old artifacts are rebuilt
+PROFILE_VERSION = 1
+
+DEFAULT_PROFILE_DIR = ".profiles"
+
+SECTION_HEADERS = {
+    "summary": "summary",
+    "profile": "summary",
+    "objective": "summary",
+    "education": "education",
+    "experience": "experience",
+    "work experience": "experience",
+    "professional experience": "experience",
+    "projects": "projects",
+    "skills": "skills",
+    "technical skills": "skills",
+    "skills and competencies": "skills",
+    "certifications": "certifications",
+    "achievements": "achievements",
+}
+
+MONTH = r"(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?"
+DATE_RANGE = re.compile(
+    rf"\s*(?:{MONTH}\s*)?(?:\d{{4}}\s*)?[-–—]\s*(?:present|current|now|(?:{MONTH}\s*)?\d{{4}})\s*$",
+    re.IGNORECASE,
+)
+EMAIL = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+PHONE = re.compile(r"(?:\+(\d{1,3})[\s-]*)?(\(?\d[\d\s()-]{7,}\d)")
+URL = re.compile(r"https?://[^\s|,]+")
+BULLET = re.compile(r"^[•●▪■◦*-]\s*")
+# pypdf splits some capitals from the rest of the word ("F ramework", "A WS")
+SPLIT_CAPITAL = re.compile(r"\b([B-HJ-Z]) (?=[a-z]{2,})|\b([A-Z]) (?=[A-Z]{2,}\b)")
+
+DEGREES = [
+    (re.compile(r"\b(ph\.?\s?d|doctor)", re.IGNORECASE), "Doctorate"),
+    (re.compile(r"\b(master|m\.?\s?tech|m\.?\s?sc|mba|m\.?s\.)\b", re.IGNORECASE), "Master's"),
+    (re.compile(r"\b(bachelor|b\.?\s?tech|b\.?\s?sc|b\.?\s?e\.|b\.?a\.)", re.IGNORECASE), "Bachelor's"),
+]
+
+COUNTRY_CODES = {"1": "United States (+1)", "44": "United Kingdom (+44)", "91": "India (+91)"}
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def extract_text(pdf_path):
+    # Only compiling needs pypdf; loading a compiled artifact does not
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        raise RuntimeError("Compiling a resume profile needs pypdf: pip install pypdf")
+    reader = PdfReader(pdf_path)
+    return "\n".join(page.extract_text() or "" for page in reader.pages)
+
+
+def key_tokens(text):
+    return sorted(set(normalize_text(text).split()))
+
+
+def build_index(entries):
+    # token -> indices of the entries containing it
+    index = defaultdict(list)
+    for position, tokens in enumerate(entries):
+        for token in tokens:
+            index[token].append(position)
+    return dict(index)
+
+
+def split_sections(lines):
+    sections = {"header": []}
+    current = "header"
+    for line in lines:
+        # Headers are short lines such as "Experience" or "SKILLS and COMPETENCIES"
+        name = SECTION_HEADERS.get(re.sub(r"[^a-z ]", "", line.lower()).strip())
+        if name and len(line) < 40:
+            current = name
+            sections.setdefault(current, [])
+            continue
+        sections.setdefault(current, []).append(line)
+    return sections
+
+
+def parse_contact(lines, fields):
+    if lines:
+        names = lines[0].split()
+        fields["first name"] = names[0]
+        if len(names) > 1:
+            fields["last name"] = " ".join(names[1:])
+    text = " ".join(lines[1:])
+
+    email = EMAIL.search(text)
+    if email:
+        fields["email"] = email.group(0)
+    for url in URL.findall(text):
+        url = url.rstrip(".;")
+        if "linkedin.com/in/" in url:
+            fields["linkedin profile"] = url
+        elif re.match(r"https?://(www\.)?github\.com/", url):
+            fields["github profile"] = url
+        else:
+            fields.setdefault("personal website", url)
+    phone = PHONE.search(URL.sub(" ", EMAIL.sub(" ", text)))
+    if phone:
+        fields["mobile phone number"] = re.sub(r"\D", "", phone.group(2))
+        if phone.group(1) in COUNTRY_CODES:
+            fields["phone country code"] = COUNTRY_CODES[phone.group(1)]
+
+
+def parse_education(lines, fields):
+    for line in lines:
+        for pattern, degree in DEGREES:
+            if pattern.search(line):
+                # Entries are listed newest first, so the first degree found is the highest
+                fields.setdefault("highest degree", degree)
+                subject = re.search(r"\bin\s+(.+)$", DATE_RANGE.sub("", line))
+                if subject:
+                    fields.setdefault("field of study", subject.group(1).strip())
+                break
+
+
+def parse_entries(lines, kind):
+    # Header line with a date range, an optional company line, then bullets
+    entries = []
+    for line in lines:
+        if BULLET.match(line):
+            if entries:
+                entries[-1]["bullets"].append(BULLET.sub("", line))
+            continue
+        dates = DATE_RANGE.search(line)
+        starts_entry = dates or (kind == "projects" and "|" in line)
+        if starts_entry or not entries:
+            header = DATE_RANGE.sub("", line).strip() if dates else line
+            title, _, stack = header.partition("|")
+            entries.append({
+                "kind": kind,
+                "title": title.strip(),
+                "company": None,
+                "stack": [item.strip() for item in re.split(r",|\band\b", stack) if item.strip()],
+                "dates": dates.group(0).strip() if dates else None,
+                "current": bool(dates and re.search(r"present|current|now", dates.group(0), re.IGNORECASE)),
+                "bullets": [],
+            })
+        elif entries[-1]["bullets"]:
+            # Wrapped bullet text
+            entries[-1]["bullets"][-1] += " " + line
+        elif kind == "experience" and entries[-1]["company"] is None:
+            entries[-1]["company"] = line
+    return entries
+
+
+def parse_skills(lines):
+    # "Category : a, b, c" lines, possibly wrapped onto the next line
+    groups = []
+    for line in lines:
+        category, sep, items = line.partition(":")
+        if sep:
+            groups.append([category.strip(), items])
+        elif groups:
+            groups[-1][1] += " " + line
+    skills = []
+    for category, items in groups:
+        if category.lower() == "soft skills":
+            continue
+        for item in items.split(","):
+            item = item.strip()
+            if item and item.lower() not in (skill.lower() for skill in skills):
+                skills.append(item)
+    return skills
+
+
+def parse_resume(text):
+    text = SPLIT_CAPITAL.sub(lambda m: m.group(1) or m.group(2), text)
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    sections = split_sections(lines)
+
+    fields = {}
+    parse_contact(sections.get("header", []), fields)
+    parse_education(sections.get("education", []), fields)
+    experience = parse_entries(sections.get("experience", []), "experience")
+    experience += parse_entries(sections.get("projects", []), "projects")
+    skills = parse_skills(sections.get("skills", []))
+
+    jobs = [entry for entry in experience if entry["kind"] == "experience"]
+    current = next((entry for entry in jobs if entry["current"]), jobs[0] if jobs else None)
+    if current:
+        fields["current job title"] = current["title"]
+        if current["company"]:
+            fields["current company"] = current["company"]
+    if skills:
+        fields["skills"] = ", ".join(skills[:12])
+    return fields, skills, experience
+
+
+def compile_profile(pdf_path, sha256=None):
+    start = time.perf_counter()
+    fields, skills, experience = parse_resume(extract_text(pdf_path))
+    skill_tokens = [key_tokens(skill) for skill in skills]
+    experience_tokens = [
+        key_tokens(" ".join([entry["title"], entry["company"] or ""] + entry["stack"] + entry["bullets"]))
+        for entry in experience
+    ]
+    artifact = {
+        "version": PROFILE_VERSION,
+        "source": os.path.abspath(pdf_path),
+        "sha256": sha256 or file_sha256(pdf_path),
+        "compiled_at": time.time(),
+        "fields": fields,
+        # Normalized label tokens for each field, as ResumeMatcher would build them
+        "key_tokens": {key: key_tokens(key) for key in fields},
+        "skills": skills,
+        "skill_tokens": skill_tokens,
+        "skill_index": build_index(skill_tokens),
+        "experience": experience,
+        "experience_tokens": experience_tokens,
+        "experience_index": build_index(experience_tokens),
+    }
+    log.info(f"Compiled resume profile from {pdf_path} in {time.perf_counter() - start:.2f}s: "
+             f"{len(fields)} fields, {len(skills)} skills, {len(experience)} experience entries")
+    return artifact
+
+
+class ResumeProfile:
+    """Fields, skills and experience parsed from the resume PDF.
+
+    Parsing runs once per resume version: the result is stored as a JSON
+    artifact named by the PDF's sha256 under profile_dir, and later runs
+    only hash the PDF and load the artifact with its precomputed tokens and
+    indexes."""
+
+    def __init__(self, artifact: dict) -> None:
+        self.artifact = artifact
+        self.fields = artifact["fields"]
+        self.key_tokens = artifact["key_tokens"]
+        self.skills = artifact["skills"]
+        self.skill_tokens = [set(tokens) for tokens in artifact["skill_tokens"]]
+        self.skill_index = artifact["skill_index"]
+        self.experience = artifact["experience"]
+        self.experience_index = artifact["experience_index"]
+
+    @classmethod
+    def artifact_path(cls, profile_dir, sha256):
+        return os.path.join(profile_dir, f"{sha256}.json")
+
+    @classmethod
+    def read(cls, path):
+        # The compiled profile at path, or None when it is missing, unreadable or outdated
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path) as f:
+                artifact = json.load(f)
+        except (OSError, ValueError) as e:
+            log.warning(f"Ignoring unreadable resume profile {path}: {e}")
+            return None
+        if artifact.get("version") != PROFILE_VERSION:
+            return None
+        log.info(f"Loaded resume profile {path}")
+        return cls(artifact)
+
+    @classmethod
+    def load(cls, pdf_path, profile_dir=DEFAULT_PROFILE_DIR, rebuild=False):
+        sha256 = file_sha256(pdf_path)
+        path = cls.artifact_path(profile_dir, sha256)
+        profile = None if rebuild else cls.read(path)
+        if profile:
+            return profile
+
+        os.makedirs(profile_dir, exist_ok=True)
+        # Workers and accounts share profile_dir: one compiles, the others wait and read its result
+        with file_lock(path):
+            profile = None if rebuild else cls.read(path)
+            if profile:
+                return profile
+            artifact = compile_profile(pdf_path, sha256)
+            fd, tmp_path = tempfile.mkstemp(dir=profile_dir, prefix=f"{sha256}.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(artifact, f, indent=2)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+        log.info(f"Saved resume profile {path}")
+        return cls(artifact)
+
+    def resume_data(self, overrides=None):
+        # Parsed fields with hand-entered values taking precedence
+        return {**self.fields, **(overrides or {})}
+
+    def matching_skills(self, text):
+        # Skills whose every token appears in text
+        tokens = set(normalize_text(text).split())
+        candidates = {index for token in tokens for index in self.skill_index.get(token, ())}
+        return [self.skills[index] for index in sorted(candidates) if self.skill_tokens[index] <= tokens]
+
+    def related_experience(self, text):
+        # Experience entries ranked by how many of the text's tokens they contain
+        tokens = set(normalize_text(text).split())
+        hits = Counter(index for token in tokens for index in self.experience_index.get(token, ()))
+        return [self.experience[index] for index, _ in hits.most_common()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile or inspect the resume profile artifact")
+    parser.add_argument("pdf", help="Resume PDF")
+    parser.add_argument("--profile-dir", default=DEFAULT_PROFILE_DIR)
+    parser.add_argument("--rebuild", action="store_true", help="Recompile even if an artifact exists")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, force=True)
+    try:
+        profile = ResumeProfile.load(args.pdf, args.profile_dir, rebuild=args.rebuild)
+    except RuntimeError as e:
+        sys.exit(str(e))
+    for key, value in profile.fields.items():
+        print(f"{key:<22} {value}")
+    print(f"{'skills indexed':<22} {len(profile.skills)}")
+    for entry in profile.experience:
+        print(f"{entry['kind']:<22} {entry['title']} ({entry['company'] or ', '.join(entry['stack'])}) {entry['dates'] or ''}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+
+from selenium.common.exceptions import WebDriverException
+
+from file_lock import file_lock
+
+log = logging.getLogger(__name__)
+
+COOKIE_FIELDS = ("name", "value", "path", "domain", "secure", "httpOnly", "expiry", "sameSite")
+
+READ_LOCAL_STORAGE_SCRIPT = """
+const items = {};
+for (let i = 0; i < window.localStorage.length; i++) {
+    const key = window.localStorage.key(i);
+    items[key] = window.localStorage.getItem(key);
+}
+return items;
+"""
+
+WRITE_LOCAL_STORAGE_SCRIPT = """
+const items = arguments[0];
+for (const key in items) {
+    window.localStorage.setItem(key, items[key]);
+}
+"""
+
+
+class SessionStore:
+    """Saves a logged-in session (cookies and localStorage) per account so the
+    next run can skip the login form."""
+
+    def __init__(self, session_dir: str, username: str) -> None:
+        # Hash the username so email addresses do not end up in file names
+        name = hashlib.sha1(username.encode("utf-8")).hexdigest()[:16]
+        self.path = os.path.join(session_dir, f"{name}.json")
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def save(self, browser, origin):
+        try:
+            session = {
+                "origin": origin,
+                "saved_at": time.time(),
+                "cookies": browser.get_cookies(),
+                "local_storage": browser.execute_script(READ_LOCAL_STORAGE_SCRIPT),
+            }
+        except WebDriverException as e:
+            log.warning(f"Could not read session state: {e}")
+            return False
+
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        # Workers on the same account share the file. mkstemp gives each save its own
+        # temp file, created 0600, so the cookies are never readable by others.
+        try:
+            with file_lock(self.path):
+                fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(self.path), suffix=".tmp")
+                try:
+                    with os.fdopen(fd, "w") as f:
+                        json.dump(session, f)
+                    os.replace(tmp_path, self.path)
+                except BaseException:
+                    with contextlib.suppress(FileNotFoundError):
+                        os.remove(tmp_path)
+                    raise
+        except OSError as e:
+            log.warning(f"Could not save session to {self.path}: {e}")
+            return False
+        log.info(f"Saved session with {len(session['cookies'])} cookies to {self.path}")
+        return True
+
+    def load(self, browser, origin):
+        # Applies the saved state to the browser; the caller must already be
+        # on a page of the same origin for the cookies to be accepted.
+        if not self.exists():
+            return False
+        try:
+            with open(self.path) as f:
+                session = json.load(f)
+        except (OSError, ValueError) as e:
+            log.warning(f"Ignoring unreadable session file {self.path}: {e}")
+            return False
+        if session.get("origin") != origin:
+            log.info("Saved session belongs to a different site, ignoring it")
+            return False
+
+        now = time.time()
+        restored = 0
+        for cookie in session.get("cookies", []):
+            if cookie.get("expiry") and cookie["expiry"] < now:
+                continue
+            cookie = {key: cookie[key] for key in COOKIE_FIELDS if key in cookie}
+            if "expiry" in cookie:
+                cookie["expiry"] = int(cookie["expiry"])
+            try:
+                browser.add_cookie(cookie)
+                restored += 1
+            except WebDriverException as e:
+                log.debug(f"Skipping cookie {cookie.get('name')}: {e}")
+
+        try:
+            browser.execute_script(WRITE_LOCAL_STORAGE_SCRIPT, session.get("local_storage") or {})
+        except WebDriverException as e:
+            log.warning(f"Could not restore localStorage: {e}")
+
+        log.info(f"Restored {restored} cookies from {self.path}")
+        return restored > 0
+
+    def clear(self):
+        # Another worker may have removed it already
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self.path)
+            log.info(f"Removed expired session {self.path}")
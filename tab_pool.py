@@ -0,0 +1,78 @@
+import logging
+from collections import OrderedDict
+
+from selenium.common.exceptions import WebDriverException
+
+log = logging.getLogger(__name__)
+
+
+class TabPool:
+    """Keeps job detail pages loading in background tabs of one browser.
+
+    A prefetched tab is created, pointed at its URL without waiting for the
+    load, and left in the background, so Chrome fetches and renders it while
+    the foreground tab is busy with an Easy Apply modal. The search results
+    stay in the main tab. At most size job tabs are open at a time."""
+
+    def __init__(self, browser, size: int = 3, on_new_tab=None) -> None:
+        self.browser = browser
+        self.size = size
+        # Called with the new tab focused, e.g. to apply CDP settings
+        self.on_new_tab = on_new_tab
+        self.main_handle = browser.current_window_handle
+        self.tabs = OrderedDict()
+        self.prefetched = 0
+        self.hits = 0
+
+    def reset(self, browser):
+        # After a browser restart every tab is gone
+        self.browser = browser
+        self.main_handle = browser.current_window_handle
+        self.tabs.clear()
+
+    def open(self, job_id, url):
+        current = self.browser.current_window_handle
+        self.browser.switch_to.new_window("tab")
+        handle = self.browser.current_window_handle
+        if self.on_new_tab:
+            self.on_new_tab()
+        # Assigning location returns at once, unlike get(), which waits for the load
+        self.browser.execute_script("window.location.href = arguments[0];", url)
+        self.browser.switch_to.window(current)
+        self.tabs[job_id] = handle
+        return handle
+
+    def prefetch(self, jobs, url_for):
+        for job in jobs:
+            if len(self.tabs) >= self.size:
+                break
+            if job["job_id"] not in self.tabs:
+                self.open(job["job_id"], url_for(job))
+                self.prefetched += 1
+                log.info(f"Prefetching job {job['job_id']} in a background tab")
+
+    def activate(self, job_id, url):
+        # Focuses the job's tab, opening it now if it was not prefetched
+        if job_id in self.tabs:
+            self.hits += 1
+        else:
+            self.open(job_id, url)
+        self.browser.switch_to.window(self.tabs[job_id])
+
+    def release(self, job_id):
+        handle = self.tabs.pop(job_id, None)
+        if handle is None:
+            return
+        try:
+            self.browser.switch_to.window(handle)
+            self.browser.close()
+            self.browser.switch_to.window(self.main_handle)
+        except WebDriverException as e:
+            log.warning(f"Could not close tab for job {job_id}: {e.msg}")
+
+    def close_all(self):
+        for job_id in list(self.tabs):
+            self.release(job_id)
+
+    def summary(self):
+        return {"open": len(self.tabs), "prefetched": self.prefetched, "hits": self.hits}
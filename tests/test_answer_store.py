@@ -0,0 +1,29 @@
+from answer_store import MANUAL, AnswerStore
+
+
+def test_commit_keeps_answers_saved_by_another_worker(tmp_path):
+    path = str(tmp_path / "answers.json")
+    first = AnswerStore(path)
+    second = AnswerStore(path)
+
+    first.remember("Years of Python experience?", (), "5")
+    first.commit()
+    second.remember("Do you need sponsorship?", ["Yes", "No"], "No")
+    second.commit()
+
+    merged = AnswerStore(path)
+    assert merged.lookup("Years of Python experience?") == "5"
+    assert merged.lookup("Do you need sponsorship?", ["No", "Yes"]) == "No"
+
+
+def test_commit_never_overwrites_a_manual_answer_pinned_meanwhile(tmp_path):
+    path = str(tmp_path / "answers.json")
+    worker = AnswerStore(path)
+    AnswerStore(path).set("Desired salary?", "120000")
+
+    worker.remember("Desired salary?", (), "90000")
+    worker.commit()
+
+    entry = next(iter(AnswerStore(path).answers.values()))
+    assert entry["answer"] == "120000"
+    assert entry["source"] == MANUAL
@@ -0,0 +1,67 @@
+import pytest
+from selenium.common.exceptions import NoSuchElementException, WebDriverException
+from selenium.webdriver import ChromeOptions
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+
+import mock_board
+from cdp_driver import CDPWebDriver, chrome_binary, websockets
+from pacing import Pacer
+
+
+
+def chrome_available():
+    try:
+        chrome_binary()
+    except WebDriverException:
+        return False
+    return websockets is not None
+
+
+pytestmark = pytest.mark.skipif(not chrome_available(), reason="needs a local Chrome and websockets")
+
+
+@pytest.fixture
+def form_page():
+    server, base_url = mock_board.serve_in_thread()
+    yield f"{base_url}/cdp_form.html"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def driver():
+    options = ChromeOptions()
+    options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    driver = CDPWebDriver(options)
+    yield driver
+    driver.quit()
+
+
+def test_fills_and_submits_a_form(driver, form_page, tmp_path):
+    resume = tmp_path / "resume.pdf"
+    resume.write_bytes(b"%PDF-1.4\n")
+
+    driver.get(form_page)
+    assert driver.title == "CDP backend form"
+
+    name = driver.find_element(By.ID, "name")
+    name.send_keys("Alex")
+    name.send_keys(Keys.BACKSPACE, "x")
+    assert name.get_property("value") == "Alex"
+    driver.find_element(By.ID, "resume").send_keys(str(resume))
+    assert driver.execute_script("return arguments[0].files[0].name;", driver.find_element(By.ID, "resume")) == "resume.pdf"
+
+    with pytest.raises(NoSuchElementException):
+        driver.find_element(By.ID, "result")
+    driver.find_element(By.CSS_SELECTOR, "button#submit").click()
+    # wait_for_change wakes on the mutation instead of polling
+    assert driver.wait_for_change(5)
+    assert Pacer(driver, jitter=(0.0, 0.0)).element_present((By.ID, "result"), timeout=5)
+    assert driver.find_element(By.ID, "result").text == "Alex sent 1 file(s)"
+
+
+def test_wait_for_change_times_out_on_a_quiet_page(driver, form_page):
+    driver.get(form_page)
+    assert driver.wait_for_change(0.5) is False
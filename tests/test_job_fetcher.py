@@ -0,0 +1,126 @@
+import os
+import socket
+import threading
+import time
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+import mock_board
+from job_fetcher import JobFetcher, parse_job_detail, parse_search_page
+
+RECORDED_DIR = os.path.join(mock_board.FIXTURES_DIR, "recorded")
+SEARCH_URL = "/jobs/search/?keywords=Data%20Science&location=United%20States"
+
+
+def recorded(name, job_id=None):
+    with open(os.path.join(RECORDED_DIR, name)) as f:
+        html = f.read()
+    return html.replace("{{job_id}}", job_id) if job_id else html
+
+
+@pytest.fixture
+def board():
+    server, base_url = mock_board.serve_in_thread()
+    yield base_url
+    server.shutdown()
+    server.server_close()
+
+
+class SlowJobHandler(mock_board.MockBoardHandler):
+    # Detail pages of job IDs ending in 1 answer after the client gave up
+    def do_GET(self):
+        if self.path.startswith("/jobs/view/") and self.path.rstrip("/").endswith("1"):
+            time.sleep(1)
+        return super().do_GET()
+
+
+@pytest.fixture
+def slow_board():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SlowJobHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_parse_search_page():
+    cards = parse_search_page(recorded("guest_search.html"))
+    assert len(cards) == 10
+    assert cards[0] == {"job_id": "4100000000", "title": "Data Scientist", "company": "Company 0",
+                        "location": "United States"}
+    assert len({card["job_id"] for card in cards}) == 10
+
+
+def test_parse_job_detail_easy_apply():
+    detail = parse_job_detail(recorded("job_view.html", "4100000003"), "4100000003")
+    assert detail["job_id"] == "4100000003"
+    assert detail["title"] == "Data Scientist"
+    assert detail["location"] == "United States (Remote)"
+    assert "machine learning" in detail["description"]
+    assert detail["easy_apply"] is True
+    assert detail["applied"] is False
+
+
+def test_parse_job_detail_external_apply():
+    detail = parse_job_detail(recorded("job_view_external.html", "4100000005"), "4100000005")
+    assert detail["easy_apply"] is False
+    assert detail["description"] is None
+
+
+def test_parse_job_detail_without_apply_button_is_unknown():
+    html = recorded("job_view_external.html", "4100000005").replace("jobs-apply-button", "unknown-button")
+    assert parse_job_detail(html, "4100000005")["easy_apply"] is None
+
+
+def test_harvest_against_mock_board(board):
+    fetcher = JobFetcher(board, cookies={}, concurrency=4)
+    jobs = fetcher.harvest_sync(board + SEARCH_URL, max_pages=5)
+
+    # Two pages of 10 cards, then an empty page ends the search
+    assert len(jobs) == 20
+    assert [job["job_id"] for job in jobs] == [str(4100000000 + offset) for offset in range(20)]
+    assert [job["page"] for job in jobs] == [0] * 10 + [1] * 10
+    assert [job["index"] for job in jobs] == list(range(10)) * 2
+    assert all(job["fetched"] for job in jobs)
+    # The mock serves an external-apply page for every fifth job ID
+    assert [job["easy_apply"] for job in jobs] == [int(job["job_id"]) % 5 != 0 for job in jobs]
+    assert fetcher.cards == 20
+    assert fetcher.statuses[200] == 3 + 20
+
+
+def test_harvest_stops_at_max_pages(board):
+    fetcher = JobFetcher(board, cookies={})
+    jobs = fetcher.harvest_sync(board + SEARCH_URL, max_pages=1)
+    assert len(jobs) == 10
+    assert fetcher.statuses[200] == 1 + 10
+
+
+def test_harvest_skips_known_jobs(board):
+    fetcher = JobFetcher(board, cookies={})
+    jobs = fetcher.harvest_sync(board + SEARCH_URL, skip=lambda job_id: job_id.endswith("0"))
+    assert len(jobs) == 18
+    assert not {"4100000000", "4100000010"} & {job["job_id"] for job in jobs}
+    assert fetcher.cards == 20
+
+
+def test_harvest_keeps_other_jobs_when_a_detail_page_times_out(slow_board):
+    fetcher = JobFetcher(slow_board, cookies={}, timeout=0.3)
+    jobs = {job["job_id"]: job for job in fetcher.harvest_sync(slow_board + SEARCH_URL)}
+
+    assert len(jobs) == 20
+    assert jobs["4100000001"]["fetched"] is False
+    assert jobs["4100000011"]["fetched"] is False
+    assert sum(job["fetched"] for job in jobs.values()) == 18
+    assert fetcher.statuses["error"] == 2
+
+
+def test_harvest_against_dead_host_returns_nothing():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    base_url = f"http://127.0.0.1:{port}"
+
+    fetcher = JobFetcher(base_url, cookies={}, timeout=2)
+    assert fetcher.harvest_sync(base_url + SEARCH_URL) == []
+    assert fetcher.statuses["error"] == 1
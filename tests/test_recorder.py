@@ -0,0 +1,153 @@
+import gzip
+import os
+import stat
+
+import pytest
+from selenium.webdriver import ChromeOptions
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
+
+import mock_board
+from form_snapshot import FORM_SNAPSHOT_SCRIPT
+from main import LinkedInLoginBot
+from recorder import ReplayWebDriver, SessionRecorder, load_trace
+
+FORM_TRACE = os.path.join(os.path.dirname(mock_board.FIXTURES_DIR), "recordings", "easy_apply_form.jsonl.gz")
+
+RESUME_DATA = {
+    "first name": "Alex",
+    "email": "alex.doe@example.com",
+    "highest degree": "Bachelor's",
+    "willing to relocate": "Yes",
+    "about me": "Data scientist who likes well-measured benchmarks.",
+}
+
+
+class FormPageDriver(RemoteWebDriver):
+    """Answers like a browser showing one Easy Apply step: a text and an
+    email input, a select, a textarea and a Yes/No radio group."""
+
+    def __init__(self, options) -> None:
+        self.sent = []
+        super().__init__(command_executor="http://form.invalid", options=options)
+        self._is_remote = False
+
+    def start_session(self, capabilities: dict) -> None:
+        self.session_id = "form"
+        self.caps = {"browserName": "form"}
+
+    def control(self, element_id, type_, label, **fields):
+        return {"element": self.create_web_element(element_id), "tag": fields.pop("tag", "input"), "type": type_,
+                "id": element_id, "name": element_id, "role": "", "aria_autocomplete": "", "aria_label": "",
+                "required": True, "label": label, "value": "", "checked": False, "options": [],
+                "selected_index": -1, **fields}
+
+    def snapshot(self):
+        return {
+            "inputs": [self.control("first-name", "text", "First name"),
+                       self.control("email", "email", "Email address")],
+            "selects": [self.control("degree", "select-one", "Highest degree", tag="select",
+                                     options=["Select an option", "High school", "Bachelor's", "Master's"],
+                                     selected_index=0)],
+            "textareas": [self.control("about", "textarea", "About me", tag="textarea")],
+            "fieldsets": [{"element": self.create_web_element("relocate"), "legend": "Willing to relocate?",
+                           "radios": [self.control("relocate-yes", "radio", "Yes"),
+                                      self.control("relocate-no", "radio", "No")]}],
+        }
+
+    def execute(self, driver_command, params=None):
+        params = params or {}
+        if driver_command == Command.W3C_EXECUTE_SCRIPT:
+            if params["script"] == FORM_SNAPSHOT_SCRIPT:
+                return {"value": self.snapshot()}
+            # Selenium's isDisplayed atom, clicks and option selection
+            return {"value": "isDisplayed" in params["script"] or None}
+        if driver_command == Command.IS_ELEMENT_ENABLED:
+            return {"value": True}
+        if driver_command == Command.GET_ELEMENT_PROPERTY:
+            return {"value": "password" if params["id"] == "password" else "text"}
+        if driver_command == Command.GET_ALL_COOKIES:
+            return {"value": [{"name": "li_at", "value": "session-secret"}]}
+        if driver_command == Command.SEND_KEYS_TO_ELEMENT:
+            self.sent.append((params["id"], params["text"]))
+        return {"value": None}
+
+
+def build_bot(tmp_path, driver_factory, resume_data=RESUME_DATA):
+    return LinkedInLoginBot(
+        "alex@example.com", "not-a-password", resume_data, {}, "", jitter=(0.0, 0.0), session_dir=None,
+        ledger_path=None, checkpoint_path=None, answers_path=str(tmp_path / "answers.json"), trace_dir=None,
+        resume_profile_dir=None, results_dir=None, driver_factory=driver_factory,
+    )
+
+
+def record_form(path, tmp_path):
+    # How FORM_TRACE was made; rerun it when form handling changes on purpose
+    bot = build_bot(tmp_path, FormPageDriver)
+    bot.recorder = SessionRecorder(path, {"resume_data": RESUME_DATA})
+    bot.recorder.attach(bot.browser)
+    bot.recorder.mark("application_start", job={"job_id": "4100000000"}, answers={})
+    bot.parse_and_fill_form(bot.browser.create_web_element("form"))
+    bot.recorder.mark("application_end", job_id="4100000000", outcome="applied")
+    bot.recorder.close()
+    return bot
+
+
+def replay_form(tmp_path, resume_data=RESUME_DATA):
+    trace = load_trace(FORM_TRACE)
+    bot = build_bot(tmp_path, lambda options: ReplayWebDriver(trace, options), resume_data)
+    bot.browser.begin(trace["applications"][0])
+    bot.parse_and_fill_form(bot.browser.create_web_element("form"))
+    return bot.browser
+
+
+def test_recorded_form_replays_without_divergences(tmp_path):
+    browser = replay_form(tmp_path)
+    assert browser.divergences == []
+    assert browser.remaining() == 0
+
+
+def test_replay_reports_a_changed_answer(tmp_path):
+    browser = replay_form(tmp_path, dict(RESUME_DATA, **{"first name": "Sam"}))
+    assert [divergence["command"] for divergence in browser.divergences] == [Command.SEND_KEYS_TO_ELEMENT]
+    assert browser.divergences[0]["replayed"]["text"] == "Sam"
+
+
+def test_fresh_recording_matches_the_checked_in_trace(tmp_path):
+    path = str(tmp_path / "form.jsonl.gz")
+    record_form(path, tmp_path)
+    commands = lambda trace: [entry["command"] for entry in trace["applications"][0]["commands"]]
+    assert commands(load_trace(path)) == commands(load_trace(FORM_TRACE))
+
+
+def test_recording_leaves_out_credentials(tmp_path):
+    path = str(tmp_path / "session.jsonl.gz")
+    driver = FormPageDriver(ChromeOptions())
+    recorder = SessionRecorder(path)
+    recorder.attach(driver)
+
+    # Outside an application, like the login
+    driver.create_web_element("username").send_keys("alex@example.com")
+    driver.add_cookie({"name": "li_at", "value": "restored-secret"})
+    recorder.mark("application_start", job={"job_id": "4100000000"}, answers={})
+    driver.create_web_element("password").send_keys("hunter2")
+    driver.get_cookies()
+    driver.create_web_element("first-name").send_keys("Alex")
+    recorder.mark("application_end", job_id="4100000000", outcome="applied")
+    recorder.close()
+
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        content = f.read()
+    for secret in ("alex@example.com", "restored-secret", "hunter2", "session-secret"):
+        assert secret not in content
+    assert "Alex" in content
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+    assert [entry["command"] for entry in load_trace(path)["applications"][0]["commands"]] == [
+        Command.SEND_KEYS_TO_ELEMENT, Command.GET_ALL_COOKIES, Command.SEND_KEYS_TO_ELEMENT,
+    ]
+
+
+def test_recording_refuses_a_tab_pool(tmp_path):
+    with pytest.raises(ValueError):
+        LinkedInLoginBot("alex@example.com", "not-a-password", RESUME_DATA, {}, "", session_dir=None,
+                         prefetch_tabs=2, record_dir=str(tmp_path))
@@ -0,0 +1,81 @@
+import os
+from collections import Counter
+
+from worker_pool import WorkerPoolScheduler
+
+
+class FakeBrowser:
+    def quit(self):
+        pass
+
+
+class FakeRateLimiter:
+    def summary(self):
+        return {}
+
+
+class FakeTracer:
+    def close(self):
+        pass
+
+
+class FakeBot:
+    """Stands in for LinkedInLoginBot in a worker: each search "applies" to
+    two jobs, one of them shared by every search."""
+
+    def __init__(self, marker_dir, fail_init=False, flaky=(), claim_job=None, **kwargs) -> None:
+        if fail_init:
+            raise RuntimeError("Chrome did not start")
+        self.marker_dir = marker_dir
+        self.flaky = flaky
+        self.claim_job = claim_job
+        self.outcomes = Counter()
+        self.browser = FakeBrowser()
+        self.rate_limiter = FakeRateLimiter()
+        self.tracer = FakeTracer()
+        self.results = None
+
+    def start_linkedin(self):
+        pass
+
+    def run_batch(self, searches, login=True):
+        for job_title, location in searches:
+            # Flaky searches fail on their first attempt only; the marker is shared across workers
+            marker = os.path.join(self.marker_dir, job_title)
+            if job_title in self.flaky and not os.path.exists(marker):
+                open(marker, "w").close()
+                raise RuntimeError(f"Chrome crashed during {job_title}")
+            for job_id in (f"{job_title}-1", "shared-job"):
+                self.outcomes["applied" if self.claim_job(job_id) else "duplicate"] += 1
+
+
+def run_pool(tmp_path, searches, **bot_kwargs):
+    scheduler = WorkerPoolScheduler(dict(bot_kwargs, marker_dir=str(tmp_path)), workers=2,
+                                    profile_root=str(tmp_path / "profiles"), max_per_minute=600,
+                                    bot_factory=FakeBot)
+    return scheduler.run(searches)
+
+
+def test_every_search_runs_once_and_jobs_are_claimed_once(tmp_path):
+    result = run_pool(tmp_path, [["Data Science", "United States"], ["ML Engineer", "Remote"], ["Analyst", "Berlin"]])
+
+    assert sorted(search["job_title"] for search in result["searches"]) == ["Analyst", "Data Science", "ML Engineer"]
+    assert result["failed"] == []
+    assert result["totals"] == {"applied": 4, "duplicate": 2}
+    assert result["claimed"] == 4
+
+
+def test_failed_search_is_handed_to_another_worker(tmp_path):
+    result = run_pool(tmp_path, [["Data Science", "United States"], ["ML Engineer", "Remote"]], flaky=["ML Engineer"])
+
+    retried = next(search for search in result["searches"] if search["job_title"] == "ML Engineer")
+    assert retried["attempt"] == 2
+    assert len(result["searches"]) == 2
+    assert result["failed"] == []
+
+
+def test_bot_that_cannot_start_does_not_hang_the_pool(tmp_path):
+    result = run_pool(tmp_path, [["Data Science", "United States"]], fail_init=True)
+
+    assert result["searches"] == []
+    assert result["totals"] == {}
@@ -0,0 +1,192 @@
+import argparse
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+
+log = logging.getLogger(__name__)
+
+STAGE = "stage"
+WAIT = "wait"
+SLEEP = "sleep"
+WEBDRIVER = "webdriver"
+
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def traced(name):
+    # Wraps a LinkedInLoginBot method in a tracer span
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            with self.tracer.span(name):
+                return func(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class Tracer:
+    """Records spans for pipeline stages, waits and WebDriver commands.
+
+    Spans are appended to a JSON lines file when a path is given and are
+    always aggregated in memory for the end-of-run summary."""
+
+    def __init__(self, path=None) -> None:
+        self.path = path
+        self.file = None
+        if path:
+            if os.path.dirname(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+            self.file = open(path, "a", buffering=64 * 1024)
+        self.started = time.time()
+        self.durations = defaultdict(list)
+        self.kinds = {}
+        self.counters = Counter()
+        self.local = threading.local()
+        self.lock = threading.Lock()
+
+    def _stack(self):
+        if not hasattr(self.local, "stack"):
+            self.local.stack = []
+        return self.local.stack
+
+    def record(self, name, seconds, kind=STAGE, **attrs):
+        stack = self._stack()
+        entry = {"ts": round(time.time(), 3), "name": name, "kind": kind, "seconds": round(seconds, 6)}
+        if stack:
+            entry["parent"] = stack[-1]
+        entry.update(attrs)
+        with self.lock:
+            self.durations[name].append(seconds)
+            self.kinds[name] = kind
+            if self.file:
+                self.file.write(json.dumps(entry) + "\n")
+
+    @contextmanager
+    def span(self, name, kind=STAGE, **attrs):
+        stack = self._stack()
+        stack.append(name)
+        start = time.perf_counter()
+        error = None
+        try:
+            yield
+        except Exception as e:
+            error = type(e).__name__
+            if error == "TimeoutException":
+                self.count_timeout(e)
+            raise
+        finally:
+            stack.pop()
+            if error:
+                attrs["error"] = error
+            self.record(name, time.perf_counter() - start, kind, **attrs)
+
+    def count(self, name, amount=1):
+        with self.lock:
+            self.counters[name] += amount
+
+    def count_timeout(self, error):
+        # Once per exception, in the innermost span or wait, however many spans it passes through
+        if not getattr(error, "_timeout_counted", False):
+            error._timeout_counted = True
+            self.count("timeouts")
+
+    def instrument_driver(self, driver):
+        # Every WebDriver command, including WebElement calls, goes through driver.execute
+        execute = driver.execute
+
+        def traced_execute(driver_command, params=None):
+            start = time.perf_counter()
+            try:
+                return execute(driver_command, params)
+            finally:
+                self.record(f"webdriver.{driver_command}", time.perf_counter() - start, WEBDRIVER)
+                self.count("webdriver_calls")
+
+        driver.execute = traced_execute
+        return driver
+
+    def summary(self):
+        elapsed = time.time() - self.started
+        stages = {}
+        seconds_by_kind = Counter()
+        for name, durations in self.durations.items():
+            kind = self.kinds[name]
+            seconds_by_kind[kind] += sum(durations)
+            stages[name] = {
+                "kind": kind,
+                "count": len(durations),
+                "total": round(sum(durations), 3),
+                "p50": round(percentile(durations, 0.5), 3),
+                "p95": round(percentile(durations, 0.95), 3),
+            }
+        applications = self.counters.get("applications", 0)
+        return {
+            "elapsed": round(elapsed, 3),
+            "applications": applications,
+            "applications_per_hour": round(applications * 3600 / elapsed, 2) if elapsed else 0.0,
+            "seconds_sleeping": round(seconds_by_kind[SLEEP], 3),
+            "seconds_waiting": round(seconds_by_kind[WAIT], 3),
+            "seconds_in_webdriver": round(seconds_by_kind[WEBDRIVER], 3),
+            "counters": dict(self.counters),
+            "stages": stages,
+        }
+
+    def log_summary(self):
+        summary = self.summary()
+        log.info(
+            f"Run summary: {summary['applications']} applications in {summary['elapsed']:.1f}s "
+            f"({summary['applications_per_hour']}/h), {summary['seconds_sleeping']:.1f}s sleeping, "
+            f"{summary['seconds_waiting']:.1f}s waiting on conditions, "
+            f"{summary['seconds_in_webdriver']:.1f}s in WebDriver, counters {summary['counters']}"
+        )
+        for name, stage in sorted(summary["stages"].items(), key=lambda item: -item[1]["total"]):
+            if stage["kind"] == WEBDRIVER:
+                continue
+            log.info(f"  {name:<32} n={stage['count']:<5} p50={stage['p50']:.3f}s p95={stage['p95']:.3f}s total={stage['total']:.1f}s")
+        if self.file:
+            with self.lock:
+                self.file.write(json.dumps({"ts": round(time.time(), 3), "kind": "summary", **summary}) + "\n")
+                self.file.flush()
+        return summary
+
+    def close(self):
+        if self.file:
+            self.file.close()
+            self.file = None
+
+
+def summarize_file(path):
+    # Rebuilds the summary of a finished run from its JSON lines trace
+    tracer = Tracer()
+    first = last = None
+    with open(path) as f:
+        for line in f:
+            entry = json.loads(line)
+            if entry["kind"] == "summary":
+                tracer.counters.update(entry.get("counters", {}))
+                continue
+            first = entry["ts"] - entry["seconds"] if first is None else min(first, entry["ts"] - entry["seconds"])
+            last = entry["ts"] if last is None else max(last, entry["ts"])
+            tracer.durations[entry["name"]].append(entry["seconds"])
+            tracer.kinds[entry["name"]] = entry["kind"]
+    if first is not None:
+        tracer.started = time.time() - (last - first)
+    return tracer.summary()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Summarize a bot trace file")
+    parser.add_argument("trace", help="JSON lines file written by a traced run")
+    args = parser.parse_args()
+    print(json.dumps(summarize_file(args.trace), indent=2))
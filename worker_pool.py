@@ -0,0 +1,213 @@
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import queue
+import tempfile
+import time
+from collections import Counter
+
+from rate_limiter import AdaptiveRateLimiter
+
+log = logging.getLogger(__name__)
+
+
+def _default_bot(**kwargs):
+    # Imported here so the parent process never needs a browser
+    from main import LinkedInLoginBot
+    return LinkedInLoginBot(**kwargs)
+
+
+def _run_worker(worker_id, bot_factory, bot_kwargs, search_queue, result_queue, claimed, claim_lock, account_state,
+                account_lock, profile_root, max_per_minute, account_per_minute):
+    logging.basicConfig(level=logging.INFO, format=f"[worker-{worker_id}] %(levelname)s %(name)s: %(message)s", force=True)
+    profile_dir = os.path.join(profile_root, f"worker-{worker_id}")
+    os.makedirs(profile_dir, exist_ok=True)
+
+    def claim_job(job_id):
+        with claim_lock:
+            if job_id in claimed:
+                return False
+            claimed[job_id] = worker_id
+            return True
+
+    bot = None
+    search, attempt = None, 0
+    try:
+        # Built inside the try, so a bot that cannot start still reports the worker as done
+        bot = (bot_factory or _default_bot)(
+            **bot_kwargs,
+            profile_dir=profile_dir,
+            checkpoint_path=os.path.join(profile_dir, "checkpoint.json"),
+            claim_job=claim_job,
+            rate_limiter=AdaptiveRateLimiter(
+                max_per_minute, account=bot_kwargs.get("username"), account_per_minute=account_per_minute,
+                account_state=account_state, account_lock=account_lock,
+            ),
+        )
+        bot.start_linkedin()
+        while True:
+            item = search_queue.get()
+            if item is None:
+                break
+            search, attempt = item
+            job_title, location = search
+            start = time.monotonic()
+            before = Counter(bot.outcomes)
+            # Restarts Chrome and resumes from the worker's checkpoint if the browser dies mid-search
+            bot.run_batch([search], login=False)
+            result_queue.put({
+                "worker": worker_id,
+                "job_title": job_title,
+                "location": location,
+                "attempt": attempt,
+                "seconds": time.monotonic() - start,
+                "outcomes": dict(bot.outcomes - before),
+                "rate_limiter": bot.rate_limiter.summary(),
+            })
+            search = None
+    except Exception as e:
+        log.error(f"Worker {worker_id} stopped: {e}")
+        if search is not None:
+            # The scheduler hands the search to another worker
+            result_queue.put({"worker": worker_id, "job_title": search[0], "location": search[1],
+                              "attempt": attempt, "failed": True, "error": str(e)})
+    finally:
+        if bot:
+            bot.browser.quit()
+            if bot.results:
+                bot.results.close()
+            bot.tracer.close()
+        result_queue.put({"worker": worker_id, "done": True})
+
+
+class WorkerPoolScheduler:
+    """Runs (job_title, location) searches across several browser processes.
+
+    Every worker owns a Chrome profile directory under profile_root, pulls
+    searches from a shared queue and claims job IDs in a shared dict so the
+    same posting is never handled by two workers. Each worker paces its page
+    loads with an AdaptiveRateLimiter at max_per_minute; account_per_minute
+    caps the page loads of the account as a whole, and a challenge seen by
+    one worker pauses all of them.
+
+    A worker whose search fails stops, and the search goes back on the queue
+    for another worker, up to max_attempts in all. bot_factory builds each
+    worker's bot from LinkedInLoginBot arguments; it must be picklable, and
+    defaults to LinkedInLoginBot itself."""
+
+    def __init__(self, bot_kwargs: dict, workers: int = 4, max_workers: int = 8, profile_root=None,
+                 max_per_minute: float = 6, account_per_minute=None, max_attempts: int = 2,
+                 bot_factory=None) -> None:
+        self.bot_kwargs = bot_kwargs
+        self.bot_factory = bot_factory
+        self.max_attempts = max_attempts
+        self.workers = max(1, min(workers, max_workers))
+        self.profile_root = profile_root or tempfile.mkdtemp(prefix="linkedin-workers-")
+        self.max_per_minute = max_per_minute
+        self.account_per_minute = account_per_minute
+        # Spawn so each worker starts with a clean interpreter and its own driver
+        self.context = multiprocessing.get_context("spawn")
+
+    def run(self, searches):
+        searches = list(searches)
+        workers = min(self.workers, len(searches)) or 1
+        manager = self.context.Manager()
+        claimed = manager.dict()
+        claim_lock = manager.Lock()
+        account_state = manager.dict()
+        account_lock = manager.Lock()
+        search_queue = self.context.Queue()
+        result_queue = self.context.Queue()
+
+        for search in searches:
+            search_queue.put((tuple(search), 1))
+
+        log.info(f"Starting {workers} workers for {len(searches)} searches (profiles in {self.profile_root})")
+        start = time.monotonic()
+        processes = [
+            self.context.Process(
+                target=_run_worker,
+                args=(worker_id, self.bot_factory, self.bot_kwargs, search_queue, result_queue, claimed, claim_lock, account_state,
+                      account_lock, self.profile_root, self.max_per_minute, self.account_per_minute),
+                daemon=True,
+            )
+            for worker_id in range(workers)
+        ]
+        for process in processes:
+            process.start()
+
+        results = []
+        failed = []
+        # Searches not yet finished or given up on; workers are only told to stop once it reaches 0,
+        # so a re-queued search always finds a worker
+        pending = len(searches)
+        if not pending:
+            for _ in range(workers):
+                search_queue.put(None)
+        finished = 0
+        while finished < workers:
+            try:
+                result = result_queue.get(timeout=5)
+            except queue.Empty:
+                if not any(process.is_alive() for process in processes):
+                    log.error("All workers exited without reporting completion")
+                    break
+                continue
+            if result.get("done"):
+                finished += 1
+                continue
+            search = (result["job_title"], result["location"])
+            if not result.get("failed"):
+                log.info(f"Worker {result['worker']} finished '{search[0]}' in {search[1]}: {result['outcomes']}")
+                results.append(result)
+                pending -= 1
+            elif result["attempt"] < self.max_attempts:
+                log.warning(f"Re-queueing '{search[0]}' in {search[1]} after worker {result['worker']} failed: "
+                            f"{result['error']}")
+                search_queue.put((search, result["attempt"] + 1))
+            else:
+                log.error(f"Giving up on '{search[0]}' in {search[1]} after {result['attempt']} attempts: {result['error']}")
+                failed.append(result)
+                pending -= 1
+            if pending == 0:
+                for _ in range(workers):
+                    search_queue.put(None)
+        if pending:
+            log.error(f"{pending} searches were not run: every worker stopped first")
+
+        for process in processes:
+            process.join()
+
+        elapsed = time.monotonic() - start
+        totals = Counter()
+        for result in results:
+            totals.update(result["outcomes"])
+        log.info(f"Completed {len(results)}/{len(searches)} searches in {elapsed:.1f}s with {workers} workers: {dict(totals)}")
+        unique_claims = len(claimed)
+        log.info(f"Unique jobs claimed: {unique_claims}")
+        manager.shutdown()
+        return {"elapsed": elapsed, "workers": workers, "searches": results, "failed": failed, "totals": dict(totals),
+                "claimed": unique_claims}
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Run LinkedIn searches across a pool of browser workers")
+    parser.add_argument("config", help="JSON file with 'bot' (LinkedInLoginBot arguments) and 'searches' ([job_title, location] pairs)")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--max-workers", type=int, default=8)
+    parser.add_argument("--max-per-minute", type=float, default=6, help="Page loads (search pages and job pages) per minute per worker")
+    parser.add_argument("--account-per-minute", type=float, default=None,
+                        help="Page loads per minute across all workers")
+    parser.add_argument("--profile-root", default=None)
+    args = parser.parse_args()
+
+    with open(args.config) as f:
+        config = json.load(f)
+
+    scheduler = WorkerPoolScheduler(config["bot"], workers=args.workers, max_workers=args.max_workers,
+                                    profile_root=args.profile_root, max_per_minute=args.max_per_minute,
+                                    account_per_minute=args.account_per_minute)
+    scheduler.run(config["searches"])